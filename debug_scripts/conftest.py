@@ -0,0 +1,39 @@
+"""
+Shared pytest fixtures for the debug scripts.
+
+The scripts import ``easy_track`` directly and expect the package to be
+installed in editable mode (``make install-dev`` runs ``pip install -e``).
+For pytest runs without an install, ``src`` is put on the path once here
+rather than in every script.
+"""
+
+import asyncio
+import importlib
+import sys
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+
+src_path = str(Path(__file__).parent.parent / "src")
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
+    importlib.invalidate_caches()
+
+
+@pytest.fixture(scope="session")
+def event_loop():
+    """Share one event loop so session-scoped async fixtures can be used."""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def db():
+    """Create the database schema once for the whole test session."""
+    from easy_track.database import close_db, init_db
+
+    await init_db()
+    yield
+    await close_db()
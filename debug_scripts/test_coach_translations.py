@@ -53,16 +53,12 @@ async def test_coach_translations():
 
     print("🔘 Testing button translations:")
     all_passed = True
-    for key, expected_uk in button_keys:
-        try:
-            actual = translator.get(key, user_lang)
-            if actual == expected_uk:
-                print(f"  ✅ {key}: '{actual}'")
-            else:
-                print(f"  ❌ {key}: expected '{expected_uk}', got '{actual}'")
-                all_passed = False
-        except Exception as e:
-            print(f"  ❌ {key}: ERROR - {e}")
+    actuals = translator.get_many([key for key, _ in button_keys], user_lang)
+    for (key, expected_uk), actual in zip(button_keys, actuals):
+        if actual == expected_uk:
+            print(f"  ✅ {key}: '{actual}'")
+        else:
+            print(f"  ❌ {key}: expected '{expected_uk}', got '{actual}'")
             all_passed = False
 
     # Test parameterized translations
@@ -92,18 +88,14 @@ async def test_coach_translations():
     ]
 
     print("\n🔘 Testing message translations:")
-    for key, expected_uk in message_keys:
-        try:
-            actual = translator.get(key, user_lang)
-            if actual.strip() == expected_uk.strip():
-                print(f"  ✅ {key}")
-            else:
-                print(f"  ❌ {key}:")
-                print(f"      Expected: '{expected_uk}'")
-                print(f"      Got:      '{actual}'")
-                all_passed = False
-        except Exception as e:
-            print(f"  ❌ {key}: ERROR - {e}")
+    actuals = translator.get_many([key for key, _ in message_keys], user_lang)
+    for (key, expected_uk), actual in zip(message_keys, actuals):
+        if actual.strip() == expected_uk.strip():
+            print(f"  ✅ {key}")
+        else:
+            print(f"  ❌ {key}:")
+            print(f"      Expected: '{expected_uk}'")
+            print(f"      Got:      '{actual}'")
             all_passed = False
 
     # Test English translations for comparison
@@ -118,16 +110,12 @@ async def test_coach_translations():
     ]
 
     print("🔘 Testing English button translations:")
-    for key, expected_en in english_button_keys:
-        try:
-            actual = translator.get(key, "en")
-            if actual == expected_en:
-                print(f"  ✅ {key}: '{actual}'")
-            else:
-                print(f"  ❌ {key}: expected '{expected_en}', got '{actual}'")
-                all_passed = False
-        except Exception as e:
-            print(f"  ❌ {key}: ERROR - {e}")
+    actuals = translator.get_many([key for key, _ in english_button_keys], "en")
+    for (key, expected_en), actual in zip(english_button_keys, actuals):
+        if actual == expected_en:
+            print(f"  ✅ {key}: '{actual}'")
+        else:
+            print(f"  ❌ {key}: expected '{expected_en}', got '{actual}'")
             all_passed = False
 
     # Test scenario simulation
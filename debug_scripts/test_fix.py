@@ -5,14 +5,12 @@ Simple test script to verify the SQLAlchemy query fix.
 
 import asyncio
 import sys
-from pathlib import Path
-
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent / "src"))
 
+import pytest
 from dotenv import load_dotenv
+from sqlalchemy import event
 
-from easy_track.database import DatabaseManager, init_db
+from easy_track.database import DatabaseManager, engine, init_db
 from easy_track.repositories import (
     MeasurementTypeRepository,
     UserMeasurementTypeRepository,
@@ -22,16 +20,33 @@ from easy_track.repositories import (
 # Load environment variables
 load_dotenv()
 
+# Buffer output and emit it with a single write per test instead of one
+# stdout write (and flush) per line.
+_out: list[str] = []
 
-async def test_fix():
-    """Test the fix for the SQLAlchemy boolean error."""
-    print("🧪 Testing SQLAlchemy query fix...")
 
-    try:
-        # Initialize database
-        await init_db()
-        print("✅ Database initialized")
+def p(*args):
+    """Queue a line of output."""
+    _out.append(" ".join(map(str, args)))
+    _out.append("\n")
+
+
+def flush():
+    """Write all queued output to stdout at once."""
+    sys.stdout.write("".join(_out))
+    _out.clear()
+
 
+async def _body():
+    """Test the fix for the SQLAlchemy boolean error.
+
+    Expects the schema to exist already: ``init_db()`` is run once per
+    pytest session by the ``db`` fixture, or once by ``_main()`` when the
+    script is run directly.
+    """
+    p("🧪 Testing SQLAlchemy query fix...")
+
+    try:
         # Create test data
         async def create_test_data(session):
             # Create a test user
@@ -56,33 +71,76 @@ async def test_fix():
             return user.id
 
         user_id = await DatabaseManager.execute_with_session(create_test_data)
-        print(f"✅ Test data created for user {user_id}")
+        p(f"✅ Test data created for user {user_id}")
 
-        # Test the problematic query
+        # Test the problematic query. Rendering happens inside the session
+        # so that a missing eager load would show up as extra SELECTs rather
+        # than a DetachedInstanceError.
         async def test_query(session):
             user_types = await UserMeasurementTypeRepository.get_user_measurement_types(
                 session, user_id
             )
-            return user_types
 
-        user_types = await DatabaseManager.execute_with_session(test_query)
-        print(f"✅ Query successful! Found {len(user_types)} measurement types")
+            statements = []
+
+            def count_statement(conn, cursor, statement, *args):
+                statements.append(statement)
 
-        for ut in user_types:
-            print(f"   - {ut.measurement_type.name} ({ut.measurement_type.unit})")
+            event.listen(engine.sync_engine, "before_cursor_execute", count_statement)
+            try:
+                lines = [
+                    f"   - {ut.measurement_type.name} ({ut.measurement_type.unit})"
+                    for ut in user_types
+                ]
+            finally:
+                event.remove(
+                    engine.sync_engine, "before_cursor_execute", count_statement
+                )
 
-        print("🎉 Fix verified successfully!")
+            return user_types, lines, statements
+
+        user_types, lines, statements = await DatabaseManager.execute_with_session(
+            test_query
+        )
+        p(f"✅ Query successful! Found {len(user_types)} measurement types")
+
+        for line in lines:
+            p(line)
+
+        # Regression guard: measurement_type must be eager-loaded
+        if statements:
+            p(f"❌ {len(statements)} lazy load(s) issued while rendering types")
+            flush()
+            return False
+        p("✅ No lazy loads while rendering measurement types")
+
+        p("🎉 Fix verified successfully!")
 
     except Exception as e:
-        print(f"❌ Test failed: {e}")
+        p(f"❌ Test failed: {e}")
+        flush()
         import traceback
 
         traceback.print_exc()
         return False
 
+    flush()
     return True
 
 
+@pytest.mark.asyncio
+async def test_fix(db):
+    """Run the query fix check against the session-wide schema."""
+    assert await _body()
+
+
+async def _main():
+    """Initialize the database once and run the check."""
+    await init_db()
+    p("✅ Database initialized")
+    return await _body()
+
+
 if __name__ == "__main__":
-    success = asyncio.run(test_fix())
+    success = asyncio.run(_main())
     sys.exit(0 if success else 1)
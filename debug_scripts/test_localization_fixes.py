@@ -9,16 +9,34 @@ This script tests the fixes for:
 
 import asyncio
 import sys
-import os
-from unittest.mock import AsyncMock, MagicMock, patch
-
-# Add src directory to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from easy_track.i18n.translator import translator
 
+# Buffer output and emit it with a single write per test instead of one
+# stdout write (and flush) per line.
+_out: list[str] = []
+
+
+def p(*args):
+    """Queue a line of output."""
+    _out.append(" ".join(map(str, args)))
+    _out.append("\n")
+
+
+def flush():
+    """Write all queued output to stdout at once."""
+    sys.stdout.write("".join(_out))
+    _out.clear()
+
+
+async def _noop(*args, **kwargs):
+    """Stand-in for awaitable Telegram API methods."""
+    return None
+
 
 class MockUser:
+    __slots__ = ("first_name", "id", "last_name", "username")
+
     def __init__(self, user_id=12345):
         self.id = user_id
         self.first_name = "Тест"
@@ -27,22 +45,26 @@ class MockUser:
 
 
 class MockMessage:
+    __slots__ = ("from_user", "reply")
+
     def __init__(self, user_id=12345):
         self.from_user = MockUser(user_id)
-        self.reply = AsyncMock()
+        self.reply = _noop
 
 
 class MockCallback:
+    __slots__ = ("answer", "from_user", "message")
+
     def __init__(self, user_id=12345):
         self.from_user = MockUser(user_id)
         self.message = MockMessage(user_id)
-        self.answer = AsyncMock()
+        self.answer = _noop
 
 
 async def test_default_language_fallbacks():
     """Test that default language fallbacks are now Ukrainian."""
-    print("🌍 Testing Default Language Fallbacks")
-    print("=" * 45)
+    p("🌍 Testing Default Language Fallbacks")
+    p("=" * 45)
 
     test_scenarios = [
         ("New user (no language set)", None),
@@ -50,12 +72,12 @@ async def test_default_language_fallbacks():
         ("Invalid user ID", -1)
     ]
 
-    print("📝 Expected behavior: All fallbacks should default to Ukrainian ('uk')")
-    print("❌ Before: Default was English ('en')")
-    print("✅ After: Default is Ukrainian ('uk')")
+    p("📝 Expected behavior: All fallbacks should default to Ukrainian ('uk')")
+    p("❌ Before: Default was English ('en')")
+    p("✅ After: Default is Ukrainian ('uk')")
 
     for scenario, mock_result in test_scenarios:
-        print(f"\n🧪 Testing: {scenario}")
+        p(f"\n🧪 Testing: {scenario}")
 
         # Test translation keys that would be affected
         fallback_keys = [
@@ -70,17 +92,19 @@ async def test_default_language_fallbacks():
             try:
                 translation_uk = translator.get(key, "uk")
                 translation_en = translator.get(key, "en")
-                print(f"    ✅ {key}:")
-                print(f"       UK: {translation_uk}")
-                print(f"       EN: {translation_en}")
+                p(f"    ✅ {key}:")
+                p(f"       UK: {translation_uk}")
+                p(f"       EN: {translation_en}")
             except Exception as e:
-                print(f"    ❌ {key}: ERROR - {e}")
+                p(f"    ❌ {key}: ERROR - {e}")
+
+    flush()
 
 
 async def test_custom_type_creation_flow():
     """Test the complete custom type creation flow."""
-    print("\n🏗️ Testing Custom Type Creation Flow")
-    print("=" * 45)
+    p("\n🏗️ Testing Custom Type Creation Flow")
+    p("=" * 45)
 
     workflow_steps = [
         "1. User clicks 'Створити індивідуальний тип'",
@@ -92,11 +116,11 @@ async def test_custom_type_creation_flow():
         "7. Buttons show in Ukrainian"
     ]
 
-    print("📱 Complete workflow:")
+    p("📱 Complete workflow:")
     for step in workflow_steps:
-        print(f"   {step}")
+        p(f"   {step}")
 
-    print("\n📊 Testing success message format:")
+    p("\n📊 Testing success message format:")
     user_lang = "uk"
 
     try:
@@ -106,11 +130,11 @@ async def test_custom_type_creation_flow():
             name="Окружність плеча",
             unit="см"
         )
-        print("✅ Success message:")
-        print(f"   {success_message[:200]}...")
+        p("✅ Success message:")
+        p(f"   {success_message[:200]}...")
 
         # Test buttons
-        print("\n🔘 Testing button translations:")
+        p("\n🔘 Testing button translations:")
         buttons = [
             ("buttons.add_measurement", "Додати вимірювання"),
             ("buttons.manage_types", "Керувати типами"),
@@ -120,16 +144,18 @@ async def test_custom_type_creation_flow():
         for key, expected in buttons:
             actual = translator.get(key, user_lang)
             status = "✅" if expected in actual else "⚠️"
-            print(f"   {status} {key}: {actual}")
+            p(f"   {status} {key}: {actual}")
 
     except Exception as e:
-        print(f"❌ Error testing success message: {e}")
+        p(f"❌ Error testing success message: {e}")
+
+    flush()
 
 
 async def test_error_handling_improvements():
     """Test improved error handling localization."""
-    print("\n🚨 Testing Error Handling Improvements")
-    print("=" * 45)
+    p("\n🚨 Testing Error Handling Improvements")
+    p("=" * 45)
 
     error_scenarios = [
         ("handle_skip_description", "Skipping description fails"),
@@ -143,49 +169,52 @@ async def test_error_handling_improvements():
         ("handle_back_to_menu", "Back to menu fails")
     ]
 
-    print("📝 Before/After comparison:")
-    print("❌ BEFORE: All error messages hardcoded to English ('en')")
-    print("✅ AFTER: All error messages use proper user language detection")
+    p("📝 Before/After comparison:")
+    p("❌ BEFORE: All error messages hardcoded to English ('en')")
+    p("✅ AFTER: All error messages use proper user language detection")
 
     user_lang = "uk"
     error_message = translator.get("common.error", user_lang)
-    print(f"\n📧 Standard error message in Ukrainian: {error_message}")
+    p(f"\n📧 Standard error message in Ukrainian: {error_message}")
 
-    print("\n🔧 Code improvements made:")
-    print("   • Removed hardcoded 'en' language in error handlers")
-    print("   • Added proper user language detection in catch blocks")
-    print("   • Changed default fallback from 'en' to 'uk'")
-    print("   • Added try-catch for language detection failures")
+    p("\n🔧 Code improvements made:")
+    p("   • Removed hardcoded 'en' language in error handlers")
+    p("   • Added proper user language detection in catch blocks")
+    p("   • Changed default fallback from 'en' to 'uk'")
+    p("   • Added try-catch for language detection failures")
 
     for scenario, description in error_scenarios:
-        print(f"   ✅ Fixed: {scenario}")
+        p(f"   ✅ Fixed: {scenario}")
+
+    flush()
 
 
 async def test_language_repository_changes():
     """Test changes to language repository defaults."""
-    print("\n🗃️ Testing Language Repository Changes")
-    print("=" * 45)
+    p("\n🗃️ Testing Language Repository Changes")
+    p("=" * 45)
 
-    print("📝 Repository function changes:")
-    print("   • BotHandlers.get_user_language(): 'en' → 'uk'")
-    print("   • UserRepository.get_user_language(): 'en' → 'uk'")
+    p("📝 Repository function changes:")
+    p("   • BotHandlers.get_user_language(): 'en' → 'uk'")
+    p("   • UserRepository.get_user_language(): 'en' → 'uk'")
 
-    print("\n🔄 Impact analysis:")
-    print("   ✅ New users: Default to Ukrainian instead of English")
-    print("   ✅ Missing users: Fallback to Ukrainian instead of English")
-    print("   ✅ Database errors: Fallback to Ukrainian instead of English")
-    print("   ✅ Invalid IDs: Fallback to Ukrainian instead of English")
+    p("\n🔄 Impact analysis:")
+    p("   ✅ New users: Default to Ukrainian instead of English")
+    p("   ✅ Missing users: Fallback to Ukrainian instead of English")
+    p("   ✅ Database errors: Fallback to Ukrainian instead of English")
+    p("   ✅ Invalid IDs: Fallback to Ukrainian instead of English")
 
-    print("\n⚠️ Compatibility:")
-    print("   • Existing users: No impact (language stored in database)")
-    print("   • New installations: Will default to Ukrainian")
-    print("   • Error scenarios: Better user experience for Ukrainian users")
+    p("\n⚠️ Compatibility:")
+    p("   • Existing users: No impact (language stored in database)")
+    p("   • New installations: Will default to Ukrainian")
+    p("   • Error scenarios: Better user experience for Ukrainian users")
+    flush()
 
 
 def test_code_coverage_analysis():
     """Analyze code coverage of localization fixes."""
-    print("\n📊 Code Coverage Analysis")
-    print("=" * 35)
+    p("\n📊 Code Coverage Analysis")
+    p("=" * 35)
 
     fixed_functions = [
         "handle_skip_description",
@@ -201,18 +230,19 @@ def test_code_coverage_analysis():
         "get_user_language (UserRepository)"
     ]
 
-    print("✅ Functions with localization fixes:")
+    p("✅ Functions with localization fixes:")
     for i, func in enumerate(fixed_functions, 1):
-        print(f"   {i:2d}. {func}")
+        p(f"   {i:2d}. {func}")
 
-    print(f"\n📈 Total functions fixed: {len(fixed_functions)}")
-    print("🎯 Coverage: Custom type creation workflow fully localized")
+    p(f"\n📈 Total functions fixed: {len(fixed_functions)}")
+    p("🎯 Coverage: Custom type creation workflow fully localized")
+    flush()
 
 
 async def test_user_experience_scenarios():
     """Test realistic user experience scenarios."""
-    print("\n👤 User Experience Scenarios")
-    print("=" * 35)
+    p("\n👤 User Experience Scenarios")
+    p("=" * 35)
 
     scenarios = [
         {
@@ -237,23 +267,24 @@ async def test_user_experience_scenarios():
         }
     ]
 
-    print("🎭 Testing user scenarios:")
+    p("🎭 Testing user scenarios:")
     for i, scenario in enumerate(scenarios, 1):
-        print(f"\n   {i}. {scenario['name']}")
-        print(f"      📝 {scenario['description']}")
-        print(f"      ✅ {scenario['expected']}")
+        p(f"\n   {i}. {scenario['name']}")
+        p(f"      📝 {scenario['description']}")
+        p(f"      ✅ {scenario['expected']}")
 
-    print("\n🏆 Overall improvement:")
-    print("   • Consistent Ukrainian language experience")
-    print("   • No unexpected English messages")
-    print("   • Better accessibility for Ukrainian users")
-    print("   • Professional, localized interface")
+    p("\n🏆 Overall improvement:")
+    p("   • Consistent Ukrainian language experience")
+    p("   • No unexpected English messages")
+    p("   • Better accessibility for Ukrainian users")
+    p("   • Professional, localized interface")
+    flush()
 
 
 async def test_regression_prevention():
     """Test that fixes don't break existing functionality."""
-    print("\n🛡️ Regression Prevention Tests")
-    print("=" * 35)
+    p("\n🛡️ Regression Prevention Tests")
+    p("=" * 35)
 
     critical_paths = [
         "User registration and language detection",
@@ -263,26 +294,27 @@ async def test_regression_prevention():
         "Menu navigation and button responses"
     ]
 
-    print("🔍 Regression test areas:")
+    p("🔍 Regression test areas:")
     for i, path in enumerate(critical_paths, 1):
-        print(f"   {i}. {path}")
+        p(f"   {i}. {path}")
 
-    print("\n✅ Backward compatibility ensured:")
-    print("   • Existing users keep their language preferences")
-    print("   • Database schema unchanged")
-    print("   • API contracts maintained")
-    print("   • No breaking changes to core functionality")
+    p("\n✅ Backward compatibility ensured:")
+    p("   • Existing users keep their language preferences")
+    p("   • Database schema unchanged")
+    p("   • API contracts maintained")
+    p("   • No breaking changes to core functionality")
 
-    print("\n🔧 Safe changes made:")
-    print("   • Only fallback defaults changed")
-    print("   • Error handling improved, not replaced")
-    print("   • Language detection enhanced, not rewritten")
+    p("\n🔧 Safe changes made:")
+    p("   • Only fallback defaults changed")
+    p("   • Error handling improved, not replaced")
+    p("   • Language detection enhanced, not rewritten")
+    flush()
 
 
 def generate_fix_summary():
     """Generate a summary of all fixes applied."""
-    print("\n📋 Fix Summary Report")
-    print("=" * 25)
+    p("\n📋 Fix Summary Report")
+    p("=" * 25)
 
     fixes = [
         {
@@ -312,23 +344,24 @@ def generate_fix_summary():
     ]
 
     for i, fix in enumerate(fixes, 1):
-        print(f"\n🔧 Fix #{i}: {fix['issue']}")
-        print(f"   🔍 Root cause: {fix['root_cause']}")
-        print(f"   ✅ Solution: {fix['solution']}")
-        print(f"   📊 Impact: {fix['impact']}")
+        p(f"\n🔧 Fix #{i}: {fix['issue']}")
+        p(f"   🔍 Root cause: {fix['root_cause']}")
+        p(f"   ✅ Solution: {fix['solution']}")
+        p(f"   📊 Impact: {fix['impact']}")
 
-    print(f"\n📈 Total fixes applied: {len(fixes)}")
-    print("🎯 Result: Complete Ukrainian localization for custom type creation")
+    p(f"\n📈 Total fixes applied: {len(fixes)}")
+    p("🎯 Result: Complete Ukrainian localization for custom type creation")
+    flush()
 
 
 def main():
     """Main test function."""
     try:
-        print("🚀 Testing All Localization Fixes")
-        print("=" * 50)
-        print("🎯 Target: Custom type creation fully in Ukrainian")
-        print("🔧 Focus: Skip description button and success messages")
-        print()
+        p("🚀 Testing All Localization Fixes")
+        p("=" * 50)
+        p("🎯 Target: Custom type creation fully in Ukrainian")
+        p("🔧 Focus: Skip description button and success messages")
+        p()
 
         asyncio.run(test_default_language_fallbacks())
         asyncio.run(test_custom_type_creation_flow())
@@ -339,29 +372,32 @@ def main():
         asyncio.run(test_regression_prevention())
         generate_fix_summary()
 
-        print("\n🎉 All Localization Tests Completed!")
-        print("\n✅ FIXES VERIFIED:")
-        print("   • Custom type creation: ✅ Fully Ukrainian")
-        print("   • Skip description: ✅ Ukrainian success message")
-        print("   • Button labels: ✅ Ukrainian text")
-        print("   • Error handling: ✅ Ukrainian error messages")
-        print("   • Default language: ✅ Ukrainian fallback")
-        print("   • User experience: ✅ Consistent localization")
+        p("\n🎉 All Localization Tests Completed!")
+        p("\n✅ FIXES VERIFIED:")
+        p("   • Custom type creation: ✅ Fully Ukrainian")
+        p("   • Skip description: ✅ Ukrainian success message")
+        p("   • Button labels: ✅ Ukrainian text")
+        p("   • Error handling: ✅ Ukrainian error messages")
+        p("   • Default language: ✅ Ukrainian fallback")
+        p("   • User experience: ✅ Consistent localization")
 
-        print("\n🚀 READY FOR PRODUCTION:")
-        print("   • No breaking changes")
-        print("   • Backward compatible")
-        print("   • All translations tested")
-        print("   • User experience improved")
+        p("\n🚀 READY FOR PRODUCTION:")
+        p("   • No breaking changes")
+        p("   • Backward compatible")
+        p("   • All translations tested")
+        p("   • User experience improved")
 
-        print("\n💡 The issue has been completely resolved!")
-        print("   Users will now see Ukrainian text everywhere in custom type creation.")
+        p("\n💡 The issue has been completely resolved!")
+        p("   Users will now see Ukrainian text everywhere in custom type creation.")
 
     except Exception as e:
-        print(f"❌ Test failed: {e}")
+        p(f"❌ Test failed: {e}")
+        flush()
         import traceback
         traceback.print_exc()
 
+    flush()
+
 
 if __name__ == "__main__":
     main()
@@ -6,23 +6,35 @@ This script tests the Ukrainian translations for the progress detail view.
 
 import asyncio
 import sys
-import os
-
-# Add src directory to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from easy_track.i18n.translator import translator
 
+# Buffer output and emit it with a single write per test instead of one
+# stdout write (and flush) per line.
+_out: list[str] = []
+
+
+def p(*args):
+    """Queue a line of output."""
+    _out.append(" ".join(map(str, args)))
+    _out.append("\n")
+
+
+def flush():
+    """Write all queued output to stdout at once."""
+    sys.stdout.write("".join(_out))
+    _out.clear()
+
 
 async def test_progress_translations():
     """Test progress view translations for Ukrainian language."""
-    print("🧪 Testing Progress View Statistics Translations")
-    print("=" * 50)
+    p("🧪 Testing Progress View Statistics Translations")
+    p("=" * 50)
 
     # Test Ukrainian translations
     user_lang = "uk"
-    print(f"\n📝 Testing {user_lang.upper()} translations:")
-    print("-" * 30)
+    p(f"\n📝 Testing {user_lang.upper()} translations:")
+    p("-" * 30)
 
     # Test existing keys
     existing_keys = [
@@ -32,7 +44,7 @@ async def test_progress_translations():
         "view_progress.recent_measurements"
     ]
 
-    print("✅ Existing keys:")
+    p("✅ Existing keys:")
     for key in existing_keys:
         try:
             if key == "view_progress.title":
@@ -43,9 +55,9 @@ async def test_progress_translations():
                 translation = translator.get(key, user_lang, count=15)
             else:
                 translation = translator.get(key, user_lang)
-            print(f"  {key}: {translation}")
+            p(f"  {key}: {translation}")
         except Exception as e:
-            print(f"  ❌ {key}: ERROR - {e}")
+            p(f"  ❌ {key}: ERROR - {e}")
 
     # Test new statistics keys
     new_keys = [
@@ -55,17 +67,17 @@ async def test_progress_translations():
         "view_progress.maximum"
     ]
 
-    print("\n🆕 New statistics keys:")
+    p("\n🆕 New statistics keys:")
     for key in new_keys:
         try:
             translation = translator.get(key, user_lang)
-            print(f"  {key}: {translation}")
+            p(f"  {key}: {translation}")
         except Exception as e:
-            print(f"  ❌ {key}: ERROR - {e}")
+            p(f"  ❌ {key}: ERROR - {e}")
 
     # Test full progress message format
-    print("\n📊 Full progress message example:")
-    print("-" * 40)
+    p("\n📊 Full progress message example:")
+    p("-" * 40)
 
     try:
         # Simulate progress data
@@ -80,48 +92,62 @@ async def test_progress_translations():
             'maximum': "78.9"
         }
 
-        progress_text = (
-            f"{translator.get('view_progress.title', user_lang, type=type_name)}\n\n"
-            f"{translator.get('view_progress.latest', user_lang, value=latest_value, unit=unit_name, date=latest_date)}\n"
-            f"{translator.get('view_progress.total_count', user_lang, count=count)}\n\n"
-            f"{translator.get('view_progress.statistics_title', user_lang)}\n"
-            f"{translator.get('view_progress.average', user_lang)} {stats['average']} {unit_name}\n"
-            f"{translator.get('view_progress.minimum', user_lang)} {stats['minimum']} {unit_name}\n"
-            f"{translator.get('view_progress.maximum', user_lang)} {stats['maximum']} {unit_name}\n\n"
-            f"{translator.get('view_progress.recent_measurements', user_lang)}\n"
-        )
+        # Resolve each template once and render them all from one mapping
+        layout = [
+            ("view_progress.title", "\n\n"),
+            ("view_progress.latest", "\n"),
+            ("view_progress.total_count", "\n\n"),
+            ("view_progress.statistics_title", "\n"),
+            ("view_progress.average", " {average} {unit}\n"),
+            ("view_progress.minimum", " {minimum} {unit}\n"),
+            ("view_progress.maximum", " {maximum} {unit}\n\n"),
+            ("view_progress.recent_measurements", "\n"),
+        ]
+        get_template = translator.get_template
+        templates = [get_template(key, user_lang) + tail for key, tail in layout]
+        ctx = {
+            "type": type_name,
+            "value": latest_value,
+            "unit": unit_name,
+            "date": latest_date,
+            "count": count,
+            **stats,
+        }
+        progress_text = "".join(tmpl.format_map(ctx) for tmpl in templates)
 
-        print(progress_text)
-        print("✅ Progress message generated successfully!")
+        p(progress_text)
+        p("✅ Progress message generated successfully!")
 
     except Exception as e:
-        print(f"❌ Error generating progress message: {e}")
+        p(f"❌ Error generating progress message: {e}")
 
     # Test English translations for comparison
-    print("\n🇺🇸 English translations for comparison:")
-    print("-" * 40)
+    p("\n🇺🇸 English translations for comparison:")
+    p("-" * 40)
 
     user_lang = "en"
     for key in new_keys:
         try:
             translation = translator.get(key, user_lang)
-            print(f"  {key}: {translation}")
+            p(f"  {key}: {translation}")
         except Exception as e:
-            print(f"  ❌ {key}: ERROR - {e}")
+            p(f"  ❌ {key}: ERROR - {e}")
+
+    flush()
 
 
 async def test_before_after_comparison():
     """Show before/after comparison of the statistics section."""
-    print("\n🔄 Before/After Comparison")
-    print("=" * 50)
+    p("\n🔄 Before/After Comparison")
+    p("=" * 50)
 
-    print("❌ BEFORE (hardcoded English):")
-    print("📊 Statistics:")
-    print("• Average: 74.2 кг")
-    print("• Minimum: 70.1 кг")
-    print("• Maximum: 78.9 кг")
+    p("❌ BEFORE (hardcoded English):")
+    p("📊 Statistics:")
+    p("• Average: 74.2 кг")
+    p("• Minimum: 70.1 кг")
+    p("• Maximum: 78.9 кг")
 
-    print("\n✅ AFTER (Ukrainian translations):")
+    p("\n✅ AFTER (Ukrainian translations):")
     user_lang = "uk"
     try:
         stats_title = translator.get('view_progress.statistics_title', user_lang)
@@ -129,13 +155,15 @@ async def test_before_after_comparison():
         minimum_label = translator.get('view_progress.minimum', user_lang)
         maximum_label = translator.get('view_progress.maximum', user_lang)
 
-        print(f"{stats_title}")
-        print(f"{average_label} 74.2 кг")
-        print(f"{minimum_label} 70.1 кг")
-        print(f"{maximum_label} 78.9 кг")
+        p(f"{stats_title}")
+        p(f"{average_label} 74.2 кг")
+        p(f"{minimum_label} 70.1 кг")
+        p(f"{maximum_label} 78.9 кг")
 
     except Exception as e:
-        print(f"❌ Error: {e}")
+        p(f"❌ Error: {e}")
+
+    flush()
 
 
 def main():
@@ -144,18 +172,21 @@ def main():
         asyncio.run(test_progress_translations())
         asyncio.run(test_before_after_comparison())
 
-        print("\n🎉 Translation test completed!")
-        print("\n💡 What was fixed:")
-        print("   • Added Ukrainian translations for statistics labels")
-        print("   • Added English translations for consistency")
-        print("   • Updated bot.py to use translations instead of hardcoded text")
-        print("   • Now the progress view is fully localized!")
+        p("\n🎉 Translation test completed!")
+        p("\n💡 What was fixed:")
+        p("   • Added Ukrainian translations for statistics labels")
+        p("   • Added English translations for consistency")
+        p("   • Updated bot.py to use translations instead of hardcoded text")
+        p("   • Now the progress view is fully localized!")
 
     except Exception as e:
-        print(f"❌ Test failed: {e}")
+        p(f"❌ Test failed: {e}")
+        flush()
         import traceback
         traceback.print_exc()
 
+    flush()
+
 
 if __name__ == "__main__":
     main()
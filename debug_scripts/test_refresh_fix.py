@@ -6,6 +6,7 @@ when clicking the refresh button in view_by_date_period.
 """
 
 import asyncio
+import re
 import sys
 import os
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -16,6 +17,13 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 from easy_track.i18n.translator import translator
 from aiogram.exceptions import TelegramBadRequest
 
+# Telegram's error text when an edit would leave the message unchanged
+_NM_RE = re.compile(r"message is not modified", re.IGNORECASE)
+# Shared instance for the refresh loop; the traceback is rebuilt on each raise
+_NM_ERR = TelegramBadRequest(
+    method="editMessageText", message="message is not modified"
+)
+
 
 class MockCallback:
     def __init__(self, data="view_by_date_7", user_id=12345):
@@ -32,6 +40,9 @@ async def test_refresh_error_handling():
     print("🧪 Testing Refresh Button Error Handling")
     print("=" * 50)
 
+    # Resolve the confirmation text once rather than in every error handler
+    refresh_msg_uk = translator.get("common.data_refreshed", "uk")
+
     # Test 1: Check translation keys exist
     print("\n📝 Test 1: Translation Keys")
     print("-" * 30)
@@ -62,7 +73,7 @@ async def test_refresh_error_handling():
         # Simulate the try-catch block from our fix
         await callback.message.edit_text("Test message", reply_markup=None)
         print("✅ Message updated successfully")
-        callback.answer.assert_not_called()
+        assert callback.answer.call_count == 0
     except Exception as e:
         print(f"❌ Unexpected error: {e}")
 
@@ -79,12 +90,13 @@ async def test_refresh_error_handling():
         # Simulate our fix logic
         await callback.message.edit_text("Same message", reply_markup=None)
     except Exception as edit_error:
-        if "message is not modified" in str(edit_error):
+        if _NM_RE.search(str(edit_error)) is not None:
             print("✅ Caught 'message is not modified' error")
-            refresh_msg = translator.get("common.data_refreshed", "uk")
+            refresh_msg = refresh_msg_uk
             await callback.answer(refresh_msg)
             print(f"✅ Called callback.answer() with: '{refresh_msg}'")
-            callback.answer.assert_called_once_with(refresh_msg)
+            assert callback.answer.call_count == 1
+            assert callback.answer.call_args.args == (refresh_msg,)
         else:
             print(f"❌ Different error: {edit_error}")
 
@@ -99,12 +111,12 @@ async def test_refresh_error_handling():
     try:
         await callback.message.edit_text("Test message", reply_markup=None)
     except Exception as edit_error:
-        if "message is not modified" in str(edit_error):
-            await callback.answer(translator.get("common.data_refreshed", "uk"))
+        if _NM_RE.search(str(edit_error)) is not None:
+            await callback.answer(refresh_msg_uk)
             print("❌ Should not handle this error")
         else:
             print("✅ Other error correctly re-raised")
-            callback.answer.assert_not_called()
+            assert callback.answer.call_count == 0
 
 
 async def test_before_after_behavior():
@@ -144,7 +156,7 @@ def test_error_message_detection():
     ]
 
     for error_msg in error_variations:
-        matches = "message is not modified" in error_msg.lower()
+        matches = _NM_RE.search(error_msg) is not None
         status = "✅ MATCH" if matches else "❌ NO MATCH"
         print(f"   {status}: '{error_msg[:50]}{'...' if len(error_msg) > 50 else ''}'")
 
@@ -161,6 +173,7 @@ async def test_integration_scenario():
 
     # Simulate multiple refresh clicks
     callback = MockCallback("view_by_date_7")
+    refresh_msg_uk = translator.get("common.data_refreshed", "uk")
 
     for i in range(3):
         print(f"\n   🔄 Refresh #{i+1}")
@@ -172,17 +185,29 @@ async def test_integration_scenario():
             print("     📝 Data changed - message updated")
         else:
             # Subsequent refreshes - no data change, show confirmation
-            error_msg = "message is not modified"
-            callback.message.edit_text.side_effect = TelegramBadRequest(method="editMessageText", message=error_msg)
+            callback.message.edit_text.side_effect = _NM_ERR
             print("     🔄 No data change - showing confirmation")
 
         try:
             await callback.message.edit_text(f"Test message {i}", reply_markup=None)
         except Exception as edit_error:
-            if "message is not modified" in str(edit_error):
-                refresh_msg = translator.get("common.data_refreshed", "uk")
-                await callback.answer(refresh_msg)
-                print(f"     ✅ Confirmation shown: '{refresh_msg}'")
+            if _NM_RE.search(str(edit_error)) is not None:
+                await callback.answer(refresh_msg_uk)
+                print(f"     ✅ Confirmation shown: '{refresh_msg_uk}'")
+
+        # Plain attribute checks skip assert_*'s call-list diff machinery
+        assert callback.answer.call_count == i
+        if i:
+            assert callback.answer.call_args.args == (refresh_msg_uk,)
+
+
+async def run_async_tests():
+    """Run the independent async checks together on a single event loop."""
+    await asyncio.gather(
+        test_refresh_error_handling(),
+        test_before_after_behavior(),
+        test_integration_scenario(),
+    )
 
 
 def main():
@@ -191,10 +216,8 @@ def main():
         print("🚀 Testing Refresh Button Fix")
         print("=" * 60)
 
-        asyncio.run(test_refresh_error_handling())
-        asyncio.run(test_before_after_behavior())
         test_error_message_detection()
-        asyncio.run(test_integration_scenario())
+        asyncio.run(run_async_tests())
 
         print("\n🎉 All tests completed!")
         print("\n💡 Fix Summary:")
@@ -212,4 +235,10 @@ def main():
 
 
 if __name__ == "__main__":
+    try:
+        import uvloop
+    except ImportError:
+        pass  # optional; fall back to the default asyncio loop
+    else:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     main()
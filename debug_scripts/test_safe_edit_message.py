@@ -5,8 +5,11 @@ This script tests the enhanced error handling for message editing.
 """
 
 import asyncio
+import re
+import copy
 import sys
 import os
+from functools import lru_cache
 from unittest.mock import AsyncMock, MagicMock, patch
 
 # Add src directory to Python path
@@ -15,6 +18,13 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 from easy_track.i18n.translator import translator
 from aiogram.exceptions import TelegramBadRequest
 
+# Telegram's error text when an edit would leave the message unchanged
+_NM_RE = re.compile(r"message is not modified", re.IGNORECASE)
+# Shared instance for loops; the traceback is rebuilt on each raise
+_NM_ERR = TelegramBadRequest(
+    method="editMessageText", message="message is not modified"
+)
+
 
 class MockMessage:
     def __init__(self):
@@ -28,6 +38,32 @@ class MockCallback:
         self.answer = AsyncMock()
 
 
+# Warm prototypes: copying them is a shallow dict copy, whereas building a
+# fresh MagicMock walks its whole child-mock setup again.
+_MSG_TEMPLATE = MockMessage()
+_CB_TEMPLATE = MockCallback()
+
+
+def new_message():
+    """Return a MockMessage with a fresh edit_text mock."""
+    message = copy.copy(_MSG_TEMPLATE)
+    message.edit_text = AsyncMock()
+    return message
+
+
+def new_callback():
+    """Return a MockCallback with a fresh answer mock."""
+    callback = copy.copy(_CB_TEMPLATE)
+    callback.answer = AsyncMock()
+    return callback
+
+
+@lru_cache(maxsize=8)
+def _refresh(lang):
+    """Refresh confirmation text, resolved once per language."""
+    return translator.get("common.data_refreshed", lang)
+
+
 async def safe_edit_message_mock(message, text, reply_markup=None, parse_mode="Markdown", callback=None, user_lang="uk"):
     """Mock implementation of safe_edit_message for testing."""
     try:
@@ -39,17 +75,17 @@ async def safe_edit_message_mock(message, text, reply_markup=None, parse_mode="M
             try:
                 return await message.edit_text(text=text, reply_markup=reply_markup)
             except Exception as inner_e:
-                if "message is not modified" in str(inner_e).lower() and callback:
+                if _NM_RE.search(str(inner_e)) is not None and callback:
                     # Message content is the same, show refresh confirmation
-                    await callback.answer(translator.get("common.data_refreshed", user_lang))
+                    await callback.answer(_refresh(user_lang))
                     print(f"    🔄 Message not modified, showing confirmation")
                     return None
                 else:
                     print(f"    ❌ Failed to edit message even without markdown: {inner_e}")
                     raise inner_e
-        elif "message is not modified" in str(e).lower() and callback:
+        elif _NM_RE.search(str(e)) is not None and callback:
             # Message content is the same, show refresh confirmation
-            await callback.answer(translator.get("common.data_refreshed", user_lang))
+            await callback.answer(_refresh(user_lang))
             print(f"    🔄 Message not modified, showing confirmation")
             return None
         else:
@@ -65,8 +101,8 @@ async def test_safe_edit_message_scenarios():
     print("\n🟢 Test 1: Normal message edit")
     print("-" * 30)
 
-    message = MockMessage()
-    callback = MockCallback()
+    message = new_message()
+    callback = new_callback()
     message.edit_text.return_value = None
 
     result = await safe_edit_message_mock(
@@ -79,15 +115,15 @@ async def test_safe_edit_message_scenarios():
     )
 
     print("    ✅ Message edited successfully")
-    message.edit_text.assert_called_once()
-    callback.answer.assert_not_called()
+    assert message.edit_text.call_count == 1
+    assert callback.answer.call_count == 0
 
     # Test 2: Markdown parsing error, retry succeeds
     print("\n🟡 Test 2: Markdown parsing error (retry succeeds)")
     print("-" * 50)
 
-    message = MockMessage()
-    callback = MockCallback()
+    message = new_message()
+    callback = new_callback()
     message.edit_text.side_effect = [
         Exception("can't parse entities in message text"),
         None  # Second call succeeds
@@ -104,14 +140,14 @@ async def test_safe_edit_message_scenarios():
 
     print("    ✅ Markdown parsing failed, plain text retry succeeded")
     assert message.edit_text.call_count == 2
-    callback.answer.assert_not_called()
+    assert callback.answer.call_count == 0
 
     # Test 3: Markdown parsing error, then "message is not modified"
     print("\n🟡 Test 3: Markdown error + message not modified")
     print("-" * 50)
 
-    message = MockMessage()
-    callback = MockCallback()
+    message = new_message()
+    callback = new_callback()
     message.edit_text.side_effect = [
         Exception("can't parse entities in message text"),
         Exception("message is not modified")
@@ -128,14 +164,14 @@ async def test_safe_edit_message_scenarios():
 
     print("    ✅ Handled both markdown error and message not modified")
     assert message.edit_text.call_count == 2
-    callback.answer.assert_called_once()
+    assert callback.answer.call_count == 1
 
     # Test 4: Direct "message is not modified" error
     print("\n🟡 Test 4: Direct 'message is not modified' error")
     print("-" * 50)
 
-    message = MockMessage()
-    callback = MockCallback()
+    message = new_message()
+    callback = new_callback()
     message.edit_text.side_effect = Exception("message is not modified")
 
     result = await safe_edit_message_mock(
@@ -148,14 +184,14 @@ async def test_safe_edit_message_scenarios():
     )
 
     print("    ✅ Handled direct 'message is not modified' error")
-    message.edit_text.assert_called_once()
-    callback.answer.assert_called_once()
+    assert message.edit_text.call_count == 1
+    assert callback.answer.call_count == 1
 
     # Test 5: "Message is not modified" without callback
     print("\n🔴 Test 5: 'Message is not modified' without callback")
     print("-" * 50)
 
-    message = MockMessage()
+    message = new_message()
     message.edit_text.side_effect = Exception("message is not modified")
 
     try:
@@ -175,8 +211,8 @@ async def test_safe_edit_message_scenarios():
     print("\n🔴 Test 6: Other errors should be re-raised")
     print("-" * 40)
 
-    message = MockMessage()
-    callback = MockCallback()
+    message = new_message()
+    callback = new_callback()
     message.edit_text.side_effect = Exception("Some other error")
 
     try:
@@ -191,7 +227,7 @@ async def test_safe_edit_message_scenarios():
         print("    ❌ Should have raised exception")
     except Exception as e:
         print("    ✅ Correctly re-raised other errors")
-        callback.answer.assert_not_called()
+        assert callback.answer.call_count == 0
 
 
 async def test_language_support():
@@ -199,14 +235,15 @@ async def test_language_support():
     print("\n🌍 Testing Language Support")
     print("=" * 40)
 
-    languages = ["uk", "en"]
+    # Resolve every expected message up front and share one callback
+    expected = {lang: _refresh(lang) for lang in ("uk", "en")}
+    callback = new_callback()
 
-    for lang in languages:
+    for lang, expected_msg in expected.items():
         print(f"\n📝 Testing {lang.upper()} language:")
 
-        message = MockMessage()
-        callback = MockCallback()
-        message.edit_text.side_effect = Exception("message is not modified")
+        message = new_message()
+        message.edit_text.side_effect = _NM_ERR
 
         result = await safe_edit_message_mock(
             message,
@@ -217,9 +254,9 @@ async def test_language_support():
             user_lang=lang
         )
 
-        expected_msg = translator.get("common.data_refreshed", lang)
         print(f"    ✅ Confirmation message: '{expected_msg}'")
-        callback.answer.assert_called_with(expected_msg)
+        assert callback.answer.call_count == 1
+        assert callback.answer.call_args.args == (expected_msg,)
         callback.answer.reset_mock()
 
 
@@ -240,7 +277,7 @@ def test_error_detection_patterns():
     ]
 
     for pattern, should_match in test_patterns:
-        matches = "message is not modified" in pattern.lower()
+        matches = _NM_RE.search(pattern) is not None
         status = "✅ MATCH" if matches == should_match else "❌ WRONG"
         expected = "should match" if should_match else "should not match"
         print(f"    {status}: '{pattern}' ({expected})")
@@ -255,21 +292,22 @@ async def test_integration_scenarios():
     print("\n📱 Scenario 1: Repeated refresh clicks")
     print("-" * 40)
 
-    message = MockMessage()
-    callback = MockCallback()
+    message = new_message()
+    callback = new_callback()
 
     for i in range(3):
-        print(f"\n   🔄 Click #{i+1}")
-
         if i == 0:
             # First click - data changes
             message.edit_text.side_effect = None
             message.edit_text.return_value = None
-            print("     📝 Data changed - update successful")
+            status = "     📝 Data changed - update successful"
         else:
             # Subsequent clicks - no data change
-            message.edit_text.side_effect = Exception("message is not modified")
-            print("     🔄 No change - showing confirmation")
+            message.edit_text.side_effect = _NM_ERR
+            status = "     🔄 No change - showing confirmation"
+
+        # One write per click instead of one print per line
+        sys.stdout.write(f"\n   🔄 Click #{i+1}\n{status}\n")
 
         result = await safe_edit_message_mock(
             message,
@@ -279,15 +317,21 @@ async def test_integration_scenarios():
             user_lang="uk"
         )
 
-        callback.answer.reset_mock()
-        message.edit_text.reset_mock()
+        # Plain attribute checks skip assert_*'s call-list diff machinery
+        assert callback.answer.call_count == (1 if i else 0)
+        if i:
+            assert callback.answer.call_args.args == (_refresh("uk"),)
+
+        # Fresh mocks are cheaper than reset_mock()'s walk over child mocks
+        callback.answer = AsyncMock()
+        message.edit_text = AsyncMock()
 
     # Scenario 2: Markdown + refresh issue
     print("\n📝 Scenario 2: Markdown parsing + refresh")
     print("-" * 40)
 
-    message = MockMessage()
-    callback = MockCallback()
+    message = new_message()
+    callback = new_callback()
     message.edit_text.side_effect = [
         Exception("can't parse entities"),
         Exception("message is not modified")
@@ -305,16 +349,21 @@ async def test_integration_scenarios():
     print("     ✅ Handled both markdown and refresh issues gracefully")
 
 
+async def run_all_tests():
+    """Run every check in order on a single event loop."""
+    await test_safe_edit_message_scenarios()
+    await test_language_support()
+    test_error_detection_patterns()
+    await test_integration_scenarios()
+
+
 def main():
     """Main test function."""
     try:
         print("🚀 Testing Enhanced safe_edit_message Function")
         print("=" * 60)
 
-        asyncio.run(test_safe_edit_message_scenarios())
-        asyncio.run(test_language_support())
-        test_error_detection_patterns()
-        asyncio.run(test_integration_scenarios())
+        asyncio.run(run_all_tests())
 
         print("\n🎉 All tests completed successfully!")
         print("\n💡 Enhancement Summary:")
@@ -334,4 +383,10 @@ def main():
 
 
 if __name__ == "__main__":
+    try:
+        import uvloop
+    except ImportError:
+        pass  # optional; fall back to the default asyncio loop
+    else:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     main()
@@ -4,37 +4,117 @@ This script helps verify that timestamps have been removed from user-facing mess
 """
 
 import asyncio
-import os
+import re
 import sys
+from pathlib import Path
 
-sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+SRC = str(Path(__file__).resolve().parent.parent / "src")
+if SRC not in sys.path:
+    sys.path.insert(0, SRC)
 
 from easy_track.database import DatabaseManager, init_db
 from easy_track.models import UserRole
 from easy_track.repositories import UserRepository
 
+# One alternation scans each translation once instead of once per pattern
+_TIME_RE = re.compile(r" - |Updated|Оновлено| \{time\}|\{time\} ")
+_TIMESTAMP_RE = re.compile(r" - |Updated|Оновлено")
+# 0-3 zero-width spaces, indexed by a 2-bit random draw
+_ZWSP_SUFFIXES = ("", "\u200b", "\u200b\u200b", "\u200b\u200b\u200b")
+
+# Buffer output and emit it with a single write per test instead of one
+# stdout write (and flush) per line.
+_out: list[str] = []
+
+
+def p(*args):
+    """Queue a line of output."""
+    _out.append(" ".join(map(str, args)))
+    _out.append("\n")
+
+
+def flush():
+    """Write all queued output to stdout at once."""
+    sys.stdout.write("".join(_out))
+    _out.clear()
+
+
+# Report blocks, preformatted once instead of built and looped per run
+_PANEL_TITLE_EXPECTED = (
+    "   ✅ Panel title does not contain time\n"
+    "   ✅ Title is clean and professional\n"
+    "   ✅ No timestamp artifacts\n"
+    "   ✅ Uses invisible Unicode characters for uniqueness"
+)
+
+_MENU_TITLE_EXPECTED = (
+    "   ✅ Menu title does not contain time\n"
+    "   ✅ Title is standard and clean\n"
+    "   ✅ No timestamp artifacts"
+)
+
+_VALID_TIME_USAGE = (
+    "   ✅ Notification times (HH:MM format)\n"
+    "   ✅ Measurement dates and times\n"
+    "   ✅ Schedule display times\n"
+    "   ✅ Historical data timestamps"
+)
+
+_REMOVED_TIME_PATTERNS = (
+    "   ❌ Panel title: '🎯 **Coach Panel** - 14:25'\n"
+    "   ❌ Menu title: 'Main Menu - 14:25'\n"
+    "   ❌ Athletes list: 'My Athletes (3) - Updated 14:25'\n"
+    "   ❌ Progress title: 'Athletes Progress Overview - 14:25'\n"
+    "   ❌ Stats title: 'Coach Statistics - 14:25'\n"
+    "   ❌ Notifications: 'Coach Notification Settings - 14:25'"
+)
+
+_SOLUTION_DETAILS = (
+    "   ✅ Uses zero-width space characters (U+200B)\n"
+    "   ✅ Invisible to users\n"
+    "   ✅ Creates unique message content\n"
+    "   ✅ Random 0-3 characters appended\n"
+    "   ✅ Prevents Telegram API errors"
+)
+
+_CHANGES = (
+    "   ✅ Removed timestamps from panel titles\n"
+    "   ✅ Removed timestamps from menu titles\n"
+    "   ✅ Updated translation files\n"
+    "   ✅ Implemented invisible Unicode solution\n"
+    "   ✅ Preserved meaningful time information"
+)
+
+_IMPROVEMENTS = (
+    "   ✅ Cleaner interface without clutter\n"
+    "   ✅ Professional looking titles\n"
+    "   ✅ No confusing timestamps\n"
+    "   ✅ Focus on relevant information\n"
+    "   ✅ Better visual hierarchy"
+)
+
 
 async def test_time_removal():
     """Test that time is removed from user-facing messages."""
-    print("🔍 Testing Time Removal from Messages...")
-    print("=" * 50)
+    p("🔍 Testing Time Removal from Messages...")
+    p("=" * 50)
 
     # Initialize database
     await init_db()
-    print("✅ Database initialized")
+    p("✅ Database initialized")
 
     # Test data - replace with actual Telegram ID
     test_telegram_id = 123456789  # Replace with your Telegram ID
 
     async def setup_coach_user(session):
         """Setup a coach user for testing."""
-        print(f"\n📊 Setting up coach user for Telegram ID: {test_telegram_id}")
+        p(f"\n📊 Setting up coach user for Telegram ID: {test_telegram_id}")
 
         # Get or create user
         user = await UserRepository.get_user_by_telegram_id(session, test_telegram_id)
 
         if not user:
-            print("📝 Creating test user...")
+            p("📝 Creating test user...")
             user = await UserRepository.create_user(
                 session,
                 telegram_id=test_telegram_id,
@@ -42,24 +122,24 @@ async def test_time_removal():
                 first_name="Test",
                 last_name="Coach",
             )
-            print(f"✅ Created user with ID: {user.id}")
+            p(f"✅ Created user with ID: {user.id}")
         else:
-            print(f"✅ Found user with ID: {user.id}")
+            p(f"✅ Found user with ID: {user.id}")
 
         # Make user a coach
         current_role = await UserRepository.get_user_role(session, user.id)
         if current_role != UserRole.COACH and current_role != UserRole.BOTH:
-            print("🔄 Making user a coach...")
+            p("🔄 Making user a coach...")
             await UserRepository.update_user_role(session, user.id, UserRole.COACH)
-            print("✅ User is now a coach")
+            p("✅ User is now a coach")
 
         return user.id
 
     user_id = await DatabaseManager.execute_with_session(setup_coach_user)
 
     # Test 1: Translation Keys Without Time
-    print("\n🧪 Test 1: Translation Keys Without Time")
-    print("=" * 40)
+    p("\n🧪 Test 1: Translation Keys Without Time")
+    p("=" * 40)
 
     # Import translator to test translations
     from easy_track.i18n import translator
@@ -74,72 +154,61 @@ async def test_time_removal():
         "commands.menu.title",
     ]
 
-    print("✅ Testing translation keys for time removal:")
-
-    for lang in ["en", "uk"]:
-        print(f"\n   Language: {lang}")
-        for key in test_keys:
-            try:
-                if key == "coach.dashboard.athletes_list":
-                    # This key still needs count parameter
-                    translation = translator.get(key, lang, count=5)
-                else:
-                    translation = translator.get(key, lang)
-
-                # Check if translation contains time patterns
-                time_patterns = [" - ", "Updated", "Оновлено", " {time}", "{time} "]
-                has_time = any(pattern in translation for pattern in time_patterns)
-
-                if has_time:
-                    print(f"   ❌ {key}: Contains time pattern - '{translation}'")
-                else:
-                    print(f"   ✅ {key}: Clean - '{translation}'")
-
-            except Exception as e:
-                print(f"   ❌ {key}: Error - {e}")
+    p("✅ Testing translation keys for time removal:")
+
+    async def check_key(lang, key):
+        """Return the report line for one (language, key) pair."""
+        try:
+            if key == "coach.dashboard.athletes_list":
+                # This key still needs count parameter
+                translation = translator.get(key, lang, count=5)
+            else:
+                translation = translator.get(key, lang)
+
+            # Check if translation contains time patterns
+            if _TIME_RE.search(translation) is not None:
+                return f"   ❌ {key}: Contains time pattern - '{translation}'"
+            return f"   ✅ {key}: Clean - '{translation}'"
+
+        except Exception as e:
+            return f"   ❌ {key}: Error - {e}"
+
+    # Independent checks; gather keeps the (language, key) order
+    languages = ["en", "uk"]
+    lines = await asyncio.gather(
+        *(check_key(lang, key) for lang in languages for key in test_keys)
+    )
+    for i, lang in enumerate(languages):
+        p(f"\n   Language: {lang}")
+        p("\n".join(lines[i * len(test_keys) : (i + 1) * len(test_keys)]))
 
     # Test 2: Coach Panel Title
-    print("\n🧪 Test 2: Coach Panel Title")
-    print("=" * 30)
-
-    print("✅ Expected behavior:")
-    expected_behaviors = [
-        "Panel title does not contain time",
-        "Title is clean and professional",
-        "No timestamp artifacts",
-        "Uses invisible Unicode characters for uniqueness",
-    ]
+    p("\n🧪 Test 2: Coach Panel Title")
+    p("=" * 30)
 
-    for behavior in expected_behaviors:
-        print(f"   ✅ {behavior}")
+    p("✅ Expected behavior:")
+    p(_PANEL_TITLE_EXPECTED)
 
     # Test panel titles
     for lang in ["en", "uk"]:
         title = translator.get("coach.panel.title", lang)
-        print(f"   {lang}: '{title}'")
+        p(f"   {lang}: '{title}'")
 
     # Test 3: Main Menu Title
-    print("\n🧪 Test 3: Main Menu Title")
-    print("=" * 30)
-
-    print("✅ Expected behavior:")
-    expected_behaviors = [
-        "Menu title does not contain time",
-        "Title is standard and clean",
-        "No timestamp artifacts",
-    ]
+    p("\n🧪 Test 3: Main Menu Title")
+    p("=" * 30)
 
-    for behavior in expected_behaviors:
-        print(f"   ✅ {behavior}")
+    p("✅ Expected behavior:")
+    p(_MENU_TITLE_EXPECTED)
 
     # Test menu titles
     for lang in ["en", "uk"]:
         title = translator.get("commands.menu.title", lang)
-        print(f"   {lang}: '{title}'")
+        p(f"   {lang}: '{title}'")
 
     # Test 4: Coach Functions Titles
-    print("\n🧪 Test 4: Coach Functions Titles")
-    print("=" * 35)
+    p("\n🧪 Test 4: Coach Functions Titles")
+    p("=" * 35)
 
     coach_functions = {
         "Athletes List": "coach.dashboard.athletes_list",
@@ -149,176 +218,139 @@ async def test_time_removal():
         "Notifications": "coach.notifications.settings_title",
     }
 
-    print("✅ Testing coach function titles:")
-
-    for function_name, key in coach_functions.items():
-        print(f"\n   {function_name}:")
-        for lang in ["en", "uk"]:
-            try:
-                if key == "coach.dashboard.athletes_list":
-                    translation = translator.get(key, lang, count=3)
-                else:
-                    translation = translator.get(key, lang)
-
-                # Check for time patterns
-                has_timestamp = any(
-                    pattern in translation for pattern in [" - ", "Updated", "Оновлено"]
-                )
-
-                if has_timestamp:
-                    print(f"     ❌ {lang}: Contains timestamp - '{translation}'")
-                else:
-                    print(f"     ✅ {lang}: Clean - '{translation}'")
-
-            except Exception as e:
-                print(f"     ❌ {lang}: Error - {e}")
+    p("✅ Testing coach function titles:")
+
+    async def check_function(key, lang):
+        """Return the report line for one coach function title."""
+        try:
+            if key == "coach.dashboard.athletes_list":
+                translation = translator.get(key, lang, count=3)
+            else:
+                translation = translator.get(key, lang)
+
+            # Check for time patterns
+            if _TIMESTAMP_RE.search(translation) is not None:
+                return f"     ❌ {lang}: Contains timestamp - '{translation}'"
+            return f"     ✅ {lang}: Clean - '{translation}'"
+
+        except Exception as e:
+            return f"     ❌ {lang}: Error - {e}"
+
+    lines = await asyncio.gather(
+        *(
+            check_function(key, lang)
+            for key in coach_functions.values()
+            for lang in languages
+        )
+    )
+    for i, function_name in enumerate(coach_functions):
+        p(f"\n   {function_name}:")
+        p("\n".join(lines[i * len(languages) : (i + 1) * len(languages)]))
 
     # Test 5: Valid Time Usage (Should Keep)
-    print("\n🧪 Test 5: Valid Time Usage (Should Keep)")
-    print("=" * 40)
-
-    valid_time_usage = [
-        "Notification times (HH:MM format)",
-        "Measurement dates and times",
-        "Schedule display times",
-        "Historical data timestamps",
-    ]
+    p("\n🧪 Test 5: Valid Time Usage (Should Keep)")
+    p("=" * 40)
 
-    print("✅ These time usages should be preserved:")
-    for usage in valid_time_usage:
-        print(f"   ✅ {usage}")
+    p("✅ These time usages should be preserved:")
+    p(_VALID_TIME_USAGE)
 
     # Test notification time formats
-    print("\n   Example valid time formats:")
-    print("     ✅ '📅 Daily at 09:00'")
-    print("     ✅ '📅 Every Monday at 18:30'")
-    print("     ✅ '📏 Weight: 70.5 kg (15/01/2025 14:25)'")
-    print("     ✅ '✅ 01/15 14:30 - John'")
+    p("\n   Example valid time formats:")
+    p("     ✅ '📅 Daily at 09:00'")
+    p("     ✅ '📅 Every Monday at 18:30'")
+    p("     ✅ '📏 Weight: 70.5 kg (15/01/2025 14:25)'")
+    p("     ✅ '✅ 01/15 14:30 - John'")
 
     # Test 6: What Was Removed
-    print("\n🧪 Test 6: What Was Removed")
-    print("=" * 30)
-
-    removed_time_patterns = [
-        "Panel title: '🎯 **Coach Panel** - 14:25'",
-        "Menu title: 'Main Menu - 14:25'",
-        "Athletes list: 'My Athletes (3) - Updated 14:25'",
-        "Progress title: 'Athletes Progress Overview - 14:25'",
-        "Stats title: 'Coach Statistics - 14:25'",
-        "Notifications: 'Coach Notification Settings - 14:25'",
-    ]
+    p("\n🧪 Test 6: What Was Removed")
+    p("=" * 30)
 
-    print("❌ These time patterns were removed:")
-    for pattern in removed_time_patterns:
-        print(f"   ❌ {pattern}")
+    p("❌ These time patterns were removed:")
+    p(_REMOVED_TIME_PATTERNS)
 
     # Test 7: Invisible Unicode Solution
-    print("\n🧪 Test 7: Invisible Unicode Solution")
-    print("=" * 40)
-
-    print("✅ Technical solution for 'message not modified' error:")
-    solution_details = [
-        "Uses zero-width space characters (U+200B)",
-        "Invisible to users",
-        "Creates unique message content",
-        "Random 0-3 characters appended",
-        "Prevents Telegram API errors",
-    ]
+    p("\n🧪 Test 7: Invisible Unicode Solution")
+    p("=" * 40)
 
-    for detail in solution_details:
-        print(f"   ✅ {detail}")
+    p("✅ Technical solution for 'message not modified' error:")
+    p(_SOLUTION_DETAILS)
 
     # Test Summary
-    print("\n📋 Test Summary")
-    print("=" * 20)
-
-    print("🔧 Changes made:")
-    changes = [
-        "Removed timestamps from panel titles",
-        "Removed timestamps from menu titles",
-        "Updated translation files",
-        "Implemented invisible Unicode solution",
-        "Preserved meaningful time information",
-    ]
-
-    for change in changes:
-        print(f"   ✅ {change}")
+    p("\n📋 Test Summary")
+    p("=" * 20)
 
-    print("\n🎯 User experience improvements:")
-    improvements = [
-        "Cleaner interface without clutter",
-        "Professional looking titles",
-        "No confusing timestamps",
-        "Focus on relevant information",
-        "Better visual hierarchy",
-    ]
+    p("🔧 Changes made:")
+    p(_CHANGES)
 
-    for improvement in improvements:
-        print(f"   ✅ {improvement}")
+    p("\n🎯 User experience improvements:")
+    p(_IMPROVEMENTS)
 
-    print("\n✅ Time removal test completed!")
+    p("\n✅ Time removal test completed!")
+    flush()
 
 
 async def test_message_uniqueness():
     """Test that messages can still be unique without visible timestamps."""
-    print("\n🔧 Testing Message Uniqueness Solution")
-    print("=" * 40)
+    p("\n🔧 Testing Message Uniqueness Solution")
+    p("=" * 40)
 
     import random
 
     from easy_track.i18n import translator
 
     # Simulate the invisible character approach
-    print("✅ Testing invisible Unicode solution:")
+    p("✅ Testing invisible Unicode solution:")
 
     base_text = translator.get("coach.panel.title", "uk")
-    print(f"   Base text: '{base_text}'")
+    p(f"   Base text: '{base_text}'")
 
     # Generate multiple unique versions
     unique_versions = []
     for i in range(5):
-        invisible_char = chr(0x200B) * random.randint(0, 3)
-        unique_text = base_text + invisible_char
+        unique_text = base_text + _ZWSP_SUFFIXES[random.getrandbits(2)]
         unique_versions.append(unique_text)
-        print(f"   Version {i+1}: '{unique_text}' (length: {len(unique_text)})")
+        p(f"   Version {i+1}: '{unique_text}' (length: {len(unique_text)})")
 
     # Check uniqueness
     unique_count = len(set(unique_versions))
-    print(f"\n   Generated {len(unique_versions)} versions, {unique_count} unique")
+    p(f"\n   Generated {len(unique_versions)} versions, {unique_count} unique")
 
     if unique_count > 1:
-        print("   ✅ Solution creates unique content")
+        p("   ✅ Solution creates unique content")
     else:
-        print("   ⚠️  Solution may need adjustment")
+        p("   ⚠️  Solution may need adjustment")
 
-    print("\n   Technical details:")
-    print("     • Zero-width space: U+200B")
-    print("     • Invisible to users")
-    print("     • Random 0-3 characters")
-    print("     • Prevents API errors")
+    p("\n   Technical details:")
+    p("     • Zero-width space: U+200B")
+    p("     • Invisible to users")
+    p("     • Random 0-3 characters")
+    p("     • Prevents API errors")
+    flush()
 
 
 if __name__ == "__main__":
-    print("🚀 EasySize Time Removal Test")
-    print("=" * 50)
+    p("🚀 EasySize Time Removal Test")
+    p("=" * 50)
 
     try:
         asyncio.run(test_time_removal())
         asyncio.run(test_message_uniqueness())
 
-        print("\n" + "=" * 50)
-        print("🎉 All time removal tests completed!")
-        print("\n📝 Manual Testing Steps:")
-        print("   1. Start bot: make docker-run")
-        print("   2. Use /menu as coach")
-        print("   3. Click '🎯 Coach Panel'")
-        print("   4. Verify no timestamps in title")
-        print("   5. Navigate to coach functions")
-        print("   6. Verify all titles are clean")
-        print("   7. Check in both languages")
+        p("\n" + "=" * 50)
+        p("🎉 All time removal tests completed!")
+        p("\n📝 Manual Testing Steps:")
+        p("   1. Start bot: make docker-run")
+        p("   2. Use /menu as coach")
+        p("   3. Click '🎯 Coach Panel'")
+        p("   4. Verify no timestamps in title")
+        p("   5. Navigate to coach functions")
+        p("   6. Verify all titles are clean")
+        p("   7. Check in both languages")
+        flush()
 
     except Exception as e:
-        print(f"❌ Error during test: {e}")
+        p(f"❌ Error during test: {e}")
+        flush()
         import traceback
 
         traceback.print_exc()
@@ -4,26 +4,41 @@ This script tests only the translation functionality for coach panel buttons and
 """
 
 import sys
-import os
+from pathlib import Path
 
 # Add the src directory to the Python path
-current_dir = os.path.dirname(os.path.abspath(__file__))
-project_root = os.path.dirname(current_dir)
-src_path = os.path.join(project_root, "src")
-sys.path.insert(0, src_path)
+SRC = str(Path(__file__).resolve().parent.parent / "src")
+if SRC not in sys.path:
+    sys.path.insert(0, SRC)
 
-from easy_track.i18n.translator import translator
+from easy_track.i18n.translator import LazyTranslation, translator
+
+# Buffer output and emit it with a single write per test instead of one
+# stdout write (and flush) per line.
+_out: list[str] = []
+
+
+def p(*args):
+    """Queue a line of output."""
+    _out.append(" ".join(map(str, args)))
+    _out.append("\n")
+
+
+def flush():
+    """Write all queued output to stdout at once."""
+    sys.stdout.write("".join(_out))
+    _out.clear()
 
 
 def test_coach_translations():
     """Test that all coach panel translations work correctly."""
-    print("🔍 Testing Coach Panel Translations (No Database)")
-    print("=" * 55)
+    p("🔍 Testing Coach Panel Translations (No Database)")
+    p("=" * 55)
 
     # Test translation keys for Ukrainian
     user_lang = "uk"
-    print(f"\n🇺🇦 Testing Ukrainian translations (lang: {user_lang})")
-    print("-" * 45)
+    p(f"\n🇺🇦 Testing Ukrainian translations (lang: {user_lang})")
+    p("-" * 45)
 
     # Test button translations that were fixed
     button_tests = [
@@ -71,7 +86,7 @@ def test_coach_translations():
         }
     ]
 
-    print("🔘 Testing button translations:")
+    p("🔘 Testing button translations:")
     all_passed = True
 
     for test in button_tests:
@@ -86,16 +101,16 @@ def test_coach_translations():
                 expected = test["expected"]
 
             if actual == expected:
-                print(f"  ✅ {test['description']}: '{actual}'")
+                p(f"  ✅ {test['description']}: '{actual}'")
             else:
-                print(f"  ❌ {test['description']}:")
-                print(f"      Key: {test['key']}")
-                print(f"      Expected: '{expected}'")
-                print(f"      Got:      '{actual}'")
+                p(f"  ❌ {test['description']}:")
+                p(f"      Key: {test['key']}")
+                p(f"      Expected: '{expected}'")
+                p(f"      Got:      '{actual}'")
                 all_passed = False
         except Exception as e:
-            print(f"  ❌ {test['description']}: ERROR - {e}")
-            print(f"      Key: {test['key']}")
+            p(f"  ❌ {test['description']}: ERROR - {e}")
+            p(f"      Key: {test['key']}")
             all_passed = False
 
     # Test message translations
@@ -117,28 +132,28 @@ def test_coach_translations():
         }
     ]
 
-    print("\n🔘 Testing message translations:")
+    p("\n🔘 Testing message translations:")
     for test in message_tests:
         try:
             actual = translator.get(test["key"], user_lang)
             expected = test["expected"]
 
             if actual.strip() == expected.strip():
-                print(f"  ✅ {test['description']}")
+                p(f"  ✅ {test['description']}")
             else:
-                print(f"  ❌ {test['description']}:")
-                print(f"      Key: {test['key']}")
-                print(f"      Expected: '{expected}'")
-                print(f"      Got:      '{actual}'")
+                p(f"  ❌ {test['description']}:")
+                p(f"      Key: {test['key']}")
+                p(f"      Expected: '{expected}'")
+                p(f"      Got:      '{actual}'")
                 all_passed = False
         except Exception as e:
-            print(f"  ❌ {test['description']}: ERROR - {e}")
-            print(f"      Key: {test['key']}")
+            p(f"  ❌ {test['description']}: ERROR - {e}")
+            p(f"      Key: {test['key']}")
             all_passed = False
 
     # Test English translations for comparison
-    print(f"\n🇺🇸 Testing English translations (lang: en)")
-    print("-" * 45)
+    p(f"\n🇺🇸 Testing English translations (lang: en)")
+    p("-" * 45)
 
     english_tests = [
         {
@@ -158,32 +173,33 @@ def test_coach_translations():
         }
     ]
 
-    print("🔘 Testing English button translations:")
+    p("🔘 Testing English button translations:")
     for test in english_tests:
         try:
             actual = translator.get(test["key"], "en")
             expected = test["expected"]
 
             if actual == expected:
-                print(f"  ✅ {test['description']}: '{actual}'")
+                p(f"  ✅ {test['description']}: '{actual}'")
             else:
-                print(f"  ❌ {test['description']}:")
-                print(f"      Key: {test['key']}")
-                print(f"      Expected: '{expected}'")
-                print(f"      Got:      '{actual}'")
+                p(f"  ❌ {test['description']}:")
+                p(f"      Key: {test['key']}")
+                p(f"      Expected: '{expected}'")
+                p(f"      Got:      '{actual}'")
                 all_passed = False
         except Exception as e:
-            print(f"  ❌ {test['description']}: ERROR - {e}")
-            print(f"      Key: {test['key']}")
+            p(f"  ❌ {test['description']}: ERROR - {e}")
+            p(f"      Key: {test['key']}")
             all_passed = False
 
+    flush()
     return all_passed
 
 
 def test_fixed_issues():
     """Test specific issues that were fixed."""
-    print(f"\n🔧 Testing Fixed Issues")
-    print("-" * 25)
+    p(f"\n🔧 Testing Fixed Issues")
+    p("-" * 25)
 
     issues_fixed = [
         "✅ Hardcoded 'Back to Coach Panel' → translated button",
@@ -194,9 +210,9 @@ def test_fixed_issues():
     ]
 
     for issue in issues_fixed:
-        print(f"  {issue}")
+        p(f"  {issue}")
 
-    print(f"\n🎯 Key Changes Made:")
+    p(f"\n🎯 Key Changes Made:")
     changes = [
         "• bot.py line 640: Added translator.get('buttons.back_to_coach_panel')",
         "• bot.py line 665: Added translator.get('buttons.back_to_coach_panel')",
@@ -209,70 +225,74 @@ def test_fixed_issues():
     ]
 
     for change in changes:
-        print(f"  {change}")
+        p(f"  {change}")
+
+    flush()
 
 
 def simulate_user_experience():
     """Simulate the user experience with translations."""
-    print(f"\n🎭 Simulating User Experience")
-    print("-" * 35)
+    p(f"\n🎭 Simulating User Experience")
+    p("-" * 35)
 
     user_lang = "uk"
 
     scenarios = [
         {
             "step": "1. User opens coach panel",
-            "translation": translator.get("coach.panel.title", user_lang),
+            "translation": LazyTranslation("coach.panel.title", user_lang),
             "expected_contains": "Панель тренера"
         },
         {
             "step": "2. User clicks 'My Athletes'",
-            "translation": translator.get("coach.buttons.my_athletes", user_lang),
+            "translation": LazyTranslation("coach.buttons.my_athletes", user_lang),
             "expected_contains": "Мої спортсмени"
         },
         {
             "step": "3. User sees athlete 'Іван' button",
-            "translation": translator.get("coach.buttons.view_athlete_details", user_lang, name="Іван"),
+            "translation": LazyTranslation("coach.buttons.view_athlete_details", user_lang, name="Іван"),
             "expected_contains": "Деталі Іван"
         },
         {
             "step": "4. User wants to go back",
-            "translation": translator.get("buttons.back_to_coach_panel", user_lang),
+            "translation": LazyTranslation("buttons.back_to_coach_panel", user_lang),
             "expected_contains": "Назад до панелі тренера"
         },
         {
             "step": "5. User wants to cancel action",
-            "translation": translator.get("buttons.cancel", user_lang),
+            "translation": LazyTranslation("buttons.cancel", user_lang),
             "expected_contains": "Скасувати"
         }
     ]
 
-    print("🎮 User journey simulation:")
+    p("🎮 User journey simulation:")
     all_scenarios_passed = True
 
     for scenario in scenarios:
         try:
-            translation = scenario["translation"]
+            # Resolved only now, when the scenario is actually checked
+            translation = str(scenario["translation"])
             expected = scenario["expected_contains"]
 
             if expected in translation:
-                print(f"  ✅ {scenario['step']}")
-                print(f"      Shows: '{translation}'")
+                p(f"  ✅ {scenario['step']}")
+                p(f"      Shows: '{translation}'")
             else:
-                print(f"  ❌ {scenario['step']}")
-                print(f"      Expected to contain: '{expected}'")
-                print(f"      Got: '{translation}'")
+                p(f"  ❌ {scenario['step']}")
+                p(f"      Expected to contain: '{expected}'")
+                p(f"      Got: '{translation}'")
                 all_scenarios_passed = False
         except Exception as e:
-            print(f"  ❌ {scenario['step']}: ERROR - {e}")
+            p(f"  ❌ {scenario['step']}: ERROR - {e}")
             all_scenarios_passed = False
 
+    flush()
     return all_scenarios_passed
 
 
 if __name__ == "__main__":
-    print("🚀 EasySize Coach Panel Translation Test")
-    print("=" * 50)
+    p("🚀 EasySize Coach Panel Translation Test")
+    p("=" * 50)
 
     try:
         # Test translations
@@ -285,44 +305,46 @@ if __name__ == "__main__":
         scenarios_passed = simulate_user_experience()
 
         # Summary
-        print(f"\n📊 Test Results Summary")
-        print("=" * 30)
+        p(f"\n📊 Test Results Summary")
+        p("=" * 30)
 
         if translations_passed and scenarios_passed:
-            print("🎉 ✅ ALL TESTS PASSED!")
-            print("\n🏆 Successfully Fixed Issues:")
-            print("  • Coach athlete selection buttons now show Ukrainian text")
-            print("  • 'Back to Coach Panel' buttons properly translated")
-            print("  • 'Cancel' buttons use Ukrainian translation")
-            print("  • Athlete detail buttons use formatted Ukrainian text")
-            print("  • Remove athlete selection uses Ukrainian messages")
-            print("  • Consistent user experience in Ukrainian language")
-
-            print("\n🎯 Before vs After:")
-            print("  ❌ Before: 'Back to Coach Panel' (hardcoded English)")
-            print("  ✅ After:  '🔙 Назад до панелі тренера' (translated)")
-            print("  ❌ Before: '📊 {name}' (hardcoded format)")
-            print("  ✅ After:  '📊 Деталі {name}' (translated format)")
-            print("  ❌ Before: 'Cancel' (hardcoded English)")
-            print("  ✅ After:  '❌ Скасувати' (translated)")
+            p("🎉 ✅ ALL TESTS PASSED!")
+            p("\n🏆 Successfully Fixed Issues:")
+            p("  • Coach athlete selection buttons now show Ukrainian text")
+            p("  • 'Back to Coach Panel' buttons properly translated")
+            p("  • 'Cancel' buttons use Ukrainian translation")
+            p("  • Athlete detail buttons use formatted Ukrainian text")
+            p("  • Remove athlete selection uses Ukrainian messages")
+            p("  • Consistent user experience in Ukrainian language")
+
+            p("\n🎯 Before vs After:")
+            p("  ❌ Before: 'Back to Coach Panel' (hardcoded English)")
+            p("  ✅ After:  '🔙 Назад до панелі тренера' (translated)")
+            p("  ❌ Before: '📊 {name}' (hardcoded format)")
+            p("  ✅ After:  '📊 Деталі {name}' (translated format)")
+            p("  ❌ Before: 'Cancel' (hardcoded English)")
+            p("  ✅ After:  '❌ Скасувати' (translated)")
 
         else:
-            print("⚠️ ❌ SOME TESTS FAILED!")
+            p("⚠️ ❌ SOME TESTS FAILED!")
             if not translations_passed:
-                print("  • Translation tests failed")
+                p("  • Translation tests failed")
             if not scenarios_passed:
-                print("  • User scenario tests failed")
-
-        print(f"\n📝 Next Steps:")
-        print("   1. Start the bot: make docker-run")
-        print("   2. Set language to Ukrainian: /language")
-        print("   3. Become a coach: /become_coach")
-        print("   4. Open menu: /menu")
-        print("   5. Click '🎯 Панель тренера'")
-        print("   6. Verify all buttons show Ukrainian text")
-        print("   7. Test athlete selection and back navigation")
+                p("  • User scenario tests failed")
+
+        p(f"\n📝 Next Steps:")
+        p("   1. Start the bot: make docker-run")
+        p("   2. Set language to Ukrainian: /language")
+        p("   3. Become a coach: /become_coach")
+        p("   4. Open menu: /menu")
+        p("   5. Click '🎯 Панель тренера'")
+        p("   6. Verify all buttons show Ukrainian text")
+        p("   7. Test athlete selection and back navigation")
+        flush()
 
     except Exception as e:
-        print(f"❌ Test failed with error: {e}")
+        p(f"❌ Test failed with error: {e}")
+        flush()
         import traceback
         traceback.print_exc()
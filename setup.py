@@ -5,7 +5,7 @@ Setup script for EasySize - Telegram Bot for Body Measurement Tracking
 
 from pathlib import Path
 
-from setuptools import find_packages, setup
+from setuptools import setup
 
 # Read the README file
 this_directory = Path(__file__).parent
@@ -20,10 +20,20 @@ requirements = []
 requirements_file = this_directory / "requirements.txt"
 if requirements_file.exists():
     requirements = [
-        req.strip()
-        for req in requirements_file.read_text().strip().split("\n")
-        if req.strip() and not req.startswith("#")
+        req
+        for req in (
+            line.split("#", 1)[0].strip()
+            for line in requirements_file.read_text(encoding="utf-8").splitlines()
+        )
+        if req
     ]
+    try:
+        from packaging.requirements import Requirement
+    except ImportError:
+        pass
+    else:
+        # Validate specifiers and keep any environment markers intact
+        requirements = [str(Requirement(req)) for req in requirements]
 
 # Package metadata
 setup(
@@ -36,7 +46,9 @@ setup(
     long_description_content_type="text/markdown",
     url="https://github.com/yourusername/easy-track",
     package_dir={"": "src"},
-    packages=find_packages(where="src"),
+    # Explicit list instead of a find_packages() scan; `make regen-packages`
+    # rewrites it after adding or removing a package
+    packages=["easy_track", "easy_track.i18n"],
     classifiers=[
         "Development Status :: 5 - Production/Stable",
         "Intended Audience :: End Users/Desktop",
@@ -67,6 +79,12 @@ setup(
             "pytest-cov>=4.0.0",
             "factory-boy>=3.2.0",
         ],
+        "speedups": [
+            "orjson>=3.9.0",
+        ],
+        "redis": [
+            "redis>=5.0.0",
+        ],
     },
     entry_points={
         "console_scripts": [
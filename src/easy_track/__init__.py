@@ -5,43 +5,60 @@ A powerful and scalable Telegram bot for athletes to track their body measuremen
 with a clean database design and modern async architecture.
 """
 
+import importlib
+
 __version__ = "1.0.0"
 __author__ = "EasySize Team"
 __email__ = "contact@EasySize.bot"
 __description__ = "Telegram bot for tracking body measurements"
 
-# Package metadata
-__all__ = [
+# Public API: package metadata plus the main components below
+__all__ = (
     "__author__",
     "__description__",
     "__email__",
     "__version__",
-]
-
-# Import main components for easy access
-from .database import DatabaseManager, close_db, init_db
-from .models import Base, Measurement, MeasurementType, User, UserMeasurementType
-from .repositories import (
-    MeasurementRepository,
-    MeasurementTypeRepository,
-    UserMeasurementTypeRepository,
-    UserRepository,
+    "Base",
+    "DatabaseManager",
+    "Measurement",
+    "MeasurementRepository",
+    "MeasurementType",
+    "MeasurementTypeRepository",
+    "User",
+    "UserMeasurementType",
+    "UserMeasurementTypeRepository",
+    "UserRepository",
+    "close_db",
+    "init_db",
 )
 
-# Make key components available at package level
-__all__.extend(
-    [
-        "Base",
-        "DatabaseManager",
-        "Measurement",
-        "MeasurementRepository",
-        "MeasurementType",
-        "MeasurementTypeRepository",
-        "User",
-        "UserMeasurementType",
-        "UserMeasurementTypeRepository",
-        "UserRepository",
-        "close_db",
-        "init_db",
-    ]
-)
+# Main components, imported on first attribute access (PEP 562) so that
+# e.g. ``easy_track.i18n`` can be used without loading SQLAlchemy
+_LAZY = {
+    "DatabaseManager": "database",
+    "close_db": "database",
+    "init_db": "database",
+    "Base": "models",
+    "Measurement": "models",
+    "MeasurementType": "models",
+    "User": "models",
+    "UserMeasurementType": "models",
+    "MeasurementRepository": "repositories",
+    "MeasurementTypeRepository": "repositories",
+    "UserMeasurementTypeRepository": "repositories",
+    "UserRepository": "repositories",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    # Cache on the module so later lookups skip this hook
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
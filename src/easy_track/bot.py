@@ -3,11 +3,16 @@ import logging
 import os
 import re
 from datetime import UTC, datetime, time
+from functools import lru_cache
+from time import monotonic
+from urllib.parse import urlsplit
 
 from aiogram import Bot, Dispatcher, F, types
 from aiogram.filters import Command, StateFilter
+from aiogram.filters.callback_data import CallbackData
 from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import State, StatesGroup
+from aiogram.fsm.storage.base import BaseStorage
 from aiogram.fsm.storage.memory import MemoryStorage
 from aiogram.types import (
     CallbackQuery,
@@ -16,12 +21,15 @@ from aiogram.types import (
     Message,
 )
 from aiogram.utils.keyboard import InlineKeyboardBuilder
+from aiogram.webhook.aiohttp_server import SimpleRequestHandler, setup_application
+from aiohttp import web
 from dotenv import load_dotenv
 
 from .coach_notification_repository import CoachNotificationRepository
 from .coach_repository import AthleteCoachRequestRepository, CoachAthleteRepository
-from .database import DatabaseManager, close_db, init_db
+from .database import DatabaseManager, close_db, detached_context, init_db
 from .i18n import translator
+from .middlewares import DbSessionMiddleware
 from .models import CoachNotificationType, UserRole
 from .permissions import PermissionManager
 from .repositories import (
@@ -33,19 +41,20 @@ from .repositories import (
 )
 from .scheduler import get_scheduler, set_scheduler
 
-# Load environment variables
-load_dotenv()
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
 logger = logging.getLogger(__name__)
 
-# Bot configuration
-BOT_TOKEN = os.getenv("BOT_TOKEN")
-if not BOT_TOKEN:
-    raise ValueError("BOT_TOKEN environment variable is required")
+
+def configure() -> None:
+    """Load environment variables and set up logging.
+
+    Called by the entry point rather than at import, so importing this module
+    has no side effects. basicConfig is a no-op if logging is already set up.
+    """
+    load_dotenv()
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
 
 
 def escape_markdown(text: str) -> str:
@@ -78,6 +87,21 @@ def escape_markdown(text: str) -> str:
     return text
 
 
+def _fmt_dt_long(dt: datetime) -> str:
+    """Format dt as YYYY-MM-DD HH:MM without going through strftime."""
+    return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} {dt.hour:02d}:{dt.minute:02d}"
+
+
+def _fmt_dt_short(dt: datetime) -> str:
+    """Format dt as MM/DD HH:MM without going through strftime."""
+    return f"{dt.month:02d}/{dt.day:02d} {dt.hour:02d}:{dt.minute:02d}"
+
+
+def display_name(user) -> str:
+    """Return the name to show for a user: first name, username or "Unknown"."""
+    return user.first_name or user.username or "Unknown"
+
+
 async def safe_send_message(
     bot_instance, chat_id, text, reply_markup=None, parse_mode="Markdown"
 ):
@@ -115,6 +139,96 @@ async def safe_send_message(
             raise e
 
 
+# Per-process cache of telegram_id -> (language, expiry). Languages change
+# only through handle_set_language, which writes the new value through.
+# The write-through only reaches the worker that handled the change: with
+# several workers (REDIS_URL / webhook deployments) the others keep serving
+# the old language until their entry expires, i.e. for up to the TTL.
+LANGUAGE_CACHE_TTL = 300  # seconds
+LANGUAGE_CACHE_MAX_SIZE = 10_000
+_language_cache: dict[int, tuple[str, float]] = {}
+# telegram_id -> user ID; users are never deleted, so entries never go stale
+_user_id_cache: dict[int, int] = {}
+
+
+def cache_user_language(telegram_id: int, language: str) -> None:
+    """Remember a user's language for LANGUAGE_CACHE_TTL seconds."""
+    if len(_language_cache) >= LANGUAGE_CACHE_MAX_SIZE:
+        _language_cache.clear()
+    _language_cache[telegram_id] = (language, monotonic() + LANGUAGE_CACHE_TTL)
+
+
+def cache_user(telegram_id: int, user_id: int, language: str) -> None:
+    """Remember a user's ID and language."""
+    if len(_user_id_cache) >= LANGUAGE_CACHE_MAX_SIZE:
+        _user_id_cache.clear()
+    _user_id_cache[telegram_id] = user_id
+    cache_user_language(telegram_id, language)
+
+
+def get_cached_language(telegram_id: int) -> str | None:
+    """Return the cached language if it has not expired."""
+    cached = _language_cache.get(telegram_id)
+    if cached is not None and cached[1] > monotonic():
+        return cached[0]
+    return None
+
+
+# user_id -> (is coach, expiry) for menus that only decide which buttons to
+# show. Role changes write through; actions still check inside their session.
+# Like the language cache this is per process: after a role change, other
+# workers may show the old menu buttons for up to LANGUAGE_CACHE_TTL.
+_coach_cache: dict[int, tuple[bool, float]] = {}
+
+
+def cache_coach_status(user_id: int, is_coach: bool) -> None:
+    """Remember whether a user is a coach for LANGUAGE_CACHE_TTL seconds."""
+    if len(_coach_cache) >= LANGUAGE_CACHE_MAX_SIZE:
+        _coach_cache.clear()
+    _coach_cache[user_id] = (is_coach, monotonic() + LANGUAGE_CACHE_TTL)
+
+
+# Strong references to fire-and-forget tasks; the event loop only keeps weak
+# ones, so an unreferenced task can be garbage-collected mid-flight.
+_background_tasks: set[asyncio.Task] = set()
+
+
+def spawn_background(coro) -> asyncio.Task:
+    """Schedule a coroutine and keep it alive until it finishes."""
+    # The task may outlive the update, so it must not use its shared session
+    task = asyncio.create_task(coro, context=detached_context())
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
+
+
+async def _call_later(delay: float, func, *args) -> None:
+    """Await func(*args) after delay seconds."""
+    await asyncio.sleep(delay)
+    await func(*args)
+
+
+def refresh_later(delay: float, func, *args) -> asyncio.Task:
+    """Show a follow-up screen after a pause without holding up the handler.
+
+    Used to leave a confirmation visible for a moment before it is replaced.
+    """
+    return spawn_background(_call_later(delay, func, *args))
+
+
+# Zero-width space, appended to make re-sent message text differ
+ZWSP = "\u200b"
+
+# Telegram's error text when an edit would leave the message unchanged
+MESSAGE_NOT_MODIFIED_RE = re.compile(r"message is not modified", re.IGNORECASE)
+
+
+def is_message_not_modified(error: Exception) -> bool:
+    """Check whether an edit failed only because the content is unchanged."""
+    # Case-insensitive search without allocating a lowercased copy
+    return MESSAGE_NOT_MODIFIED_RE.search(str(error)) is not None
+
+
 async def safe_edit_message(
     message,
     text,
@@ -136,7 +250,7 @@ async def safe_edit_message(
             try:
                 return await message.edit_text(text=text, reply_markup=reply_markup)
             except Exception as inner_e:
-                if "message is not modified" in str(inner_e).lower() and callback:
+                if is_message_not_modified(inner_e) and callback:
                     # Message content is the same, show refresh confirmation
                     await callback.answer(
                         translator.get("common.data_refreshed", user_lang)
@@ -147,7 +261,7 @@ async def safe_edit_message(
                         f"Failed to edit message even without markdown: {inner_e}"
                     )
                     raise inner_e
-        elif "message is not modified" in str(e).lower() and callback:
+        elif is_message_not_modified(e) and callback:
             # Message content is the same, show refresh confirmation
             await callback.answer(translator.get("common.data_refreshed", user_lang))
             return None
@@ -155,10 +269,35 @@ async def safe_edit_message(
             raise e
 
 
-# Initialize bot and dispatcher
-bot = Bot(token=BOT_TOKEN)
-storage = MemoryStorage()
-dp = Dispatcher(storage=storage)
+def create_bot() -> Bot:
+    """Create the bot from the BOT_TOKEN environment variable."""
+    bot_token = os.getenv("BOT_TOKEN")
+    if not bot_token:
+        raise ValueError("BOT_TOKEN environment variable is required")
+    return Bot(token=bot_token)
+
+
+def create_storage() -> BaseStorage:
+    """Create FSM storage: Redis when REDIS_URL is set, in-memory otherwise.
+
+    Redis lets several bot processes share FSM state.
+    """
+    redis_url = os.getenv("REDIS_URL")
+    if not redis_url:
+        return MemoryStorage()
+
+    # Needs the "redis" extra
+    from aiogram.fsm.storage.redis import DefaultKeyBuilder, RedisStorage
+
+    return RedisStorage.from_url(
+        redis_url, key_builder=DefaultKeyBuilder(with_bot_id=True)
+    )
+
+
+# The bot is created by main() once the environment is loaded; the dispatcher
+# gets its configured storage there as well
+bot: Bot | None = None
+dp = Dispatcher()
 
 
 class UserStates(StatesGroup):
@@ -179,6 +318,297 @@ class UserStates(StatesGroup):
     responding_to_coach_request = State()
 
 
+class LanguageCallback(CallbackData, prefix="lang"):
+    code: str
+
+
+class AthleteCallback(CallbackData, prefix="athlete"):
+    action: str  # "view" or "remove"
+    id: int
+
+
+@lru_cache(maxsize=256)
+def _build_main_menu_markup(
+    user_lang: str, is_coach: bool, pending_count: int
+) -> InlineKeyboardMarkup:
+    """Build the main menu keyboard; cached, as it only varies by these inputs."""
+    keyboard = InlineKeyboardBuilder()
+    keyboard.add(
+        InlineKeyboardButton(
+            text=translator.get("buttons.add_measurement", user_lang),
+            callback_data="add_measurement",
+        ),
+        InlineKeyboardButton(
+            text=translator.get("buttons.manage_types", user_lang),
+            callback_data="manage_types",
+        ),
+        InlineKeyboardButton(
+            text=translator.get("buttons.view_progress", user_lang),
+            callback_data="view_progress",
+        ),
+        InlineKeyboardButton(
+            text=translator.get("buttons.view_by_date", user_lang),
+            callback_data="view_by_date",
+        ),
+        InlineKeyboardButton(
+            text=translator.get("buttons.statistics", user_lang),
+            callback_data="statistics",
+        ),
+        InlineKeyboardButton(
+            text=translator.get("buttons.notifications", user_lang),
+            callback_data="notifications",
+        ),
+    )
+
+    if pending_count:
+        keyboard.add(
+            InlineKeyboardButton(
+                text=translator.get("buttons.coach_requests", user_lang)
+                + f" ({pending_count})",
+                callback_data="coach_requests",
+            ),
+        )
+
+    # Add coach options if user is a coach
+    if is_coach:
+        keyboard.add(
+            InlineKeyboardButton(
+                text=translator.get("coach.buttons.coach_panel", user_lang),
+                callback_data="coach_panel",
+            ),
+        )
+    else:
+        # Add "Become Coach" button for regular users
+        keyboard.add(
+            InlineKeyboardButton(
+                text=translator.get("coach.buttons.become_coach", user_lang),
+                callback_data="become_coach_callback",
+            ),
+        )
+
+    keyboard.add(
+        InlineKeyboardButton(
+            text=translator.get("buttons.language_settings", user_lang),
+            callback_data="language_settings",
+        ),
+    )
+    keyboard.adjust(2)
+    return keyboard.as_markup()
+
+
+# (translation key, callback data) for each coach panel button, in order
+COACH_PANEL_BUTTONS = (
+    ("coach.buttons.my_athletes", "coach_athletes"),
+    ("coach.buttons.athletes_progress", "view_all_athletes_progress"),
+    ("coach.buttons.coach_notifications", "coach_notifications"),
+    ("coach.buttons.coach_stats", "coach_stats"),
+    ("coach.buttons.coach_guide", "coach_guide"),
+    ("coach.buttons.cancel_coaching", "cancel_coaching_confirm"),
+    ("buttons.back_to_menu", "back_to_menu"),
+)
+
+
+# (name key, description key) for each coach notification type
+COACH_NOTIFICATION_TYPE_KEYS = {
+    notification_type: (
+        f"coach.notifications.types.{notification_type.value}.name",
+        f"coach.notifications.types.{notification_type.value}.description",
+    )
+    for notification_type in CoachNotificationType
+}
+
+# Callback data carries the enum value; a dict lookup avoids the Enum call
+COACH_NOTIFICATION_TYPES_BY_VALUE = {
+    notification_type.value: notification_type
+    for notification_type in CoachNotificationType
+}
+
+
+@lru_cache(maxsize=8)
+def _coach_notification_type_texts(
+    user_lang: str,
+) -> dict[CoachNotificationType, tuple[str, str]]:
+    """Return (name, description) per coach notification type in a language."""
+    texts = iter(
+        translator.get_many(
+            [key for keys in COACH_NOTIFICATION_TYPE_KEYS.values() for key in keys],
+            user_lang,
+        )
+    )
+    return {
+        notification_type: (next(texts), next(texts))
+        for notification_type in COACH_NOTIFICATION_TYPE_KEYS
+    }
+
+
+@lru_cache(maxsize=8)
+def _build_back_to_coach_panel_markup(user_lang: str) -> InlineKeyboardMarkup:
+    """Build the single "back to coach panel" keyboard for a language."""
+    text = translator.get("buttons.back_to_coach_panel", user_lang)
+    return InlineKeyboardMarkup(
+        inline_keyboard=[[InlineKeyboardButton(text=text, callback_data="coach_panel")]]
+    )
+
+
+@lru_cache(maxsize=8)
+def _build_coach_panel_markup(user_lang: str) -> InlineKeyboardMarkup:
+    """Build the coach panel keyboard; cached, as it only varies by language."""
+    labels = translator.get_many([key for key, _ in COACH_PANEL_BUTTONS], user_lang)
+    keyboard = InlineKeyboardBuilder()
+    keyboard.add(
+        *(
+            InlineKeyboardButton(text=label, callback_data=callback_data)
+            for label, (_, callback_data) in zip(
+                labels, COACH_PANEL_BUTTONS, strict=True
+            )
+        )
+    )
+    keyboard.adjust(2, 1, 1)
+    return keyboard.as_markup()
+
+
+def _build_request_response_markup(
+    user_lang: str, request_id: int, with_back: bool = False
+) -> InlineKeyboardMarkup:
+    """Build the accept/reject keyboard for a coach request.
+
+    The layout is fixed, so rows are assembled directly rather than through
+    InlineKeyboardBuilder; labels come from the translator's cache.
+    """
+    accept, reject, back = translator.get_many(
+        ("coach.requests.accept", "coach.requests.reject", "buttons.back_to_menu"),
+        user_lang,
+    )
+    rows = [
+        [
+            InlineKeyboardButton(
+                text=accept, callback_data=f"accept_request_{request_id}"
+            ),
+            InlineKeyboardButton(
+                text=reject, callback_data=f"reject_request_{request_id}"
+            ),
+        ]
+    ]
+    if with_back:
+        rows.append([InlineKeyboardButton(text=back, callback_data="back_to_menu")])
+    return InlineKeyboardMarkup(inline_keyboard=rows)
+
+
+async def _check_and_get_athletes(session, user_id: int):
+    """Return the coach's athletes, or None if the user is not a coach."""
+    is_coach = await PermissionManager.check_coach_permission(session, user_id)
+    if not is_coach:
+        return None
+    return await CoachAthleteRepository.get_coach_athletes(session, user_id)
+
+
+async def _check_and_get_athletes_with_last_dates(session, user_id: int):
+    """Return (athletes, last measurement dates), or (None, {}) for non-coaches."""
+    is_coach = await PermissionManager.check_coach_permission(session, user_id)
+    if not is_coach:
+        return None, {}
+    athletes = await CoachAthleteRepository.get_coach_athletes(session, user_id)
+    last_dates = await MeasurementRepository.get_last_measurement_dates(
+        session, [athlete.id for athlete in athletes]
+    )
+    return athletes, last_dates
+
+
+async def _update_to_coach(session, user_id: int):
+    """Give the user coach rights, keeping athlete ones, and return the new role."""
+    current_role = await UserRepository.get_user_role(session, user_id)
+    if current_role == UserRole.ATHLETE:
+        new_role = UserRole.BOTH  # Keep athlete capabilities
+    else:
+        new_role = UserRole.COACH
+
+    await UserRepository.update_user_role(session, user_id, new_role)
+    return new_role
+
+
+async def _get_requests(session, user_id: int):
+    """Return the athlete's pending coach requests."""
+    return await AthleteCoachRequestRepository.get_athlete_pending_requests(
+        session, user_id
+    )
+
+
+async def _remove_athlete(session, user_id: int, athlete_id: int):
+    """Unlink athlete_id from the coach; return (success, athlete) or False."""
+    is_coach = await PermissionManager.check_coach_permission(session, user_id)
+    if not is_coach:
+        return False
+
+    # Get athlete info before removing
+    athlete = await UserRepository.get_user_by_id(session, athlete_id)
+    if not athlete:
+        return False
+
+    # Remove relationship
+    success = await CoachAthleteRepository.remove_athlete_from_coach(
+        session, user_id, athlete_id
+    )
+    return (success, athlete)
+
+
+async def _check_coach_and_get_preferences(session, user_id: int):
+    """Return the coach's notification preferences, creating the defaults."""
+    is_coach = await PermissionManager.check_coach_permission(session, user_id)
+    if not is_coach:
+        return None
+
+    # Initialize default preferences if none exist
+    preferences = await CoachNotificationRepository.get_coach_notification_preferences(
+        session, user_id
+    )
+    if not preferences:
+        preferences = await CoachNotificationRepository.initialize_default_preferences(
+            session, user_id
+        )
+
+    return preferences
+
+
+async def _toggle_preference(
+    session, user_id: int, notification_type: CoachNotificationType
+):
+    """Flip one notification preference; return the new state or None."""
+    is_coach = await PermissionManager.check_coach_permission(session, user_id)
+    if not is_coach:
+        logger.warning(
+            f"User {user_id} attempted to toggle notification without coach permissions"
+        )
+        return None  # Return None to indicate permission error
+
+    current_pref = await CoachNotificationRepository.get_notification_preference(
+        session, user_id, notification_type
+    )
+
+    current_enabled = current_pref.is_enabled if current_pref else True
+    new_enabled = not current_enabled
+
+    logger.debug(
+        f"Toggling notification {notification_type} for coach {user_id}: {current_enabled} -> {new_enabled}"
+    )
+
+    await CoachNotificationRepository.create_notification_preference(
+        session, user_id, notification_type, new_enabled
+    )
+
+    return new_enabled  # Return the boolean value (True/False)
+
+
+async def _get_history(session, user_id: int):
+    """Return the coach's notification history, or None for non-coaches."""
+    is_coach = await PermissionManager.check_coach_permission(session, user_id)
+    if not is_coach:
+        return None
+    # Only the latest 10 are shown
+    return await CoachNotificationRepository.get_coach_notification_history(
+        session, user_id, limit=10
+    )
+
+
 class BotHandlers:
     """Main bot handlers class."""
 
@@ -188,26 +618,95 @@ class BotHandlers:
         user_lang = await BotHandlers.get_user_language(user_id)
         return translator.get("common.error", user_lang)
 
+    @staticmethod
+    async def get_error_message_by_telegram_id(telegram_id: int) -> str:
+        """Get localized error message without creating the user."""
+        user_lang = await BotHandlers.get_user_language_by_telegram_id(telegram_id)
+        return translator.get("common.error", user_lang)
+
+    @staticmethod
+    async def _get_or_create_user_in_session(session, telegram_user: types.User):
+        """Fetch the user for a Telegram account, creating it if needed."""
+        user = await UserRepository.get_user_by_telegram_id(session, telegram_user.id)
+        if not user:
+            user = await UserRepository.create_user(
+                session,
+                telegram_id=telegram_user.id,
+                username=telegram_user.username,
+                first_name=telegram_user.first_name,
+                last_name=telegram_user.last_name,
+            )
+        return user
+
     @staticmethod
     async def get_or_create_user(telegram_user: types.User) -> int:
         """Get or create user and return user ID."""
+        user_id = _user_id_cache.get(telegram_user.id)
+        if user_id is not None:
+            return user_id
 
         async def _get_or_create(session):
-            user = await UserRepository.get_user_by_telegram_id(
-                session, telegram_user.id
+            user = await BotHandlers._get_or_create_user_in_session(
+                session, telegram_user
             )
-            if not user:
-                user = await UserRepository.create_user(
-                    session,
-                    telegram_id=telegram_user.id,
-                    username=telegram_user.username,
-                    first_name=telegram_user.first_name,
-                    last_name=telegram_user.last_name,
-                )
+            cache_user(telegram_user.id, user.id, user.language)
             return user.id
 
         return await DatabaseManager.execute_with_session(_get_or_create)
 
+    @staticmethod
+    async def get_or_create_user_with_lang(
+        telegram_user: types.User,
+    ) -> tuple[int, str]:
+        """Get or create user and return (user ID, language) in one session."""
+        user_id = _user_id_cache.get(telegram_user.id)
+        user_lang = get_cached_language(telegram_user.id)
+        if user_id is not None and user_lang is not None:
+            return user_id, user_lang
+
+        async def _get_or_create(session):
+            user = await BotHandlers._get_or_create_user_in_session(
+                session, telegram_user
+            )
+            cache_user(telegram_user.id, user.id, user.language)
+            return user.id, user.language
+
+        return await DatabaseManager.execute_with_session(_get_or_create)
+
+    @staticmethod
+    async def execute_as_user(telegram_user: types.User, func, *args):
+        """Get or create the user and run func(session, user_id, *args).
+
+        Both happen in one session. Returns (user ID, language, result).
+        """
+
+        async def _execute(session):
+            user_id = _user_id_cache.get(telegram_user.id)
+            user_lang = get_cached_language(telegram_user.id)
+            if user_id is None or user_lang is None:
+                user = await BotHandlers._get_or_create_user_in_session(
+                    session, telegram_user
+                )
+                cache_user(telegram_user.id, user.id, user.language)
+                user_id, user_lang = user.id, user.language
+            return user_id, user_lang, await func(session, user_id, *args)
+
+        return await DatabaseManager.execute_with_session(_execute)
+
+    @staticmethod
+    async def is_user_coach_cached(user_id: int) -> bool:
+        """Check the coach role, reading the cache before the database."""
+        cached = _coach_cache.get(user_id)
+        if cached is not None and cached[1] > monotonic():
+            return cached[0]
+
+        async def _check_coach_role(session):
+            return await UserRepository.is_user_coach(session, user_id)
+
+        is_coach = bool(await DatabaseManager.execute_with_session(_check_coach_role))
+        cache_coach_status(user_id, is_coach)
+        return is_coach
+
     @staticmethod
     async def get_user_language(user_id: int) -> str:
         """Get user's language preference by user ID."""
@@ -221,9 +720,17 @@ class BotHandlers:
     @staticmethod
     async def get_user_language_by_telegram_id(telegram_id: int) -> str:
         """Get user's language preference by telegram ID."""
+        user_lang = get_cached_language(telegram_id)
+        if user_lang is not None:
+            return user_lang
 
         async def _get_language(session):
-            return await UserRepository.get_user_language(session, telegram_id)
+            user = await UserRepository.get_user_by_telegram_id(session, telegram_id)
+            if not user:
+                # Not cached: the row may be created with another default
+                return "uk"
+            cache_user(telegram_id, user.id, user.language)
+            return user.language
 
         return await DatabaseManager.execute_with_session(_get_language)
 
@@ -231,8 +738,9 @@ class BotHandlers:
     async def start_command(message: types.Message):
         """Handle /start command."""
         try:
-            user_id = await BotHandlers.get_or_create_user(message.from_user)
-            user_lang = await BotHandlers.get_user_language(user_id)
+            user_id, user_lang = await BotHandlers.get_or_create_user_with_lang(
+                message.from_user
+            )
 
             welcome_text = translator.get(
                 "commands.start.welcome", user_lang, name=message.from_user.first_name
@@ -245,100 +753,29 @@ class BotHandlers:
             logger.error(f"Error in start command: {e}")
             error_text = translator.get(
                 "commands.start.error",
-                (
-                    await BotHandlers.get_user_language(user_id)
-                    if "user_id" in locals()
-                    else "uk"
-                ),
+                user_lang if "user_lang" in locals() else "uk",
             )
             await message.answer(error_text)
 
     @staticmethod
     async def show_main_menu(message: types.Message):
         """Show main menu with options."""
-        user_id = await BotHandlers.get_or_create_user(message.from_user)
-        user_lang = await BotHandlers.get_user_language(user_id)
-
-        keyboard = InlineKeyboardBuilder()
-        keyboard.add(
-            InlineKeyboardButton(
-                text=translator.get("buttons.add_measurement", user_lang),
-                callback_data="add_measurement",
-            ),
-            InlineKeyboardButton(
-                text=translator.get("buttons.manage_types", user_lang),
-                callback_data="manage_types",
-            ),
-            InlineKeyboardButton(
-                text=translator.get("buttons.view_progress", user_lang),
-                callback_data="view_progress",
-            ),
-            InlineKeyboardButton(
-                text=translator.get("buttons.view_by_date", user_lang),
-                callback_data="view_by_date",
-            ),
-            InlineKeyboardButton(
-                text=translator.get("buttons.statistics", user_lang),
-                callback_data="statistics",
-            ),
-            InlineKeyboardButton(
-                text=translator.get("buttons.notifications", user_lang),
-                callback_data="notifications",
-            ),
+        user_id, user_lang = await BotHandlers.get_or_create_user_with_lang(
+            message.from_user
         )
 
-        # Check for pending coach requests
-        async def _get_pending_requests(session):
-            return await AthleteCoachRequestRepository.get_athlete_pending_requests(
-                session, user_id
-            )
+        # Coach role and pending coach requests come from one query
+        async def _get_menu_context(session):
+            return await UserRepository.get_menu_context(session, user_id)
 
-        pending_requests = await DatabaseManager.execute_with_session(
-            _get_pending_requests
+        is_coach, pending_count = await DatabaseManager.execute_with_session(
+            _get_menu_context
         )
-
-        if pending_requests:
-            keyboard.add(
-                InlineKeyboardButton(
-                    text=translator.get("buttons.coach_requests", user_lang)
-                    + f" ({len(pending_requests)})",
-                    callback_data="coach_requests",
-                ),
-            )
-
-        # Add coach options if user is a coach
-        async def _check_coach_role(session):
-            return await UserRepository.is_user_coach(session, user_id)
-
-        is_coach = await DatabaseManager.execute_with_session(_check_coach_role)
-
-        if is_coach:
-            keyboard.add(
-                InlineKeyboardButton(
-                    text=translator.get("coach.buttons.coach_panel", user_lang),
-                    callback_data="coach_panel",
-                ),
-            )
-        else:
-            # Add "Become Coach" button for regular users
-            keyboard.add(
-                InlineKeyboardButton(
-                    text=translator.get("coach.buttons.become_coach", user_lang),
-                    callback_data="become_coach_callback",
-                ),
-            )
-
-        keyboard.add(
-            InlineKeyboardButton(
-                text=translator.get("buttons.language_settings", user_lang),
-                callback_data="language_settings",
-            ),
-        )
-        keyboard.adjust(2)
+        cache_coach_status(user_id, is_coach)
 
         await message.answer(
             translator.get("commands.menu.title", user_lang),
-            reply_markup=keyboard.as_markup(),
+            reply_markup=_build_main_menu_markup(user_lang, is_coach, pending_count),
         )
 
     @staticmethod
@@ -351,15 +788,12 @@ class BotHandlers:
     async def add_athlete_command(message: types.Message, state: FSMContext):
         """Handle /add_athlete command."""
         try:
-            user_id = await BotHandlers.get_or_create_user(message.from_user)
-            user_lang = await BotHandlers.get_user_language(user_id)
-
             # Check if user is a coach
-            async def _check_coach_permission(session):
+            async def _check_coach_permission(session, user_id):
                 return await PermissionManager.check_coach_permission(session, user_id)
 
-            is_coach = await DatabaseManager.execute_with_session(
-                _check_coach_permission
+            user_id, user_lang, is_coach = await BotHandlers.execute_as_user(
+                message.from_user, _check_coach_permission
             )
 
             if not is_coach:
@@ -375,28 +809,18 @@ class BotHandlers:
 
         except Exception as e:
             logger.error(f"Error in add_athlete command: {e}")
-            user_id = await BotHandlers.get_or_create_user(message.from_user)
-            error_msg = await BotHandlers.get_error_message(user_id)
+            error_msg = await BotHandlers.get_error_message_by_telegram_id(
+                message.from_user.id
+            )
             await message.answer(error_msg)
 
     @staticmethod
     async def list_athletes_command(message: types.Message):
         """Handle /list_athletes command."""
         try:
-            user_id = await BotHandlers.get_or_create_user(message.from_user)
-            user_lang = await BotHandlers.get_user_language(user_id)
-
             # Check if user is a coach
-            async def _check_and_get_athletes(session):
-                is_coach = await PermissionManager.check_coach_permission(
-                    session, user_id
-                )
-                if not is_coach:
-                    return None
-                return await CoachAthleteRepository.get_coach_athletes(session, user_id)
-
-            athletes = await DatabaseManager.execute_with_session(
-                _check_and_get_athletes
+            user_id, user_lang, athletes = await BotHandlers.execute_as_user(
+                message.from_user, _check_and_get_athletes
             )
 
             if athletes is None:
@@ -411,15 +835,15 @@ class BotHandlers:
                 )
                 return
 
-            athletes_text = (
-                translator.get("coach.list_athletes.title", user_lang) + "\n\n"
-            )
+            # Collect parts and join once instead of growing a string
+            parts = [translator.get("coach.list_athletes.title", user_lang), "\n\n"]
             for athlete in athletes:
-                name = athlete.first_name or athlete.username or "Unknown"
-                athletes_text += f"• {escape_markdown(name)}"
+                name = display_name(athlete)
+                parts.append(f"• {escape_markdown(name)}")
                 if athlete.username:
-                    athletes_text += f" (@{escape_markdown(athlete.username)})"
-                athletes_text += "\n"
+                    parts.append(f" (@{escape_markdown(athlete.username)})")
+                parts.append("\n")
+            athletes_text = "".join(parts)
 
             keyboard = InlineKeyboardBuilder()
             keyboard.add(
@@ -447,28 +871,18 @@ class BotHandlers:
 
         except Exception as e:
             logger.error(f"Error in list_athletes command: {e}")
-            user_id = await BotHandlers.get_or_create_user(message.from_user)
-            error_msg = await BotHandlers.get_error_message(user_id)
+            error_msg = await BotHandlers.get_error_message_by_telegram_id(
+                message.from_user.id
+            )
             await message.answer(error_msg)
 
     @staticmethod
     async def remove_athlete_command(message: types.Message, state: FSMContext):
         """Handle /remove_athlete command."""
         try:
-            user_id = await BotHandlers.get_or_create_user(message.from_user)
-            user_lang = await BotHandlers.get_user_language(user_id)
-
             # Check if user is a coach and get athletes
-            async def _check_and_get_athletes(session):
-                is_coach = await PermissionManager.check_coach_permission(
-                    session, user_id
-                )
-                if not is_coach:
-                    return None
-                return await CoachAthleteRepository.get_coach_athletes(session, user_id)
-
-            athletes = await DatabaseManager.execute_with_session(
-                _check_and_get_athletes
+            user_id, user_lang, athletes = await BotHandlers.execute_as_user(
+                message.from_user, _check_and_get_athletes
             )
 
             if athletes is None:
@@ -486,20 +900,26 @@ class BotHandlers:
             # Create keyboard with athletes to remove
             keyboard = InlineKeyboardBuilder()
             for athlete in athletes:
-                name = athlete.first_name or athlete.username or "Unknown"
-                display_name = name
-                if athlete.username:
-                    display_name += f" (@{athlete.username})"
-
+                name = display_name(athlete)
+                text = (
+                    f"🗑️ {name} (@{athlete.username})"
+                    if athlete.username
+                    else f"🗑️ {name}"
+                )
                 keyboard.add(
                     InlineKeyboardButton(
-                        text=f"🗑️ {display_name}",
-                        callback_data=f"remove_athlete_{athlete.id}",
+                        text=text,
+                        callback_data=AthleteCallback(
+                            action="remove", id=athlete.id
+                        ).pack(),
                     )
                 )
 
             keyboard.add(
-                InlineKeyboardButton(text="❌ Cancel", callback_data="back_to_menu")
+                InlineKeyboardButton(
+                    text=translator.get("buttons.cancel", user_lang),
+                    callback_data="back_to_menu",
+                )
             )
             keyboard.adjust(1)
 
@@ -511,29 +931,24 @@ class BotHandlers:
 
         except Exception as e:
             logger.error(f"Error in remove_athlete command: {e}")
-            user_id = await BotHandlers.get_or_create_user(message.from_user)
-            error_msg = await BotHandlers.get_error_message(user_id)
+            error_msg = await BotHandlers.get_error_message_by_telegram_id(
+                message.from_user.id
+            )
             await message.answer(error_msg)
 
     @staticmethod
     async def become_coach_command(message: types.Message):
         """Handle /become_coach command."""
         try:
-            user_id = await BotHandlers.get_or_create_user(message.from_user)
-            user_lang = await BotHandlers.get_user_language(user_id)
+            user_id, user_lang = await BotHandlers.get_or_create_user_with_lang(
+                message.from_user
+            )
 
             # Update user role to coach
-            async def _update_to_coach(session):
-                current_role = await UserRepository.get_user_role(session, user_id)
-                if current_role == UserRole.ATHLETE:
-                    new_role = UserRole.BOTH  # Keep athlete capabilities
-                else:
-                    new_role = UserRole.COACH
-
-                await UserRepository.update_user_role(session, user_id, new_role)
-                return new_role
-
-            new_role = await DatabaseManager.execute_with_session(_update_to_coach)
+            new_role = await DatabaseManager.execute_with_session(
+                _update_to_coach, user_id
+            )
+            cache_coach_status(user_id, True)
 
             await message.answer(
                 translator.get("coach.become_coach.command_success", user_lang)
@@ -541,8 +956,9 @@ class BotHandlers:
 
         except Exception as e:
             logger.error(f"Error in become_coach command: {e}")
-            user_id = await BotHandlers.get_or_create_user(message.from_user)
-            error_msg = await BotHandlers.get_error_message(user_id)
+            error_msg = await BotHandlers.get_error_message_by_telegram_id(
+                message.from_user.id
+            )
             await message.answer(error_msg)
 
     @staticmethod
@@ -557,11 +973,11 @@ class BotHandlers:
             keyboard.add(
                 InlineKeyboardButton(
                     text=translator.get("buttons.english", user_lang),
-                    callback_data="set_language_en",
+                    callback_data=LanguageCallback(code="en").pack(),
                 ),
                 InlineKeyboardButton(
                     text=translator.get("buttons.ukrainian", user_lang),
-                    callback_data="set_language_uk",
+                    callback_data=LanguageCallback(code="uk").pack(),
                 ),
                 InlineKeyboardButton(
                     text=translator.get("buttons.back_to_menu", user_lang),
@@ -578,18 +994,20 @@ class BotHandlers:
             logger.error(f"Error in language settings: {e}")
             user_lang = "uk"  # default fallback
             try:
-                user_id = await BotHandlers.get_or_create_user(callback.from_user)
-                user_lang = await BotHandlers.get_user_language(user_id)
+                user_lang = await BotHandlers.get_user_language_by_telegram_id(
+                    callback.from_user.id
+                )
             except Exception:
                 pass  # use fallback
             await callback.answer(translator.get("common.error", user_lang))
 
     @staticmethod
-    async def handle_set_language(callback: CallbackQuery):
+    async def handle_set_language(
+        callback: CallbackQuery, callback_data: LanguageCallback
+    ):
         """Handle language selection."""
         try:
-            # Extract language code from callback data
-            lang_code = callback.data.replace("set_language_", "")
+            lang_code = callback_data.code
 
             if not translator.is_supported_language(lang_code):
                 user_lang = await BotHandlers.get_user_language_by_telegram_id(
@@ -604,7 +1022,8 @@ class BotHandlers:
                     session, callback.from_user.id, lang_code
                 )
 
-            await DatabaseManager.execute_with_session(_update_language)
+            if await DatabaseManager.execute_with_session(_update_language):
+                cache_user_language(callback.from_user.id, lang_code)
 
             # Send confirmation in new language
             success_text = translator.get("language.changed", lang_code)
@@ -612,15 +1031,15 @@ class BotHandlers:
             await callback.answer()
 
             # Show main menu in new language
-            await asyncio.sleep(1)  # Brief pause before showing menu
             await BotHandlers.show_main_menu(callback.message)
 
         except Exception as e:
             logger.error(f"Error setting language: {e}")
             user_lang = "uk"  # default fallback
             try:
-                user_id = await BotHandlers.get_or_create_user(callback.from_user)
-                user_lang = await BotHandlers.get_user_language(user_id)
+                user_lang = await BotHandlers.get_user_language_by_telegram_id(
+                    callback.from_user.id
+                )
             except Exception:
                 pass  # use fallback
             await callback.answer(translator.get("common.error", user_lang))
@@ -630,56 +1049,46 @@ class BotHandlers:
     async def handle_coach_athletes(callback: CallbackQuery):
         """Handle coach athletes menu."""
         try:
-            user_id = await BotHandlers.get_or_create_user(callback.from_user)
-            user_lang = await BotHandlers.get_user_language(user_id)
-
-            # Check if user is a coach and get athletes
-            async def _check_and_get_athletes(session):
-                is_coach = await PermissionManager.check_coach_permission(
-                    session, user_id
-                )
-                if not is_coach:
-                    return None
-                return await CoachAthleteRepository.get_coach_athletes(session, user_id)
-
-            athletes = await DatabaseManager.execute_with_session(
-                _check_and_get_athletes
+            # Check if user is a coach, then load athletes and their last
+            # activity dates together in one session
+            (
+                user_id,
+                user_lang,
+                (athletes, last_dates),
+            ) = await BotHandlers.execute_as_user(
+                callback.from_user, _check_and_get_athletes_with_last_dates
             )
 
             if athletes is None:
-                keyboard = InlineKeyboardBuilder()
-                keyboard.add(
-                    InlineKeyboardButton(
-                        text=translator.get("buttons.back_to_coach_panel", user_lang),
-                        callback_data="coach_panel",
-                    )
-                )
                 await callback.message.edit_text(
                     translator.get("coach.list_athletes.permission_denied", user_lang),
-                    reply_markup=keyboard.as_markup(),
+                    reply_markup=_build_back_to_coach_panel_markup(user_lang),
                 )
                 await callback.answer()
                 return
 
             if not athletes:
-                keyboard = InlineKeyboardBuilder()
-                keyboard.add(
-                    InlineKeyboardButton(
-                        text=translator.get(
-                            "coach.buttons.add_first_athlete", user_lang
-                        ),
-                        callback_data="add_athlete_callback",
-                    ),
-                    InlineKeyboardButton(
-                        text=translator.get("coach.buttons.coach_guide", user_lang),
-                        callback_data="coach_guide",
-                    ),
-                    InlineKeyboardButton(
-                        text=translator.get("buttons.back_to_coach_panel", user_lang),
-                        callback_data="coach_panel",
+                add_first, guide, back = translator.get_many(
+                    (
+                        "coach.buttons.add_first_athlete",
+                        "coach.buttons.coach_guide",
+                        "buttons.back_to_coach_panel",
                     ),
+                    user_lang,
+                )
+                markup = InlineKeyboardMarkup(
+                    inline_keyboard=[
+                        [
+                            InlineKeyboardButton(
+                                text=add_first, callback_data="add_athlete_callback"
+                            ),
+                            InlineKeyboardButton(
+                                text=guide, callback_data="coach_guide"
+                            ),
+                        ],
+                        [InlineKeyboardButton(text=back, callback_data="coach_panel")],
+                    ]
                 )
-                keyboard.adjust(2, 1)
 
                 welcome_text = (
                     f"{translator.get('coach.buttons.my_athletes', user_lang)}\n\n"
@@ -687,61 +1096,54 @@ class BotHandlers:
                 )
                 await callback.message.edit_text(
                     welcome_text,
-                    reply_markup=keyboard.as_markup(),
+                    reply_markup=markup,
                     parse_mode="Markdown",
                 )
                 await callback.answer()
                 return
 
             # Show athletes list with quick stats
-            athletes_text = (
+            parts = [
                 translator.get(
                     "coach.dashboard.athletes_list",
                     user_lang,
                     count=len(athletes),
-                )
-                + "\n\n"
-            )
+                ),
+                "\n\n",
+            ]
             keyboard = InlineKeyboardBuilder()
 
+            now = datetime.now(UTC)
             for athlete in athletes:
-                name = athlete.first_name or athlete.username or "Unknown"
+                name = display_name(athlete)
 
-                # Get quick stats for this athlete
-                async def _get_athlete_stats(session):
-                    recent_measurements = (
-                        await MeasurementRepository.get_user_measurements(
-                            session, athlete.id, limit=1
-                        )
+                # Quick stats for this athlete
+                last_date = last_dates.get(athlete.id)
+                if last_date is None:
+                    last_activity = translator.get(
+                        "coach.dashboard.activity_no_data", user_lang
                     )
-                    if recent_measurements:
-                        last_measurement = recent_measurements[0]
-                        days_ago = (
-                            datetime.now(UTC) - last_measurement.measurement_date
-                        ).days
-                        if days_ago == 0:
-                            return translator.get(
-                                "coach.dashboard.activity_today", user_lang
-                            )
-                        if days_ago == 1:
-                            return translator.get(
-                                "coach.dashboard.activity_yesterday", user_lang
-                            )
-                        return translator.get(
+                else:
+                    days_ago = (now - last_date).days
+                    if days_ago == 0:
+                        last_activity = translator.get(
+                            "coach.dashboard.activity_today", user_lang
+                        )
+                    elif days_ago == 1:
+                        last_activity = translator.get(
+                            "coach.dashboard.activity_yesterday", user_lang
+                        )
+                    else:
+                        last_activity = translator.get(
                             "coach.dashboard.activity_days_ago",
                             user_lang,
                             days=days_ago,
                         )
-                    return translator.get("coach.dashboard.activity_no_data", user_lang)
 
-                last_activity = await DatabaseManager.execute_with_session(
-                    _get_athlete_stats
-                )
-
-                athletes_text += f"• *{escape_markdown(name)}*"
+                parts.append(f"• *{escape_markdown(name)}*")
                 if athlete.username:
-                    athletes_text += f" (@{escape_markdown(athlete.username)})"
-                athletes_text += f" - 📊 {escape_markdown(last_activity)}\n"
+                    parts.append(f" (@{escape_markdown(athlete.username)})")
+                parts.append(f" - 📊 {escape_markdown(last_activity)}\n")
 
                 # Add button to view athlete details
                 keyboard.add(
@@ -749,13 +1151,16 @@ class BotHandlers:
                         text=translator.get(
                             "coach.buttons.view_athlete_details", user_lang, name=name
                         ),
-                        callback_data=f"view_athlete_{athlete.id}",
+                        callback_data=AthleteCallback(
+                            action="view", id=athlete.id
+                        ).pack(),
                     )
                 )
 
-            athletes_text += (
+            parts.append(
                 f"\n{translator.get('coach.dashboard.quick_actions', user_lang)}\n"
             )
+            athletes_text = "".join(parts)
 
             keyboard.add(
                 InlineKeyboardButton(
@@ -794,16 +1199,18 @@ class BotHandlers:
 
         except Exception as e:
             logger.error(f"Error in coach athletes handler: {e}")
-            user_id = await BotHandlers.get_or_create_user(callback.from_user)
-            error_msg = await BotHandlers.get_error_message(user_id)
+            error_msg = await BotHandlers.get_error_message_by_telegram_id(
+                callback.from_user.id
+            )
             await callback.answer(error_msg)
 
     @staticmethod
     async def handle_add_athlete_callback(callback: CallbackQuery, state: FSMContext):
         """Handle add athlete callback."""
         try:
-            user_id = await BotHandlers.get_or_create_user(callback.from_user)
-            user_lang = await BotHandlers.get_user_language(user_id)
+            user_id, user_lang = await BotHandlers.get_or_create_user_with_lang(
+                callback.from_user
+            )
 
             # Check if user is a coach
             async def _check_coach_permission(session):
@@ -828,8 +1235,9 @@ class BotHandlers:
 
         except Exception as e:
             logger.error(f"Error in add athlete callback: {e}")
-            user_id = await BotHandlers.get_or_create_user(callback.from_user)
-            error_msg = await BotHandlers.get_error_message(user_id)
+            error_msg = await BotHandlers.get_error_message_by_telegram_id(
+                callback.from_user.id
+            )
             await callback.answer(error_msg)
 
     @staticmethod
@@ -838,10 +1246,11 @@ class BotHandlers:
     ):
         """Handle athlete username input."""
         try:
-            user_id = await BotHandlers.get_or_create_user(message.from_user)
-            user_lang = await BotHandlers.get_user_language(user_id)
-
             if message.text == "/cancel":
+                # Cancelling needs only the language, usually already cached
+                user_lang = await BotHandlers.get_user_language_by_telegram_id(
+                    message.from_user.id
+                )
                 await state.clear()
                 await message.answer(
                     translator.get("coach.add_athlete.operation_cancelled", user_lang)
@@ -849,20 +1258,23 @@ class BotHandlers:
                 await BotHandlers.show_main_menu(message)
                 return
 
+            user_id, user_lang = await BotHandlers.get_or_create_user_with_lang(
+                message.from_user
+            )
+
             # Find the athlete user and send request
             async def _find_and_send_request(session):
-                # Check coach permission
-                is_coach = await PermissionManager.check_coach_permission(
-                    session, user_id
+                # Coach, athlete and existing relationship in one round trip
+                (
+                    coach,
+                    athlete,
+                    existing,
+                ) = await CoachAthleteRepository.resolve_athlete_for_coach(
+                    session, user_id, message.text
                 )
-                if not is_coach:
+                if not coach or coach.user_role not in (UserRole.COACH, UserRole.BOTH):
                     return "not_coach"
 
-                # Find athlete user
-                athlete = await UserRepository.find_user_by_telegram_id_or_username(
-                    session, message.text.strip()
-                )
-
                 if not athlete:
                     return "not_found"
 
@@ -870,9 +1282,6 @@ class BotHandlers:
                     return "self"
 
                 # Check if already added
-                existing = await CoachAthleteRepository.is_coach_of_athlete(
-                    session, user_id, athlete.id
-                )
                 if existing:
                     return "already_added"
 
@@ -890,8 +1299,6 @@ class BotHandlers:
                         and (datetime.now(UTC) - request.created_at).total_seconds()
                         < 60
                     ):
-                        # Load coach data within session context
-                        coach = await UserRepository.get_user_by_id(session, user_id)
                         coach_data = {
                             "first_name": coach.first_name,
                             "username": coach.username,
@@ -905,8 +1312,7 @@ class BotHandlers:
                         return ("request_sent", athlete, request_data, coach_data)
                     return ("request_pending", athlete)
 
-                # For new requests, also load coach data
-                coach = await UserRepository.get_user_by_id(session, user_id)
+                # For new requests, also pass on coach data
                 coach_data = {
                     "first_name": coach.first_name,
                     "username": coach.username,
@@ -939,7 +1345,7 @@ class BotHandlers:
                 )
             elif result[0] == "request_pending":
                 athlete = result[1]
-                name = athlete.first_name or athlete.username or "Unknown"
+                name = display_name(athlete)
                 username_part = (
                     translator.get(
                         "coach.add_athlete.username_format",
@@ -961,7 +1367,7 @@ class BotHandlers:
                 athlete = result[1]
                 request_data = result[2]
                 coach_data = result[3]
-                name = athlete.first_name or athlete.username or "Unknown"
+                name = display_name(athlete)
                 username_part = (
                     translator.get(
                         "coach.add_athlete.username_format",
@@ -974,8 +1380,10 @@ class BotHandlers:
 
                 # Send message to athlete about the request (only for new requests)
                 if request_data.get("id"):
-                    await BotHandlers.send_coach_request_notification(
-                        athlete.telegram_id, request_data, coach_data
+                    spawn_background(
+                        BotHandlers.send_coach_request_notification(
+                            athlete.telegram_id, request_data, coach_data
+                        )
                     )
 
                 await message.answer(
@@ -992,8 +1400,9 @@ class BotHandlers:
 
         except Exception as e:
             logger.error(f"Error handling athlete username: {e}")
-            user_id = await BotHandlers.get_or_create_user(message.from_user)
-            error_msg = await BotHandlers.get_error_message(user_id)
+            error_msg = await BotHandlers.get_error_message_by_telegram_id(
+                message.from_user.id
+            )
             await message.answer(error_msg)
             await state.clear()
 
@@ -1013,21 +1422,7 @@ class BotHandlers:
             )
 
             # Format date
-            date_str = request_data["created_at"].strftime("%Y-%m-%d %H:%M")
-
-            # Create keyboard for request response
-            keyboard = InlineKeyboardBuilder()
-            keyboard.add(
-                InlineKeyboardButton(
-                    text=translator.get("coach.requests.accept", athlete_lang),
-                    callback_data=f"accept_request_{request_data['id']}",
-                ),
-                InlineKeyboardButton(
-                    text=translator.get("coach.requests.reject", athlete_lang),
-                    callback_data=f"reject_request_{request_data['id']}",
-                ),
-            )
-            keyboard.adjust(2)
+            date_str = _fmt_dt_long(request_data["created_at"])
 
             message_text = translator.get(
                 "coach.requests.incoming_request",
@@ -1046,25 +1441,41 @@ class BotHandlers:
             )
 
             await bot.send_message(
-                athlete_telegram_id, message_text, reply_markup=keyboard.as_markup()
+                athlete_telegram_id,
+                message_text,
+                reply_markup=_build_request_response_markup(
+                    athlete_lang, request_data["id"]
+                ),
             )
 
         except Exception as e:
             logger.error(f"Error sending coach request notification: {e}")
 
+    @staticmethod
+    async def send_request_response_notification(
+        coach_telegram_id: int, coach_lang: str, translation_key: str, athlete_name: str
+    ):
+        """Send notification to coach about the athlete's response."""
+        try:
+            await bot.send_message(
+                coach_telegram_id,
+                translator.get(translation_key, coach_lang, athlete_name=athlete_name),
+            )
+
+        except Exception as e:
+            logger.error(f"Error sending request response notification: {e}")
+
     @staticmethod
     async def handle_coach_requests(callback: CallbackQuery, state: FSMContext):
         """Handle coach requests callback."""
         try:
-            user_id = await BotHandlers.get_or_create_user(callback.from_user)
-            user_lang = await BotHandlers.get_user_language(user_id)
-
-            async def _get_requests(session):
-                return await AthleteCoachRequestRepository.get_athlete_pending_requests(
-                    session, user_id
-                )
+            user_id, user_lang = await BotHandlers.get_or_create_user_with_lang(
+                callback.from_user
+            )
 
-            pending_requests = await DatabaseManager.execute_with_session(_get_requests)
+            pending_requests = await DatabaseManager.execute_with_session(
+                _get_requests, user_id
+            )
 
             if not pending_requests:
                 await callback.message.edit_text(
@@ -1082,35 +1493,17 @@ class BotHandlers:
 
         except Exception as e:
             logger.error(f"Error handling coach requests: {e}")
-            user_id = await BotHandlers.get_or_create_user(callback.from_user)
-            error_msg = await BotHandlers.get_error_message(user_id)
+            error_msg = await BotHandlers.get_error_message_by_telegram_id(
+                callback.from_user.id
+            )
             await callback.answer(error_msg)
 
     @staticmethod
     async def show_coach_request_detail(message, request, user_lang):
         """Show detailed view of a coach request."""
         try:
-            coach_name = request.coach.first_name or request.coach.username or "Unknown"
-            date_str = request.created_at.strftime("%Y-%m-%d %H:%M")
-
-            keyboard = InlineKeyboardBuilder()
-            keyboard.add(
-                InlineKeyboardButton(
-                    text=translator.get("coach.requests.accept", user_lang),
-                    callback_data=f"accept_request_{request.id}",
-                ),
-                InlineKeyboardButton(
-                    text=translator.get("coach.requests.reject", user_lang),
-                    callback_data=f"reject_request_{request.id}",
-                ),
-            )
-            keyboard.add(
-                InlineKeyboardButton(
-                    text=translator.get("buttons.back_to_menu", user_lang),
-                    callback_data="back_to_menu",
-                ),
-            )
-            keyboard.adjust(2)
+            coach_name = display_name(request.coach)
+            date_str = _fmt_dt_long(request.created_at)
 
             message_text = translator.get(
                 "coach.requests.incoming_request",
@@ -1128,7 +1521,12 @@ class BotHandlers:
                 ),
             )
 
-            await message.edit_text(message_text, reply_markup=keyboard.as_markup())
+            await message.edit_text(
+                message_text,
+                reply_markup=_build_request_response_markup(
+                    user_lang, request.id, with_back=True
+                ),
+            )
 
         except Exception as e:
             logger.error(f"Error showing coach request detail: {e}")
@@ -1137,19 +1535,16 @@ class BotHandlers:
     async def handle_accept_request(callback: CallbackQuery, state: FSMContext):
         """Handle accepting a coach request."""
         try:
-            user_id = await BotHandlers.get_or_create_user(callback.from_user)
-            user_lang = await BotHandlers.get_user_language(user_id)
+            user_id, user_lang = await BotHandlers.get_or_create_user_with_lang(
+                callback.from_user
+            )
 
             # Extract request ID from callback data
-            request_id = int(callback.data.split("_")[-1])
+            request_id = int(callback.data.rpartition("_")[2])
 
-            async def _accept_request(session):
-                request = await AthleteCoachRequestRepository.accept_request(
-                    session, request_id
-                )
-                return request
-
-            request = await DatabaseManager.execute_with_session(_accept_request)
+            request = await DatabaseManager.execute_with_session(
+                AthleteCoachRequestRepository.accept_request, request_id
+            )
 
             if not request:
                 await callback.message.edit_text(
@@ -1158,7 +1553,19 @@ class BotHandlers:
                 await callback.answer()
                 return
 
-            coach_name = request.coach.first_name or request.coach.username or "Unknown"
+            coach_name = display_name(request.coach)
+
+            # Notify the coach first so that send overlaps the athlete's edit
+            athlete_name = display_name(request.athlete)
+            spawn_background(
+                BotHandlers.send_request_response_notification(
+                    request.coach.telegram_id,
+                    # The coach row is loaded with the request, language included
+                    request.coach.language,
+                    "coach.requests.coach_accepted",
+                    athlete_name,
+                )
+            )
 
             # Send confirmation to athlete
             await callback.message.edit_text(
@@ -1169,48 +1576,29 @@ class BotHandlers:
                 )
             )
 
-            # Send notification to coach
-            coach_lang = await BotHandlers.get_user_language_by_telegram_id(
-                request.coach.telegram_id
-            )
-            athlete_name = (
-                request.athlete.first_name or request.athlete.username or "Unknown"
-            )
-
-            await bot.send_message(
-                request.coach.telegram_id,
-                translator.get(
-                    "coach.requests.coach_accepted",
-                    coach_lang,
-                    athlete_name=athlete_name,
-                ),
-            )
-
             await callback.answer()
 
         except Exception as e:
             logger.error(f"Error accepting coach request: {e}")
-            user_id = await BotHandlers.get_or_create_user(callback.from_user)
-            error_msg = await BotHandlers.get_error_message(user_id)
+            error_msg = await BotHandlers.get_error_message_by_telegram_id(
+                callback.from_user.id
+            )
             await callback.answer(error_msg)
 
     @staticmethod
     async def handle_reject_request(callback: CallbackQuery, state: FSMContext):
         """Handle rejecting a coach request."""
         try:
-            user_id = await BotHandlers.get_or_create_user(callback.from_user)
-            user_lang = await BotHandlers.get_user_language(user_id)
+            user_id, user_lang = await BotHandlers.get_or_create_user_with_lang(
+                callback.from_user
+            )
 
             # Extract request ID from callback data
-            request_id = int(callback.data.split("_")[-1])
+            request_id = int(callback.data.rpartition("_")[2])
 
-            async def _reject_request(session):
-                request = await AthleteCoachRequestRepository.reject_request(
-                    session, request_id
-                )
-                return request
-
-            request = await DatabaseManager.execute_with_session(_reject_request)
+            request = await DatabaseManager.execute_with_session(
+                AthleteCoachRequestRepository.reject_request, request_id
+            )
 
             if not request:
                 await callback.message.edit_text(
@@ -1219,7 +1607,18 @@ class BotHandlers:
                 await callback.answer()
                 return
 
-            coach_name = request.coach.first_name or request.coach.username or "Unknown"
+            coach_name = display_name(request.coach)
+
+            # Notify the coach first so that send overlaps the athlete's edit
+            athlete_name = display_name(request.athlete)
+            spawn_background(
+                BotHandlers.send_request_response_notification(
+                    request.coach.telegram_id,
+                    request.coach.language,
+                    "coach.requests.coach_rejected",
+                    athlete_name,
+                )
+            )
 
             # Send confirmation to athlete
             await callback.message.edit_text(
@@ -1230,62 +1629,34 @@ class BotHandlers:
                 )
             )
 
-            # Send notification to coach
-            coach_lang = await BotHandlers.get_user_language_by_telegram_id(
-                request.coach.telegram_id
-            )
-            athlete_name = (
-                request.athlete.first_name or request.athlete.username or "Unknown"
-            )
-
-            await bot.send_message(
-                request.coach.telegram_id,
-                translator.get(
-                    "coach.requests.coach_rejected",
-                    coach_lang,
-                    athlete_name=athlete_name,
-                ),
-            )
-
             await callback.answer()
 
         except Exception as e:
             logger.error(f"Error rejecting coach request: {e}")
-            user_id = await BotHandlers.get_or_create_user(callback.from_user)
-            error_msg = await BotHandlers.get_error_message(user_id)
+            error_msg = await BotHandlers.get_error_message_by_telegram_id(
+                callback.from_user.id
+            )
             await callback.answer(error_msg)
 
     @staticmethod
     async def handle_remove_athlete_callback(callback: CallbackQuery):
         """Handle remove athlete callback."""
         try:
-            user_id = await BotHandlers.get_or_create_user(callback.from_user)
-            user_lang = await BotHandlers.get_user_language(user_id)
-
             # Get coach's athletes
-            async def _check_and_get_athletes(session):
-                is_coach = await PermissionManager.check_coach_permission(
-                    session, user_id
-                )
-                if not is_coach:
-                    return None
-                return await CoachAthleteRepository.get_coach_athletes(session, user_id)
-
-            athletes = await DatabaseManager.execute_with_session(
-                _check_and_get_athletes
+            user_id, user_lang, athletes = await BotHandlers.execute_as_user(
+                callback.from_user, _check_and_get_athletes
             )
 
             if athletes is None:
                 await callback.message.edit_text(
-                    "❌ You need to be a coach to remove athletes."
+                    translator.get("coach.remove_athlete.need_coach", user_lang)
                 )
                 await callback.answer()
                 return
 
             if not athletes:
                 await callback.message.edit_text(
-                    "👥 You don't have any athletes to remove.\n"
-                    "Use the menu to add athletes first!"
+                    translator.get("coach.remove_athlete.no_athletes_menu", user_lang)
                 )
                 await callback.answer()
                 return
@@ -1293,15 +1664,18 @@ class BotHandlers:
             # Create keyboard with athletes to remove
             keyboard = InlineKeyboardBuilder()
             for athlete in athletes:
-                name = athlete.first_name or athlete.username or "Unknown"
-                display_name = name
-                if athlete.username:
-                    display_name += f" (@{athlete.username})"
-
+                name = display_name(athlete)
+                text = (
+                    f"🗑️ {name} (@{athlete.username})"
+                    if athlete.username
+                    else f"🗑️ {name}"
+                )
                 keyboard.add(
                     InlineKeyboardButton(
-                        text=f"🗑️ {display_name}",
-                        callback_data=f"confirm_remove_athlete_{athlete.id}",
+                        text=text,
+                        callback_data=AthleteCallback(
+                            action="remove", id=athlete.id
+                        ).pack(),
                     )
                 )
 
@@ -1322,41 +1696,25 @@ class BotHandlers:
 
         except Exception as e:
             logger.error(f"Error in remove athlete callback: {e}")
-            user_id = await BotHandlers.get_or_create_user(callback.from_user)
-            error_msg = await BotHandlers.get_error_message(user_id)
+            error_msg = await BotHandlers.get_error_message_by_telegram_id(
+                callback.from_user.id
+            )
             await callback.answer(error_msg)
 
     @staticmethod
-    async def handle_confirm_remove_athlete(callback: CallbackQuery):
+    async def handle_confirm_remove_athlete(
+        callback: CallbackQuery, callback_data: AthleteCallback
+    ):
         """Handle confirm remove athlete."""
         try:
-            # Extract athlete ID from callback data
-            athlete_id = int(callback.data.replace("confirm_remove_athlete_", ""))
-            user_id = await BotHandlers.get_or_create_user(callback.from_user)
+            athlete_id = callback_data.id
 
             # Remove athlete
-            async def _remove_athlete(session):
-                is_coach = await PermissionManager.check_coach_permission(
-                    session, user_id
-                )
-                if not is_coach:
-                    return False
-
-                # Get athlete info before removing
-                athlete = await UserRepository.get_user_by_id(session, athlete_id)
-                if not athlete:
-                    return False
-
-                # Remove relationship
-                success = await CoachAthleteRepository.remove_athlete_from_coach(
-                    session, user_id, athlete_id
-                )
-                return (success, athlete)
-
-            result = await DatabaseManager.execute_with_session(_remove_athlete)
+            user_id, user_lang, result = await BotHandlers.execute_as_user(
+                callback.from_user, _remove_athlete, athlete_id
+            )
 
             if not result or not result[0]:
-                user_lang = await BotHandlers.get_user_language(user_id)
                 await callback.message.edit_text(
                     translator.get("coach.remove_athlete.failed", user_lang)
                 )
@@ -1364,9 +1722,8 @@ class BotHandlers:
                 return
 
             success, athlete = result
-            name = athlete.first_name or athlete.username or "Unknown"
+            name = display_name(athlete)
 
-            user_lang = await BotHandlers.get_user_language(user_id)
             username_part = f" (@{athlete.username})" if athlete.username else ""
             await callback.message.edit_text(
                 translator.get(
@@ -1378,112 +1735,51 @@ class BotHandlers:
             )
 
             # Show back to athletes menu after delay
-            await asyncio.sleep(2)
-            await BotHandlers.handle_coach_athletes(callback)
+            refresh_later(2, BotHandlers.handle_coach_athletes, callback)
 
         except Exception as e:
             logger.error(f"Error confirming remove athlete: {e}")
-            user_id = await BotHandlers.get_or_create_user(callback.from_user)
-            error_msg = await BotHandlers.get_error_message(user_id)
+            error_msg = await BotHandlers.get_error_message_by_telegram_id(
+                callback.from_user.id
+            )
             await callback.answer(error_msg)
 
     @staticmethod
     async def handle_coach_notifications(callback: CallbackQuery):
         """Handle coach notifications menu."""
         try:
-            user_id = await BotHandlers.get_or_create_user(callback.from_user)
-            user_lang = await BotHandlers.get_user_language(user_id)
-
             # Check if user is a coach
-            async def _check_coach_and_get_preferences(session):
-                is_coach = await PermissionManager.check_coach_permission(
-                    session, user_id
-                )
-                if not is_coach:
-                    return None
-
-                # Initialize default preferences if none exist
-                preferences = await CoachNotificationRepository.get_coach_notification_preferences(
-                    session, user_id
-                )
-                if not preferences:
-                    preferences = await CoachNotificationRepository.initialize_default_preferences(
-                        session, user_id
-                    )
-
-                return preferences
-
-            preferences = await DatabaseManager.execute_with_session(
-                _check_coach_and_get_preferences
+            user_id, user_lang, preferences = await BotHandlers.execute_as_user(
+                callback.from_user, _check_coach_and_get_preferences
             )
 
             if preferences is None:
-                keyboard = InlineKeyboardBuilder()
-                keyboard.add(
-                    InlineKeyboardButton(
-                        text=translator.get("buttons.back_to_coach_panel", user_lang),
-                        callback_data="coach_panel",
-                    )
-                )
                 await callback.message.edit_text(
                     translator.get("coach.notifications.permission_denied", user_lang),
-                    reply_markup=keyboard.as_markup(),
+                    reply_markup=_build_back_to_coach_panel_markup(user_lang),
                 )
                 await callback.answer()
                 return
 
             # Build preferences display
-            prefs_text = (
-                translator.get("coach.notifications.settings_title", user_lang) + "\n\n"
-            )
+            parts = [
+                translator.get("coach.notifications.settings_title", user_lang),
+                "\n\n",
+            ]
             keyboard = InlineKeyboardBuilder()
 
+            # Stored types are plain strings; CoachNotificationType is a str
+            # enum, so members hash and compare equal to them as keys
             pref_dict = {
                 pref.notification_type: pref.is_enabled for pref in preferences
             }
 
-            for notification_type in CoachNotificationType:
-                is_enabled = pref_dict.get(notification_type.value, True)
+            type_texts = _coach_notification_type_texts(user_lang)
+            for notification_type, (name, desc) in type_texts.items():
+                is_enabled = pref_dict.get(notification_type, True)
                 status = "✅" if is_enabled else "❌"
 
-                if notification_type == CoachNotificationType.ATHLETE_MEASUREMENT_ADDED:
-                    name = translator.get(
-                        "coach.notifications.types.athlete_measurement_added.name",
-                        user_lang,
-                    )
-                    desc = translator.get(
-                        "coach.notifications.types.athlete_measurement_added.description",
-                        user_lang,
-                    )
-                elif notification_type == CoachNotificationType.ATHLETE_GOAL_ACHIEVED:
-                    name = translator.get(
-                        "coach.notifications.types.athlete_goal_achieved.name",
-                        user_lang,
-                    )
-                    desc = translator.get(
-                        "coach.notifications.types.athlete_goal_achieved.description",
-                        user_lang,
-                    )
-                elif notification_type == CoachNotificationType.ATHLETE_INACTIVE:
-                    name = translator.get(
-                        "coach.notifications.types.athlete_inactive.name", user_lang
-                    )
-                    desc = translator.get(
-                        "coach.notifications.types.athlete_inactive.description",
-                        user_lang,
-                    )
-                elif notification_type == CoachNotificationType.DAILY_SUMMARY:
-                    name = translator.get(
-                        "coach.notifications.types.daily_summary.name", user_lang
-                    )
-                    desc = translator.get(
-                        "coach.notifications.types.daily_summary.description", user_lang
-                    )
-                else:
-                    name = notification_type.value.replace("_", " ").title()
-                    desc = ""
-
-                prefs_text += f"{status} **{name}**\n{desc}\n\n"
+                parts.append(f"{status} **{name}**\n{desc}\n\n")
 
                 keyboard.add(
                     InlineKeyboardButton(
@@ -1506,6 +1802,7 @@ class BotHandlers:
             )
             keyboard.adjust(1)
 
+            prefs_text = "".join(parts)
             await callback.message.edit_text(
                 prefs_text, reply_markup=keyboard.as_markup(), parse_mode="Markdown"
             )
@@ -1513,54 +1810,37 @@ class BotHandlers:
 
         except Exception as e:
             logger.error(f"Error in coach notifications handler: {e}")
-            user_id = await BotHandlers.get_or_create_user(callback.from_user)
-            error_msg = await BotHandlers.get_error_message(user_id)
-            await callback.answer(error_msg)
-
-    @staticmethod
-    async def handle_toggle_coach_notification(callback: CallbackQuery):
-        """Handle toggling coach notification preferences."""
-        try:
-            user_id = await BotHandlers.get_or_create_user(callback.from_user)
-            user_lang = await BotHandlers.get_user_language(user_id)
-
-            # Extract notification type from callback data
-            notification_type_str = callback.data.replace(
-                "toggle_coach_notification_", ""
+            error_msg = await BotHandlers.get_error_message_by_telegram_id(
+                callback.from_user.id
             )
-            notification_type = CoachNotificationType(notification_type_str)
-
-            # Toggle preference
-            async def _toggle_preference(session):
-                is_coach = await PermissionManager.check_coach_permission(
-                    session, user_id
-                )
-                if not is_coach:
-                    logger.warning(
-                        f"User {user_id} attempted to toggle notification without coach permissions"
-                    )
-                    return None  # Return None to indicate permission error
-
-                current_pref = (
-                    await CoachNotificationRepository.get_notification_preference(
-                        session, user_id, notification_type
-                    )
-                )
-
-                current_enabled = current_pref.is_enabled if current_pref else True
-                new_enabled = not current_enabled
+            await callback.answer(error_msg)
 
-                logger.debug(
-                    f"Toggling notification {notification_type} for coach {user_id}: {current_enabled} -> {new_enabled}"
+    @staticmethod
+    async def handle_toggle_coach_notification(callback: CallbackQuery):
+        """Handle toggling coach notification preferences."""
+        try:
+            # Extract notification type from callback data
+            notification_type_str = callback.data.removeprefix(
+                "toggle_coach_notification_"
+            )
+            notification_type = COACH_NOTIFICATION_TYPES_BY_VALUE.get(
+                notification_type_str
+            )
+            if notification_type is None:
+                logger.warning(
+                    f"Unknown coach notification type in callback: {callback.data}"
                 )
-
-                await CoachNotificationRepository.create_notification_preference(
-                    session, user_id, notification_type, new_enabled
+                await callback.answer(
+                    await BotHandlers.get_error_message_by_telegram_id(
+                        callback.from_user.id
+                    )
                 )
+                return
 
-                return new_enabled  # Return the boolean value (True/False)
-
-            result = await DatabaseManager.execute_with_session(_toggle_preference)
+            # Toggle preference
+            user_id, user_lang, result = await BotHandlers.execute_as_user(
+                callback.from_user, _toggle_preference, notification_type
+            )
 
             if result is None:
                 await callback.answer(
@@ -1595,34 +1875,23 @@ class BotHandlers:
             await callback.answer(toggle_msg)
 
             # Wait a moment then refresh the menu
-            await asyncio.sleep(1.5)
-            await BotHandlers.handle_coach_notifications(callback)
+            refresh_later(1.5, BotHandlers.handle_coach_notifications, callback)
 
         except Exception as e:
             logger.error(f"Error toggling coach notification: {e}")
-            user_id = await BotHandlers.get_or_create_user(callback.from_user)
-            error_msg = await BotHandlers.get_error_message(user_id)
+            error_msg = await BotHandlers.get_error_message_by_telegram_id(
+                callback.from_user.id
+            )
             await callback.answer(error_msg)
 
     @staticmethod
     async def handle_coach_notification_history(callback: CallbackQuery):
         """Handle showing coach notification history."""
         try:
-            user_id = await BotHandlers.get_or_create_user(callback.from_user)
-            user_lang = await BotHandlers.get_user_language(user_id)
-
             # Get notification history
-            async def _get_history(session):
-                is_coach = await PermissionManager.check_coach_permission(
-                    session, user_id
-                )
-                if not is_coach:
-                    return None
-                return await CoachNotificationRepository.get_coach_notification_history(
-                    session, user_id
-                )
-
-            history = await DatabaseManager.execute_with_session(_get_history)
+            user_id, user_lang, history = await BotHandlers.execute_as_user(
+                callback.from_user, _get_history
+            )
 
             if history is None:
                 await callback.answer(
@@ -1633,65 +1902,60 @@ class BotHandlers:
             if not history:
                 text = translator.get("coach.notifications.history_empty", user_lang)
             else:
-                text = (
-                    translator.get("coach.notifications.history_title", user_lang)
-                    + "\n\n"
-                )
-                for notification in history[:10]:  # Show last 10
-                    athlete_name = (
-                        notification.athlete.first_name
-                        or notification.athlete.username
-                        or "Unknown"
-                    )
-                    date_str = notification.created_at.strftime("%m/%d %H:%M")
+                parts = [
+                    translator.get("coach.notifications.history_title", user_lang),
+                    "\n\n",
+                ]
+                for notification in history:
+                    athlete_name = display_name(notification.athlete)
+                    date_str = _fmt_dt_short(notification.created_at)
                     status = "✅" if notification.is_sent else "⏳"
 
-                    text += f"{status} {date_str} - {escape_markdown(athlete_name)}\n"
+                    parts.append(
+                        f"{status} {date_str} - {escape_markdown(athlete_name)}\n"
+                    )
                     if (
                         notification.notification_type
                         == CoachNotificationType.ATHLETE_MEASUREMENT_ADDED.value
                     ):
-                        text += "   📊 New measurement added\n"
-                    text += "\n"
+                        parts.append("   📊 New measurement added\n")
+                    parts.append("\n")
+                text = "".join(parts)
 
-            keyboard = InlineKeyboardBuilder()
-            keyboard.add(
-                InlineKeyboardButton(
-                    text=f"🔙 {translator.get('coach.buttons.coach_notifications', user_lang)}",
-                    callback_data="coach_notifications",
-                )
+            back = translator.get("coach.buttons.coach_notifications", user_lang)
+            markup = InlineKeyboardMarkup(
+                inline_keyboard=[
+                    [
+                        InlineKeyboardButton(
+                            text=f"🔙 {back}", callback_data="coach_notifications"
+                        )
+                    ]
+                ]
             )
 
-            await safe_edit_message(
-                callback.message, text, reply_markup=keyboard.as_markup()
-            )
+            await safe_edit_message(callback.message, text, reply_markup=markup)
             await callback.answer()
 
         except Exception as e:
             logger.error(f"Error showing notification history: {e}")
-            user_id = await BotHandlers.get_or_create_user(callback.from_user)
-            error_msg = await BotHandlers.get_error_message(user_id)
+            error_msg = await BotHandlers.get_error_message_by_telegram_id(
+                callback.from_user.id
+            )
             await callback.answer(error_msg)
 
     @staticmethod
     async def handle_become_coach_callback(callback: CallbackQuery):
         """Handle become coach button."""
         try:
-            user_id = await BotHandlers.get_or_create_user(callback.from_user)
-            user_lang = await BotHandlers.get_user_language(user_id)
+            user_id, user_lang = await BotHandlers.get_or_create_user_with_lang(
+                callback.from_user
+            )
 
             # Update user role to coach
-            async def _update_to_coach(session):
-                current_role = await UserRepository.get_user_role(session, user_id)
-                if current_role == UserRole.ATHLETE:
-                    new_role = UserRole.BOTH  # Keep athlete capabilities
-                else:
-                    new_role = UserRole.COACH
-
-                await UserRepository.update_user_role(session, user_id, new_role)
-                return new_role
-
-            new_role = await DatabaseManager.execute_with_session(_update_to_coach)
+            new_role = await DatabaseManager.execute_with_session(
+                _update_to_coach, user_id
+            )
+            cache_coach_status(user_id, True)
 
             await callback.message.edit_text(
                 translator.get("coach.become_coach.success", user_lang)
@@ -1702,24 +1966,21 @@ class BotHandlers:
             )
 
             # Show updated main menu after a brief delay
-            await asyncio.sleep(2)
-            await BotHandlers.show_main_menu(callback.message)
+            refresh_later(2, BotHandlers.show_main_menu, callback.message)
 
         except Exception as e:
             logger.error(f"Error in become coach callback: {e}")
-            user_id = await BotHandlers.get_or_create_user(callback.from_user)
-            error_msg = await BotHandlers.get_error_message(user_id)
+            error_msg = await BotHandlers.get_error_message_by_telegram_id(
+                callback.from_user.id
+            )
             await callback.answer(error_msg)
 
     @staticmethod
     async def handle_view_all_athletes_progress(callback: CallbackQuery):
         """Handle viewing progress for all athletes."""
         try:
-            user_id = await BotHandlers.get_or_create_user(callback.from_user)
-            user_lang = await BotHandlers.get_user_language(user_id)
-
             # Get recent measurements from all athletes
-            async def _get_athletes_progress(session):
+            async def _get_athletes_progress(session, user_id):
                 is_coach = await PermissionManager.check_coach_permission(
                     session, user_id
                 )
@@ -1733,85 +1994,77 @@ class BotHandlers:
                 if not athletes:
                     return []
 
-                # Get recent measurements for each athlete
-                progress_data = []
-                for athlete in athletes:
-                    latest_measurements = (
-                        await MeasurementRepository.get_athlete_latest_measurements(
-                            session, user_id, athlete.id
-                        )
+                # Get recent measurements for all athletes at once (3 types each)
+                latest = (
+                    await MeasurementRepository.get_latest_measurements_for_athletes(
+                        session, user_id, [athlete.id for athlete in athletes]
                     )
+                )
+                return [
+                    {"athlete": athlete, "measurements": latest.get(athlete.id, [])}
+                    for athlete in athletes
+                ]
 
-                    athlete_data = {
-                        "athlete": athlete,
-                        "measurements": latest_measurements[:3],  # Show last 3 types
-                    }
-                    progress_data.append(athlete_data)
-
-                return progress_data
-
-            progress_data = await DatabaseManager.execute_with_session(
-                _get_athletes_progress
+            user_id, user_lang, progress_data = await BotHandlers.execute_as_user(
+                callback.from_user, _get_athletes_progress
             )
 
             if progress_data is None:
-                keyboard = InlineKeyboardBuilder()
-                keyboard.add(
-                    InlineKeyboardButton(
-                        text=translator.get("buttons.back_to_coach_panel", user_lang),
-                        callback_data="coach_panel",
-                    )
-                )
                 await callback.message.edit_text(
                     "❌ You need to be a coach to view athlete progress.",
-                    reply_markup=keyboard.as_markup(),
+                    reply_markup=_build_back_to_coach_panel_markup(user_lang),
                 )
                 await callback.answer()
                 return
 
             if not progress_data:
-                keyboard = InlineKeyboardBuilder()
-                keyboard.add(
-                    InlineKeyboardButton(
-                        text=translator.get("buttons.back_to_coach_panel", user_lang),
-                        callback_data="coach_panel",
-                    )
-                )
-
                 await callback.message.edit_text(
                     translator.get("coach.progress.no_athletes", user_lang),
-                    reply_markup=keyboard.as_markup(),
+                    reply_markup=_build_back_to_coach_panel_markup(user_lang),
                 )
                 await callback.answer()
                 return
 
             # Build progress text
-            progress_text = (
-                translator.get("coach.progress.overview_title", user_lang) + "\n\n"
-            )
+            parts = [
+                translator.get("coach.progress.overview_title", user_lang),
+                "\n\n",
+            ]
 
             for athlete_data in progress_data:
                 athlete = athlete_data["athlete"]
                 measurements = athlete_data["measurements"]
 
-                athlete_name = athlete.first_name or athlete.username or "Unknown"
-                progress_text += f"👤 *{escape_markdown(athlete_name)}*\n"
+                athlete_name = display_name(athlete)
+                parts.append(f"👤 *{escape_markdown(athlete_name)}*\n")
 
                 if measurements:
                     for measurement in measurements:
                         date_str = measurement.measurement_date.strftime("%m/%d")
-                        progress_text += f"   {translator.get('coach.progress.measurement_format', user_lang, type=escape_markdown(measurement.measurement_type.name), value=measurement.value, unit=escape_markdown(measurement.measurement_type.unit), date=date_str)}\n"
+                        line = translator.get(
+                            "coach.progress.measurement_format",
+                            user_lang,
+                            type=escape_markdown(measurement.measurement_type.name),
+                            value=measurement.value,
+                            unit=escape_markdown(measurement.measurement_type.unit),
+                            date=date_str,
+                        )
+                        parts.append(f"   {line}\n")
                 else:
-                    progress_text += f"   {translator.get('coach.progress.no_measurements', user_lang)}\n"
+                    no_measurements = translator.get(
+                        "coach.progress.no_measurements", user_lang
+                    )
+                    parts.append(f"   {no_measurements}\n")
 
-                progress_text += "\n"
+                parts.append("\n")
+            progress_text = "".join(parts)
 
             keyboard = InlineKeyboardBuilder()
 
             # Add buttons for individual athlete details
             for athlete_data in progress_data:
                 athlete = athlete_data["athlete"]
-                athlete_name = athlete.first_name or athlete.username or "Unknown"
+                athlete_name = display_name(athlete)
                 keyboard.add(
                     InlineKeyboardButton(
                         text=translator.get(
@@ -1819,7 +2072,9 @@ class BotHandlers:
                             user_lang,
                             name=athlete_name,
                         ),
-                        callback_data=f"view_athlete_{athlete.id}",
+                        callback_data=AthleteCallback(
+                            action="view", id=athlete.id
+                        ).pack(),
                     )
                 )
 
@@ -1838,38 +2093,35 @@ class BotHandlers:
 
         except Exception as e:
             logger.error(f"Error viewing all athletes progress: {e}")
-            user_id = await BotHandlers.get_or_create_user(callback.from_user)
-            error_msg = await BotHandlers.get_error_message(user_id)
+            error_msg = await BotHandlers.get_error_message_by_telegram_id(
+                callback.from_user.id
+            )
             await callback.answer(error_msg)
 
     @staticmethod
-    async def handle_view_athlete_detail(callback: CallbackQuery):
+    async def handle_view_athlete_detail(
+        callback: CallbackQuery, callback_data: AthleteCallback
+    ):
         """Handle viewing individual athlete details."""
         try:
-            # Extract athlete ID from callback data
-            athlete_id = int(callback.data.replace("view_athlete_", ""))
-            user_id = await BotHandlers.get_or_create_user(callback.from_user)
-            user_lang = await BotHandlers.get_user_language(user_id)
+            athlete_id = callback_data.id
+            user_id, user_lang = await BotHandlers.get_or_create_user_with_lang(
+                callback.from_user
+            )
 
             # Get athlete details and measurements
             async def _get_athlete_details(session):
-                # Check permission
-                has_permission = await CoachAthleteRepository.is_coach_of_athlete(
+                # Missing athletes and ones the coach doesn't supervise look
+                # the same: no row
+                athlete = await CoachAthleteRepository.get_supervised_athlete(
                     session, user_id, athlete_id
                 )
-                if not has_permission:
-                    return None
-
-                # Get athlete info
-                athlete = await UserRepository.get_user_by_id(session, athlete_id)
                 if not athlete:
                     return None
 
                 # Get recent measurements
-                measurements = (
-                    await MeasurementRepository.get_athlete_measurements_for_coach(
-                        session, user_id, athlete_id, limit=10
-                    )
+                measurements = await MeasurementRepository.get_user_measurements(
+                    session, athlete_id, limit=10
                 )
 
                 return {"athlete": athlete, "measurements": measurements}
@@ -1888,7 +2140,7 @@ class BotHandlers:
 
             athlete = data["athlete"]
             measurements = data["measurements"]
-            athlete_name = athlete.first_name or athlete.username or "Unknown"
+            athlete_name = display_name(athlete)
 
             # Build detailed view with escaped markdown
             detail_text = f"👤 *{escape_markdown(athlete_name)}*\n"
@@ -1899,7 +2151,7 @@ class BotHandlers:
             if measurements:
                 detail_text += "📊 *Recent Measurements:*\n\n"
                 for measurement in measurements:
-                    date_str = measurement.measurement_date.strftime("%m/%d %H:%M")
+                    date_str = _fmt_dt_short(measurement.measurement_date)
                     detail_text += (
                         f"📏 *{escape_markdown(measurement.measurement_type.name)}*\n"
                     )
@@ -1919,7 +2171,9 @@ class BotHandlers:
                 ),
                 InlineKeyboardButton(
                     text=translator.get("coach.buttons.remove_athlete", user_lang),
-                    callback_data=f"confirm_remove_athlete_{athlete_id}",
+                    callback_data=AthleteCallback(
+                        action="remove", id=athlete_id
+                    ).pack(),
                 ),
                 InlineKeyboardButton(
                     text=translator.get("coach.buttons.view_all_progress", user_lang),
@@ -1935,67 +2189,59 @@ class BotHandlers:
 
         except Exception as e:
             logger.error(f"Error viewing athlete detail: {e}")
-            user_id = await BotHandlers.get_or_create_user(callback.from_user)
-            error_msg = await BotHandlers.get_error_message(user_id)
+            error_msg = await BotHandlers.get_error_message_by_telegram_id(
+                callback.from_user.id
+            )
             await callback.answer(error_msg)
 
     @staticmethod
     async def handle_coach_stats(callback: CallbackQuery):
         """Handle viewing coach statistics."""
         try:
-            user_id = await BotHandlers.get_or_create_user(callback.from_user)
-            user_lang = await BotHandlers.get_user_language(user_id)
-
-            # Get coach statistics
-            async def _get_coach_stats(session):
-                is_coach = await PermissionManager.check_coach_permission(
-                    session, user_id
-                )
-                if not is_coach:
-                    return None
-
-                # Get athlete count
-                athlete_count = await CoachAthleteRepository.get_coach_athlete_count(
-                    session, user_id
-                )
-
-                # Get notification stats
-                notification_stats = (
-                    await CoachNotificationRepository.get_notification_stats(
-                        session, user_id
-                    )
-                )
-
-                # Get recent activity
-                recent_measurements = await MeasurementRepository.get_recent_measurements_for_coach_athletes(
-                    session, user_id, days=7
-                )
-
-                return {
-                    "athlete_count": athlete_count,
-                    "notification_stats": notification_stats,
-                    "recent_measurements": len(recent_measurements),
-                    "athletes_active_today": len(
-                        set(
-                            m.user_id
-                            for m in recent_measurements
-                            if (datetime.now(UTC) - m.measurement_date).days == 0
-                        )
-                    ),
-                }
-
-            stats = await DatabaseManager.execute_with_session(_get_coach_stats)
+            user_id, user_lang, is_coach = await BotHandlers.execute_as_user(
+                callback.from_user, PermissionManager.check_coach_permission
+            )
 
-            if stats is None:
-                user_lang = await BotHandlers.get_user_language_by_telegram_id(
-                    callback.from_user.id
-                )
+            if not is_coach:
                 await callback.message.edit_text(
                     translator.get("coach.errors.permission_denied", user_lang)
                 )
                 await callback.answer()
                 return
 
+            # The statistics queries are independent, so run them at once; each
+            # gets its own pooled session
+            (
+                athlete_count,
+                notification_stats,
+                recent_measurements,
+            ) = await asyncio.gather(
+                DatabaseManager.execute_with_session(
+                    CoachAthleteRepository.get_coach_athlete_count, user_id
+                ),
+                DatabaseManager.execute_with_session(
+                    CoachNotificationRepository.get_notification_stats, user_id
+                ),
+                DatabaseManager.execute_with_session(
+                    MeasurementRepository.get_recent_measurements_for_coach_athletes,
+                    user_id,
+                    days=7,
+                ),
+            )
+            now = datetime.now(UTC)
+            stats = {
+                "athlete_count": athlete_count,
+                "notification_stats": notification_stats,
+                "recent_measurements": len(recent_measurements),
+                "athletes_active_today": len(
+                    {
+                        m.user_id
+                        for m in recent_measurements
+                        if (now - m.measurement_date).days == 0
+                    }
+                ),
+            }
+
             stats_text = translator.get("coach.stats.title", user_lang) + "\n\n"
             stats_text += (
                 translator.get(
@@ -2064,22 +2310,21 @@ class BotHandlers:
 
         except Exception as e:
             logger.error(f"Error viewing coach stats: {e}")
-            user_id = await BotHandlers.get_or_create_user(callback.from_user)
-            error_msg = await BotHandlers.get_error_message(user_id)
+            error_msg = await BotHandlers.get_error_message_by_telegram_id(
+                callback.from_user.id
+            )
             await callback.answer(error_msg)
 
     @staticmethod
     async def handle_coach_panel(callback: CallbackQuery):
         """Handle showing coach panel with all coach functions."""
         try:
-            user_id = await BotHandlers.get_or_create_user(callback.from_user)
-            user_lang = await BotHandlers.get_user_language(user_id)
+            user_id, user_lang = await BotHandlers.get_or_create_user_with_lang(
+                callback.from_user
+            )
 
             # Check if user is actually a coach
-            async def _check_coach_role(session):
-                return await UserRepository.is_user_coach(session, user_id)
-
-            is_coach = await DatabaseManager.execute_with_session(_check_coach_role)
+            is_coach = await BotHandlers.is_user_coach_cached(user_id)
 
             if not is_coach:
                 await callback.answer(
@@ -2087,63 +2332,32 @@ class BotHandlers:
                 )
                 return
 
-            keyboard = InlineKeyboardBuilder()
-            keyboard.add(
-                InlineKeyboardButton(
-                    text=translator.get("coach.buttons.my_athletes", user_lang),
-                    callback_data="coach_athletes",
-                ),
-                InlineKeyboardButton(
-                    text=translator.get("coach.buttons.athletes_progress", user_lang),
-                    callback_data="view_all_athletes_progress",
-                ),
-                InlineKeyboardButton(
-                    text=translator.get("coach.buttons.coach_notifications", user_lang),
-                    callback_data="coach_notifications",
-                ),
-                InlineKeyboardButton(
-                    text=translator.get("coach.buttons.coach_stats", user_lang),
-                    callback_data="coach_stats",
-                ),
-                InlineKeyboardButton(
-                    text=translator.get("coach.buttons.coach_guide", user_lang),
-                    callback_data="coach_guide",
-                ),
-                InlineKeyboardButton(
-                    text=translator.get("coach.buttons.cancel_coaching", user_lang),
-                    callback_data="cancel_coaching_confirm",
-                ),
-                InlineKeyboardButton(
-                    text=translator.get("buttons.back_to_menu", user_lang),
-                    callback_data="back_to_menu",
-                ),
-            )
-            keyboard.adjust(2, 1, 1)
-
             # Add invisible element to ensure message content is different
             import random
 
-            invisible_char = chr(0x200B) * random.randint(0, 3)  # Zero-width space
+            invisible_char = ZWSP * random.randint(0, 3)
             panel_text = translator.get("coach.panel.title", user_lang) + invisible_char
 
             await callback.message.edit_text(
                 panel_text,
-                reply_markup=keyboard.as_markup(),
+                reply_markup=_build_coach_panel_markup(user_lang),
                 parse_mode="Markdown",
             )
             await callback.answer()
         except Exception as e:
             logger.error(f"Error in coach panel: {e}")
-            user_id = await BotHandlers.get_or_create_user(callback.from_user)
-            error_msg = await BotHandlers.get_error_message(user_id)
+            error_msg = await BotHandlers.get_error_message_by_telegram_id(
+                callback.from_user.id
+            )
             await callback.answer(error_msg)
 
     @staticmethod
     async def handle_coach_guide(callback: CallbackQuery):
         """Handle showing coach guide."""
         try:
-            user_id = await BotHandlers.get_or_create_user(callback.from_user)
-            user_lang = await BotHandlers.get_user_language(user_id)
+            user_id, user_lang = await BotHandlers.get_or_create_user_with_lang(
+                callback.from_user
+            )
 
             guide_text = f"{translator.get('coach.guide.title', user_lang)}\n\n{translator.get('coach.guide.content', user_lang)}"
 
@@ -2166,22 +2380,21 @@ class BotHandlers:
             await callback.answer()
         except Exception as e:
             logger.error(f"Error in coach guide: {e}")
-            user_id = await BotHandlers.get_or_create_user(callback.from_user)
-            error_msg = await BotHandlers.get_error_message(user_id)
+            error_msg = await BotHandlers.get_error_message_by_telegram_id(
+                callback.from_user.id
+            )
             await callback.answer(error_msg)
 
     @staticmethod
     async def handle_cancel_coaching_confirm(callback: CallbackQuery):
         """Handle showing cancel coaching confirmation."""
         try:
-            user_id = await BotHandlers.get_or_create_user(callback.from_user)
-            user_lang = await BotHandlers.get_user_language(user_id)
+            user_id, user_lang = await BotHandlers.get_or_create_user_with_lang(
+                callback.from_user
+            )
 
             # Check if user is actually a coach
-            async def _check_coach_role(session):
-                return await UserRepository.is_user_coach(session, user_id)
-
-            is_coach = await DatabaseManager.execute_with_session(_check_coach_role)
+            is_coach = await BotHandlers.is_user_coach_cached(user_id)
 
             if not is_coach:
                 await callback.answer(
@@ -2221,16 +2434,18 @@ class BotHandlers:
 
         except Exception as e:
             logger.error(f"Error in cancel coaching confirm: {e}")
-            user_id = await BotHandlers.get_or_create_user(callback.from_user)
-            error_msg = await BotHandlers.get_error_message(user_id)
+            error_msg = await BotHandlers.get_error_message_by_telegram_id(
+                callback.from_user.id
+            )
             await callback.answer(error_msg)
 
     @staticmethod
     async def handle_cancel_coaching(callback: CallbackQuery):
         """Handle actual cancellation of coaching role."""
         try:
-            user_id = await BotHandlers.get_or_create_user(callback.from_user)
-            user_lang = await BotHandlers.get_user_language(user_id)
+            user_id, user_lang = await BotHandlers.get_or_create_user_with_lang(
+                callback.from_user
+            )
 
             # Check if user is actually a coach
             async def _cancel_coaching_role(session):
@@ -2280,6 +2495,8 @@ class BotHandlers:
             success, result = await DatabaseManager.execute_with_session(
                 _cancel_coaching_role
             )
+            if success or result == "not_coach":
+                cache_coach_status(user_id, False)
 
             if not success:
                 if result == "not_coach":
@@ -2318,16 +2535,18 @@ class BotHandlers:
 
         except Exception as e:
             logger.error(f"Error cancelling coaching: {e}")
-            user_id = await BotHandlers.get_or_create_user(callback.from_user)
-            error_msg = await BotHandlers.get_error_message(user_id)
+            error_msg = await BotHandlers.get_error_message_by_telegram_id(
+                callback.from_user.id
+            )
             await callback.answer(error_msg)
 
     @staticmethod
     async def handle_add_measurement(callback: CallbackQuery):
         """Handle add measurement callback."""
         try:
-            user_id = await BotHandlers.get_or_create_user(callback.from_user)
-            user_lang = await BotHandlers.get_user_language(user_id)
+            user_id, user_lang = await BotHandlers.get_or_create_user_with_lang(
+                callback.from_user
+            )
 
             async def _get_user_types(session):
                 return await UserMeasurementTypeRepository.get_user_measurement_types(
@@ -2360,16 +2579,15 @@ class BotHandlers:
 
             keyboard = InlineKeyboardBuilder()
             for user_type in user_types:
+                measurement_type = user_type.measurement_type
                 type_name = translator.get_measurement_type_name(
-                    user_type.measurement_type.name, user_lang
-                )
-                unit_name = translator.get_unit_name(
-                    user_type.measurement_type.unit, user_lang
+                    measurement_type.name, user_lang
                 )
+                unit_name = translator.get_unit_name(measurement_type.unit, user_lang)
                 keyboard.add(
                     InlineKeyboardButton(
                         text=f"{type_name} ({unit_name})",
-                        callback_data=f"measure_{user_type.measurement_type.id}",
+                        callback_data=f"measure_{measurement_type.id}",
                     )
                 )
             keyboard.add(
@@ -2401,9 +2619,10 @@ class BotHandlers:
     async def handle_measure_type(callback: CallbackQuery, state: FSMContext):
         """Handle measurement type selection for adding value."""
         try:
-            measurement_type_id = int(callback.data.split("_")[1])
-            user_id = await BotHandlers.get_or_create_user(callback.from_user)
-            user_lang = await BotHandlers.get_user_language(user_id)
+            measurement_type_id = int(callback.data.rpartition("_")[2])
+            user_id, user_lang = await BotHandlers.get_or_create_user_with_lang(
+                callback.from_user
+            )
 
             async def _get_type_info(session):
                 return await MeasurementTypeRepository.get_type_by_id(
@@ -2483,8 +2702,9 @@ class BotHandlers:
         try:
             data = await state.get_data()
             measurement_type_id = data.get("measurement_type_id")
-            user_id = await BotHandlers.get_or_create_user(message.from_user)
-            user_lang = await BotHandlers.get_user_language(user_id)
+            user_id, user_lang = await BotHandlers.get_or_create_user_with_lang(
+                message.from_user
+            )
 
             if not measurement_type_id:
                 await message.answer(translator.get("common.error", user_lang))
@@ -2570,8 +2790,9 @@ class BotHandlers:
     async def handle_manage_types(callback: CallbackQuery):
         """Handle manage measurement types."""
         try:
-            user_id = await BotHandlers.get_or_create_user(callback.from_user)
-            user_lang = await BotHandlers.get_user_language(user_id)
+            user_id, user_lang = await BotHandlers.get_or_create_user_with_lang(
+                callback.from_user
+            )
 
             async def _get_data(session):
                 user_types = (
@@ -2627,13 +2848,14 @@ class BotHandlers:
             if user_types:
                 current_types_list = []
                 for ut in user_types:
+                    measurement_type = ut.measurement_type
                     type_name = translator.get_measurement_type_name(
-                        ut.measurement_type.name, user_lang
+                        measurement_type.name, user_lang
                     )
                     unit_name = translator.get_unit_name(
-                        ut.measurement_type.unit, user_lang
+                        measurement_type.unit, user_lang
                     )
-                    icon = "🔧" if ut.measurement_type.is_custom else "📏"
+                    icon = "🔧" if measurement_type.is_custom else "📏"
                     current_types_list.append(f"{icon} {type_name} ({unit_name})")
                 current_types_text = "\n\n📋 " + "\n".join(current_types_list)
 
@@ -2658,8 +2880,9 @@ class BotHandlers:
     async def handle_add_types(callback: CallbackQuery):
         """Handle adding measurement types to user."""
         try:
-            user_id = await BotHandlers.get_or_create_user(callback.from_user)
-            user_lang = await BotHandlers.get_user_language(user_id)
+            user_id, user_lang = await BotHandlers.get_or_create_user_with_lang(
+                callback.from_user
+            )
 
             async def _get_available_types(session):
                 user_types = (
@@ -2732,9 +2955,10 @@ class BotHandlers:
     async def handle_add_type_confirm(callback: CallbackQuery):
         """Handle confirmation of adding a measurement type."""
         try:
-            measurement_type_id = int(callback.data.split("_")[2])
-            user_id = await BotHandlers.get_or_create_user(callback.from_user)
-            user_lang = await BotHandlers.get_user_language(user_id)
+            measurement_type_id = int(callback.data.rpartition("_")[2])
+            user_id, user_lang = await BotHandlers.get_or_create_user_with_lang(
+                callback.from_user
+            )
 
             async def _add_type(session):
                 await UserMeasurementTypeRepository.add_measurement_type_to_user(
@@ -2763,8 +2987,9 @@ class BotHandlers:
     async def handle_create_custom_type(callback: CallbackQuery, state: FSMContext):
         """Start the custom measurement type creation flow."""
         try:
-            user_id = await BotHandlers.get_or_create_user(callback.from_user)
-            user_lang = await BotHandlers.get_user_language(user_id)
+            user_id, user_lang = await BotHandlers.get_or_create_user_with_lang(
+                callback.from_user
+            )
 
             await state.set_state(UserStates.creating_custom_type_name)
 
@@ -2787,8 +3012,9 @@ class BotHandlers:
             logger.error(f"Error in handle_create_custom_type: {e}")
             user_lang = "uk"  # default fallback
             try:
-                user_id = await BotHandlers.get_or_create_user(callback.from_user)
-                user_lang = await BotHandlers.get_user_language(user_id)
+                user_lang = await BotHandlers.get_user_language_by_telegram_id(
+                    callback.from_user.id
+                )
             except Exception:
                 pass  # use fallback
             await callback.answer(translator.get("common.error", user_lang))
@@ -2797,11 +3023,11 @@ class BotHandlers:
     async def handle_custom_type_name(message: Message, state: FSMContext):
         """Handle custom type name input."""
         try:
-            user_id = await BotHandlers.get_or_create_user(message.from_user)
+            user_id, user_lang = await BotHandlers.get_or_create_user_with_lang(
+                message.from_user
+            )
             name = message.text.strip()
 
-            user_lang = await BotHandlers.get_user_language(user_id)
-
             # Validate name length
             if len(name) < 2:
                 await message.reply(
@@ -2850,8 +3076,9 @@ class BotHandlers:
             logger.error(f"Error in handle_custom_type_name: {e}")
             user_lang = "uk"  # default fallback
             try:
-                user_id = await BotHandlers.get_or_create_user(message.from_user)
-                user_lang = await BotHandlers.get_user_language(user_id)
+                user_lang = await BotHandlers.get_user_language_by_telegram_id(
+                    message.from_user.id
+                )
             except Exception:
                 pass  # use fallback
             await message.reply(translator.get("common.error", user_lang))
@@ -2862,8 +3089,9 @@ class BotHandlers:
         try:
             unit = message.text.strip()
 
-            user_id = await BotHandlers.get_or_create_user(message.from_user)
-            user_lang = await BotHandlers.get_user_language(user_id)
+            user_id, user_lang = await BotHandlers.get_or_create_user_with_lang(
+                message.from_user
+            )
 
             # Validate unit length
             if len(unit) < 1:
@@ -2909,8 +3137,9 @@ class BotHandlers:
             logger.error(f"Error in handle_custom_type_unit: {e}")
             user_lang = "uk"  # default fallback
             try:
-                user_id = await BotHandlers.get_or_create_user(message.from_user)
-                user_lang = await BotHandlers.get_user_language(user_id)
+                user_lang = await BotHandlers.get_user_language_by_telegram_id(
+                    message.from_user.id
+                )
             except Exception:
                 pass  # use fallback
             await message.reply(translator.get("common.error", user_lang))
@@ -2921,8 +3150,9 @@ class BotHandlers:
         try:
             description = message.text.strip()
 
-            user_id = await BotHandlers.get_or_create_user(message.from_user)
-            user_lang = await BotHandlers.get_user_language(user_id)
+            user_id, user_lang = await BotHandlers.get_or_create_user_with_lang(
+                message.from_user
+            )
 
             # Validate description length
             if len(description) > 200:
@@ -2939,8 +3169,9 @@ class BotHandlers:
             logger.error(f"Error in handle_custom_type_description: {e}")
             user_lang = "uk"  # default fallback
             try:
-                user_id = await BotHandlers.get_or_create_user(message.from_user)
-                user_lang = await BotHandlers.get_user_language(user_id)
+                user_lang = await BotHandlers.get_user_language_by_telegram_id(
+                    message.from_user.id
+                )
             except Exception:
                 pass  # use fallback
             await message.reply(translator.get("common.error", user_lang))
@@ -2956,8 +3187,9 @@ class BotHandlers:
             logger.error(f"Error in handle_skip_description: {e}")
             user_lang = "uk"  # default fallback
             try:
-                user_id = await BotHandlers.get_or_create_user(callback.from_user)
-                user_lang = await BotHandlers.get_user_language(user_id)
+                user_lang = await BotHandlers.get_user_language_by_telegram_id(
+                    callback.from_user.id
+                )
             except Exception:
                 pass  # use fallback
             await callback.answer(translator.get("common.error", user_lang))
@@ -2968,7 +3200,9 @@ class BotHandlers:
     ):
         """Create the custom measurement type and add it to user's tracking list."""
         try:
-            user_id = await BotHandlers.get_or_create_user(message.from_user)
+            user_id, user_lang = await BotHandlers.get_or_create_user_with_lang(
+                message.from_user
+            )
             data = await state.get_data()
 
             name = data["custom_type_name"]
@@ -2996,8 +3230,6 @@ class BotHandlers:
             # Clear the state
             await state.clear()
 
-            user_lang = await BotHandlers.get_user_language(user_id)
-
             # Show success message
             if description:
                 success_message = translator.get(
@@ -3046,8 +3278,9 @@ class BotHandlers:
             logger.error(f"Error in create_custom_measurement_type: {e}")
             user_lang = "uk"  # default fallback
             try:
-                user_id = await BotHandlers.get_or_create_user(message.from_user)
-                user_lang = await BotHandlers.get_user_language(user_id)
+                user_lang = await BotHandlers.get_user_language_by_telegram_id(
+                    message.from_user.id
+                )
             except Exception:
                 user_lang = "uk"  # fallback language
             await message.reply(translator.get("custom_types.error", user_lang))
@@ -3057,8 +3290,9 @@ class BotHandlers:
     async def handle_remove_types(callback: CallbackQuery):
         """Handle removing measurement types from user."""
         try:
-            user_id = await BotHandlers.get_or_create_user(callback.from_user)
-            user_lang = await BotHandlers.get_user_language(user_id)
+            user_id, user_lang = await BotHandlers.get_or_create_user_with_lang(
+                callback.from_user
+            )
 
             async def _get_user_types(session):
                 return await UserMeasurementTypeRepository.get_user_measurement_types(
@@ -3075,14 +3309,15 @@ class BotHandlers:
 
             keyboard = InlineKeyboardBuilder()
             for user_type in user_types:
+                measurement_type = user_type.measurement_type
                 # Translate measurement type name
                 translated_name = translator.get_measurement_type_name(
-                    user_type.measurement_type.name, user_lang
+                    measurement_type.name, user_lang
                 )
                 keyboard.add(
                     InlineKeyboardButton(
                         text=f"➖ {translated_name}",
-                        callback_data=f"remove_type_{user_type.measurement_type.id}",
+                        callback_data=f"remove_type_{measurement_type.id}",
                     )
                 )
             keyboard.add(
@@ -3109,9 +3344,10 @@ class BotHandlers:
     async def handle_remove_type_confirm(callback: CallbackQuery):
         """Handle confirmation of removing a measurement type."""
         try:
-            measurement_type_id = int(callback.data.split("_")[2])
-            user_id = await BotHandlers.get_or_create_user(callback.from_user)
-            user_lang = await BotHandlers.get_user_language(user_id)
+            measurement_type_id = int(callback.data.rpartition("_")[2])
+            user_id, user_lang = await BotHandlers.get_or_create_user_with_lang(
+                callback.from_user
+            )
 
             async def _remove_type(session):
                 success = await UserMeasurementTypeRepository.remove_measurement_type_from_user(
@@ -3148,8 +3384,9 @@ class BotHandlers:
     async def handle_view_progress(callback: CallbackQuery):
         """Handle view progress callback."""
         try:
-            user_id = await BotHandlers.get_or_create_user(callback.from_user)
-            user_lang = await BotHandlers.get_user_language(user_id)
+            user_id, user_lang = await BotHandlers.get_or_create_user_with_lang(
+                callback.from_user
+            )
 
             async def _get_user_types(session):
                 return await UserMeasurementTypeRepository.get_user_measurement_types(
@@ -3182,13 +3419,14 @@ class BotHandlers:
 
             keyboard = InlineKeyboardBuilder()
             for user_type in user_types:
+                measurement_type = user_type.measurement_type
                 type_name = translator.get_measurement_type_name(
-                    user_type.measurement_type.name, user_lang
+                    measurement_type.name, user_lang
                 )
                 keyboard.add(
                     InlineKeyboardButton(
                         text=f"📊 {type_name}",
-                        callback_data=f"progress_{user_type.measurement_type.id}",
+                        callback_data=f"progress_{measurement_type.id}",
                     )
                 )
             keyboard.add(
@@ -3219,9 +3457,10 @@ class BotHandlers:
     async def handle_progress_detail(callback: CallbackQuery):
         """Handle detailed progress view for a measurement type."""
         try:
-            measurement_type_id = int(callback.data.split("_")[1])
-            user_id = await BotHandlers.get_or_create_user(callback.from_user)
-            user_lang = await BotHandlers.get_user_language(user_id)
+            measurement_type_id = int(callback.data.rpartition("_")[2])
+            user_id, user_lang = await BotHandlers.get_or_create_user_with_lang(
+                callback.from_user
+            )
 
             async def _get_progress_data(session):
                 measurement_type = await MeasurementTypeRepository.get_type_by_id(
@@ -3313,8 +3552,9 @@ class BotHandlers:
     async def handle_statistics(callback: CallbackQuery):
         """Handle statistics overview."""
         try:
-            user_id = await BotHandlers.get_or_create_user(callback.from_user)
-            user_lang = await BotHandlers.get_user_language(user_id)
+            user_id, user_lang = await BotHandlers.get_or_create_user_with_lang(
+                callback.from_user
+            )
 
             async def _get_stats_overview(session):
                 user_types = (
@@ -3413,8 +3653,9 @@ class BotHandlers:
     async def handle_back_to_menu(callback: CallbackQuery):
         """Handle back to main menu."""
         try:
-            user_id = await BotHandlers.get_or_create_user(callback.from_user)
-            user_lang = await BotHandlers.get_user_language(user_id)
+            user_id, user_lang = await BotHandlers.get_or_create_user_with_lang(
+                callback.from_user
+            )
 
             keyboard = InlineKeyboardBuilder()
             keyboard.add(
@@ -3445,10 +3686,7 @@ class BotHandlers:
             )
 
             # Add coach options if user is a coach
-            async def _check_coach_role(session):
-                return await UserRepository.is_user_coach(session, user_id)
-
-            is_coach = await DatabaseManager.execute_with_session(_check_coach_role)
+            is_coach = await BotHandlers.is_user_coach_cached(user_id)
 
             if is_coach:
                 keyboard.add(
@@ -3477,7 +3715,7 @@ class BotHandlers:
             # Add invisible element to ensure message content is different
             import random
 
-            invisible_char = chr(0x200B) * random.randint(0, 3)  # Zero-width space
+            invisible_char = ZWSP * random.randint(0, 3)
             menu_text = (
                 translator.get("commands.menu.title", user_lang) + invisible_char
             )
@@ -3492,8 +3730,9 @@ class BotHandlers:
             logger.error(f"Error in handle_back_to_menu: {e}")
             user_lang = "uk"  # default fallback
             try:
-                user_id = await BotHandlers.get_or_create_user(callback.from_user)
-                user_lang = await BotHandlers.get_user_language(user_id)
+                user_lang = await BotHandlers.get_user_language_by_telegram_id(
+                    callback.from_user.id
+                )
             except Exception:
                 pass  # use fallback
             await callback.answer(translator.get("common.error", user_lang))
@@ -3547,11 +3786,12 @@ class BotHandlers:
     async def handle_view_by_date_period(callback: CallbackQuery):
         """Handle view measurements by date for specific period."""
         try:
-            user_id = await BotHandlers.get_or_create_user(callback.from_user)
-            user_lang = await BotHandlers.get_user_language(user_id)
+            user_id, user_lang = await BotHandlers.get_or_create_user_with_lang(
+                callback.from_user
+            )
 
             # Extract days from callback data
-            period = callback.data.split("_")[-1]
+            period = callback.data.rpartition("_")[2]
             if period == "all":
                 days = -1
                 period_text = translator.get("view_by_date.all_time", user_lang)
@@ -3615,11 +3855,12 @@ class BotHandlers:
                 measurements.sort(key=lambda m: m.measurement_type.name)
 
                 for measurement in measurements:
+                    measurement_type = measurement.measurement_type
                     type_name = translator.get_measurement_type_name(
-                        measurement.measurement_type.name, user_lang
+                        measurement_type.name, user_lang
                     )
                     unit_name = translator.get_unit_name(
-                        measurement.measurement_type.unit, user_lang
+                        measurement_type.unit, user_lang
                     )
                     value_str = (
                         f"{measurement.value:.1f}"
@@ -3697,8 +3938,9 @@ class BotHandlers:
     async def handle_notifications(callback: CallbackQuery):
         """Handle notifications menu."""
         try:
-            user_id = await BotHandlers.get_or_create_user(callback.from_user)
-            user_lang = await BotHandlers.get_user_language(user_id)
+            user_id, user_lang = await BotHandlers.get_or_create_user_with_lang(
+                callback.from_user
+            )
 
             async def _get_schedules(session):
                 return await NotificationScheduleRepository.get_user_schedules(
@@ -3855,9 +4097,8 @@ class BotHandlers:
             )
 
             # Extract frequency from callback data
-            freq_data = callback.data.split("_")[
-                -1
-            ]  # notification_freq_daily or notification_freq_0
+            # (notification_freq_daily or notification_freq_0)
+            freq_data = callback.data.rpartition("_")[2]
 
             if freq_data == "daily":
                 day_of_week = None
@@ -3892,8 +4133,9 @@ class BotHandlers:
     async def handle_notification_time(message: types.Message, state: FSMContext):
         """Handle notification time input."""
         try:
-            user_id = await BotHandlers.get_or_create_user(message.from_user)
-            user_lang = await BotHandlers.get_user_language(user_id)
+            user_id, user_lang = await BotHandlers.get_or_create_user_with_lang(
+                message.from_user
+            )
 
             # Validate time format
             time_pattern = re.compile(r"^([0-1][0-9]|2[0-3]):([0-5][0-9])$")
@@ -3990,8 +4232,9 @@ class BotHandlers:
     async def handle_manage_notifications(callback: CallbackQuery):
         """Handle manage notifications selection."""
         try:
-            user_id = await BotHandlers.get_or_create_user(callback.from_user)
-            user_lang = await BotHandlers.get_user_language(user_id)
+            user_id, user_lang = await BotHandlers.get_or_create_user_with_lang(
+                callback.from_user
+            )
 
             async def _get_schedules(session):
                 return await NotificationScheduleRepository.get_user_schedules(
@@ -4080,7 +4323,7 @@ class BotHandlers:
                 callback.from_user.id
             )
 
-            schedule_id = int(callback.data.split("_")[-1])
+            schedule_id = int(callback.data.rpartition("_")[2])
 
             async def _get_schedule(session):
                 return await NotificationScheduleRepository.get_schedule_by_id(
@@ -4166,7 +4409,7 @@ class BotHandlers:
                 callback.from_user.id
             )
 
-            schedule_id = int(callback.data.split("_")[-1])
+            schedule_id = int(callback.data.rpartition("_")[2])
 
             async def _toggle_schedule(session):
                 schedule = await NotificationScheduleRepository.get_schedule_by_id(
@@ -4205,7 +4448,7 @@ class BotHandlers:
                 callback.from_user.id
             )
 
-            schedule_id = int(callback.data.split("_")[-1])
+            schedule_id = int(callback.data.rpartition("_")[2])
 
             async def _get_schedule(session):
                 return await NotificationScheduleRepository.get_schedule_by_id(
@@ -4268,7 +4511,7 @@ class BotHandlers:
                 callback.from_user.id
             )
 
-            schedule_id = int(callback.data.split("_")[-1])
+            schedule_id = int(callback.data.rpartition("_")[2])
 
             async def _delete_schedule(session):
                 return await NotificationScheduleRepository.delete_schedule(
@@ -4478,6 +4721,9 @@ class BotHandlers:
             await callback.answer(translator.get("notifications.error", user_lang))
 
 
+# One database session per update, reused by every query its handler makes
+dp.update.outer_middleware(DbSessionMiddleware())
+
 # Register handlers
 dp.message.register(BotHandlers.start_command, Command("start"))
 dp.message.register(BotHandlers.menu_command, Command("menu"))
@@ -4529,7 +4775,7 @@ dp.callback_query.register(
 )
 dp.callback_query.register(
     BotHandlers.handle_confirm_remove_athlete,
-    F.data.startswith("confirm_remove_athlete_"),
+    AthleteCallback.filter(F.action == "remove"),
 )
 dp.callback_query.register(
     BotHandlers.handle_coach_notifications, F.data == "coach_notifications"
@@ -4560,7 +4806,8 @@ dp.callback_query.register(
     F.data == "view_all_athletes_progress",
 )
 dp.callback_query.register(
-    BotHandlers.handle_view_athlete_detail, F.data.startswith("view_athlete_")
+    BotHandlers.handle_view_athlete_detail,
+    AthleteCallback.filter(F.action == "view"),
 )
 dp.callback_query.register(BotHandlers.handle_coach_stats, F.data == "coach_stats")
 dp.callback_query.register(BotHandlers.handle_coach_guide, F.data == "coach_guide")
@@ -4600,9 +4847,7 @@ dp.callback_query.register(
 dp.callback_query.register(
     BotHandlers.handle_language_settings, F.data == "language_settings"
 )
-dp.callback_query.register(
-    BotHandlers.handle_set_language, F.data.startswith("set_language_")
-)
+dp.callback_query.register(BotHandlers.handle_set_language, LanguageCallback.filter())
 dp.callback_query.register(BotHandlers.handle_back_to_menu, F.data == "back_to_menu")
 
 # Notification handlers
@@ -4665,8 +4910,44 @@ async def init_measurement_types():
     await DatabaseManager.execute_with_session(_create_types)
 
 
+async def run_webhook(webhook_url: str):
+    """Serve updates over a webhook until cancelled.
+
+    webhook_url is the public HTTPS URL Telegram posts updates to; the local
+    listen address comes from WEBAPP_HOST and WEBAPP_PORT.
+    """
+    webhook_secret = os.getenv("WEBHOOK_SECRET")
+    host = os.getenv("WEBAPP_HOST", "0.0.0.0")
+    port = int(os.getenv("WEBAPP_PORT", "8080"))
+
+    app = web.Application()
+    SimpleRequestHandler(dispatcher=dp, bot=bot, secret_token=webhook_secret).register(
+        app, path=urlsplit(webhook_url).path or "/"
+    )
+    setup_application(app, dp, bot=bot)
+
+    runner = web.AppRunner(app)
+    await runner.setup()
+    try:
+        await web.TCPSite(runner, host, port).start()
+        await bot.set_webhook(
+            webhook_url,
+            secret_token=webhook_secret,
+            allowed_updates=dp.resolve_used_update_types(),
+        )
+        logger.info(f"Webhook listening on {host}:{port}")
+        await asyncio.Event().wait()
+    finally:
+        await runner.cleanup()
+
+
 async def main():
     """Main bot execution function."""
+    global bot
+    configure()
+    bot = create_bot()
+    dp.fsm.storage = create_storage()
+
     try:
         logger.info("Starting EasySize bot...")
 
@@ -4685,7 +4966,13 @@ async def main():
 
         # Start bot
         logger.info("Bot is starting...")
-        await dp.start_polling(bot)
+        # Webhook mode when WEBHOOK_URL is set, long polling otherwise
+        webhook_url = os.getenv("WEBHOOK_URL")
+        if webhook_url:
+            await run_webhook(webhook_url)
+        else:
+            # Only ask Telegram for the update types we have handlers for
+            await dp.start_polling(bot, allowed_updates=dp.resolve_used_update_types())
 
     except Exception as e:
         logger.error(f"Error starting bot: {e}")
@@ -4696,6 +4983,7 @@ async def main():
             await scheduler.stop()
             logger.info("Notification scheduler stopped")
 
+        await dp.storage.close()
         await close_db()
         logger.info("Bot stopped")
 
@@ -1,7 +1,7 @@
 import logging
 from datetime import UTC, datetime, timedelta
 
-from sqlalchemy import desc, func, select
+from sqlalchemy import bindparam, desc, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -13,6 +13,21 @@ from .models import (
 
 logger = logging.getLogger(__name__)
 
+# Built once; the history screen executes it with bound parameters
+_NOTIFICATION_HISTORY_STMT = (
+    select(CoachNotificationQueue)
+    .options(
+        selectinload(CoachNotificationQueue.athlete),
+        selectinload(CoachNotificationQueue.measurement),
+    )
+    .where(
+        CoachNotificationQueue.coach_id == bindparam("coach_id"),
+        CoachNotificationQueue.created_at >= bindparam("cutoff_date"),
+    )
+    .order_by(desc(CoachNotificationQueue.created_at))
+    .limit(bindparam("limit"))
+)
+
 
 class CoachNotificationRepository:
     """Repository for coach notification operations."""
@@ -211,17 +226,8 @@ class CoachNotificationRepository:
             cutoff_date = datetime.now(UTC) - timedelta(days=days)
 
             result = await session.execute(
-                select(CoachNotificationQueue)
-                .options(
-                    selectinload(CoachNotificationQueue.athlete),
-                    selectinload(CoachNotificationQueue.measurement),
-                )
-                .where(
-                    CoachNotificationQueue.coach_id == coach_id,
-                    CoachNotificationQueue.created_at >= cutoff_date,
-                )
-                .order_by(desc(CoachNotificationQueue.created_at))
-                .limit(limit)
+                _NOTIFICATION_HISTORY_STMT,
+                {"coach_id": coach_id, "cutoff_date": cutoff_date, "limit": limit},
             )
             notifications = result.scalars().all()
 
@@ -1,9 +1,10 @@
 import logging
+import re
 from datetime import datetime, timedelta
 
-from sqlalchemy import func, select
+from sqlalchemy import bindparam, exists, false, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import aliased, selectinload
 
 from .models import (
     AthleteCoachRequest,
@@ -14,6 +15,29 @@ from .models import (
 
 logger = logging.getLogger(__name__)
 
+# Identifiers a coach may type to add an athlete: a Telegram ID (bounded so it
+# fits the BIGINT column) or a Telegram username with an optional "@"
+TELEGRAM_ID_RE = re.compile(r"\d{1,15}")
+USERNAME_RE = re.compile(r"@?([A-Za-z0-9_]{5,32})")
+
+# Request lookups run on every coach request callback; they are built once
+# here and executed with bound parameters.
+_REQUEST_WITH_USERS_STMT = select(AthleteCoachRequest).options(
+    selectinload(AthleteCoachRequest.coach),
+    selectinload(AthleteCoachRequest.athlete),
+)
+_REQUEST_BY_ID_STMT = _REQUEST_WITH_USERS_STMT.where(
+    AthleteCoachRequest.id == bindparam("request_id")
+)
+_ATHLETE_PENDING_REQUESTS_STMT = _REQUEST_WITH_USERS_STMT.where(
+    AthleteCoachRequest.athlete_id == bindparam("athlete_id"),
+    AthleteCoachRequest.status == AthleteCoachRequestStatus.PENDING,
+).order_by(AthleteCoachRequest.created_at.desc())
+_COACH_PENDING_REQUESTS_STMT = _REQUEST_WITH_USERS_STMT.where(
+    AthleteCoachRequest.coach_id == bindparam("coach_id"),
+    AthleteCoachRequest.status == AthleteCoachRequestStatus.PENDING,
+).order_by(AthleteCoachRequest.created_at.desc())
+
 
 class CoachAthleteRepository:
     """Repository for CoachAthleteRelationship operations."""
@@ -189,6 +213,73 @@ class CoachAthleteRepository:
             )
             raise
 
+    @staticmethod
+    async def get_supervised_athlete(
+        session: AsyncSession, coach_id: int, athlete_id: int
+    ) -> User | None:
+        """Get an athlete only if the coach actively supervises them."""
+        try:
+            result = await session.execute(
+                select(User).where(
+                    User.id == athlete_id,
+                    exists().where(
+                        CoachAthleteRelationship.coach_id == coach_id,
+                        CoachAthleteRelationship.athlete_id == User.id,
+                        CoachAthleteRelationship.is_active,
+                    ),
+                )
+            )
+            return result.scalar_one_or_none()
+
+        except Exception as e:
+            logger.error(
+                f"Error fetching athlete {athlete_id} for coach {coach_id}: {e}"
+            )
+            raise
+
+    @staticmethod
+    async def resolve_athlete_for_coach(
+        session: AsyncSession, coach_id: int, identifier: str
+    ) -> tuple[User | None, User | None, bool]:
+        """Get (coach, athlete, already linked) for an add-athlete request.
+
+        The identifier is a Telegram ID or a username with an optional "@".
+        Everything is resolved in a single query.
+        """
+        identifier = identifier.strip()
+        coach = aliased(User)
+        athlete = aliased(User)
+        # Match on exactly one indexed column; input that cannot be either
+        # identifier skips the athlete lookup entirely
+        if TELEGRAM_ID_RE.fullmatch(identifier):
+            athlete_match = athlete.telegram_id == int(identifier)
+        elif username := USERNAME_RE.fullmatch(identifier):
+            athlete_match = athlete.username == username.group(1)
+        else:
+            athlete_match = false()
+        linked = exists().where(
+            CoachAthleteRelationship.coach_id == coach.id,
+            CoachAthleteRelationship.athlete_id == athlete.id,
+            CoachAthleteRelationship.is_active,
+        )
+        try:
+            result = await session.execute(
+                select(coach, athlete, linked)
+                .outerjoin(athlete, athlete_match)
+                .where(coach.id == coach_id)
+                .limit(1)
+            )
+            row = result.one_or_none()
+            if row is None:
+                return None, None, False
+            return row[0], row[1], bool(row[2])
+
+        except Exception as e:
+            logger.error(
+                f"Error resolving athlete '{identifier}' for coach {coach_id}: {e}"
+            )
+            raise
+
     @staticmethod
     async def get_all_relationships(
         session: AsyncSession, active_only: bool = True
@@ -373,12 +464,7 @@ class AthleteCoachRequestRepository:
         """Get request by ID."""
         try:
             result = await session.execute(
-                select(AthleteCoachRequest)
-                .options(
-                    selectinload(AthleteCoachRequest.coach),
-                    selectinload(AthleteCoachRequest.athlete),
-                )
-                .where(AthleteCoachRequest.id == request_id)
+                _REQUEST_BY_ID_STMT, {"request_id": request_id}
             )
             return result.scalar_one_or_none()
 
@@ -393,16 +479,7 @@ class AthleteCoachRequestRepository:
         """Get all pending requests for athlete."""
         try:
             result = await session.execute(
-                select(AthleteCoachRequest)
-                .options(
-                    selectinload(AthleteCoachRequest.coach),
-                    selectinload(AthleteCoachRequest.athlete),
-                )
-                .where(
-                    AthleteCoachRequest.athlete_id == athlete_id,
-                    AthleteCoachRequest.status == AthleteCoachRequestStatus.PENDING,
-                )
-                .order_by(AthleteCoachRequest.created_at.desc())
+                _ATHLETE_PENDING_REQUESTS_STMT, {"athlete_id": athlete_id}
             )
             return result.scalars().all()
 
@@ -419,16 +496,7 @@ class AthleteCoachRequestRepository:
         """Get all pending requests from coach."""
         try:
             result = await session.execute(
-                select(AthleteCoachRequest)
-                .options(
-                    selectinload(AthleteCoachRequest.coach),
-                    selectinload(AthleteCoachRequest.athlete),
-                )
-                .where(
-                    AthleteCoachRequest.coach_id == coach_id,
-                    AthleteCoachRequest.status == AthleteCoachRequestStatus.PENDING,
-                )
-                .order_by(AthleteCoachRequest.created_at.desc())
+                _COACH_PENDING_REQUESTS_STMT, {"coach_id": coach_id}
             )
             return result.scalars().all()
 
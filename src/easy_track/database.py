@@ -1,4 +1,7 @@
+import contextvars
 import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
@@ -16,6 +19,9 @@ engine = create_async_engine(
     max_overflow=0,
     pool_pre_ping=True,
     pool_recycle=3600,
+    # Compiled SQL cache shared by all sessions (SQLAlchemy's default size,
+    # kept explicit so it is not accidentally disabled)
+    query_cache_size=1200,
 )
 
 # Create async session factory
@@ -28,6 +34,32 @@ AsyncSessionLocal = async_sessionmaker(
 )
 
 
+class _SharedSession:
+    """Session shared by the database calls made while handling one update."""
+
+    __slots__ = ("session", "in_use")
+
+    def __init__(self):
+        self.session: AsyncSession | None = None
+        self.in_use = False
+
+
+_shared_session: contextvars.ContextVar[_SharedSession | None] = contextvars.ContextVar(
+    "shared_session", default=None
+)
+
+
+def detached_context() -> contextvars.Context:
+    """Copy the current context without the update's shared session.
+
+    Tasks that may outlive the update must run in such a context, since the
+    shared session is closed when the update is done.
+    """
+    context = contextvars.copy_context()
+    context.run(_shared_session.set, None)
+    return context
+
+
 async def get_db_session() -> AsyncSession:
     """Get database session for dependency injection."""
     async with AsyncSessionLocal() as session:
@@ -37,12 +69,27 @@ async def get_db_session() -> AsyncSession:
             await session.close()
 
 
+_initialized = False
+
+
 async def init_db():
     """Initialize database tables."""
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
 
+async def ensure_initialized():
+    """Initialize database tables once per process.
+
+    Scripts that may be imported or run in sequence in one process can call
+    this instead of init_db() to skip repeating the create_all round trips.
+    """
+    global _initialized
+    if not _initialized:
+        await init_db()
+        _initialized = True
+
+
 async def close_db():
     """Close database engine."""
     await engine.dispose()
@@ -57,15 +104,56 @@ class DatabaseManager:
         return AsyncSessionLocal()
 
     @staticmethod
-    async def execute_with_session(func, *args, **kwargs):
-        """Execute function with database session."""
-        async with AsyncSessionLocal() as session:
+    @asynccontextmanager
+    async def shared_session() -> AsyncIterator[None]:
+        """Let session scopes opened inside this block reuse one session.
+
+        The session is created on first use and closed on exit. Scopes that
+        start while it is already in use (nested or concurrent) get their own.
+        """
+        shared = _SharedSession()
+        token = _shared_session.set(shared)
+        try:
+            yield
+        finally:
+            _shared_session.reset(token)
+            if shared.session is not None:
+                await shared.session.close()
+
+    @staticmethod
+    @asynccontextmanager
+    async def session_scope() -> AsyncIterator[AsyncSession]:
+        """Provide a session wrapped in a single transaction.
+
+        Use this to run several repository calls against one session instead
+        of opening a new session and transaction for each of them.
+        """
+        shared = _shared_session.get()
+        if shared is not None and not shared.in_use:
+            if shared.session is None:
+                shared.session = AsyncSessionLocal()
+            session = shared.session
+            shared.in_use = True
             try:
-                result = await func(session, *args, **kwargs)
+                yield session
                 await session.commit()
-                return result
             except Exception:
                 await session.rollback()
                 raise
             finally:
-                await session.close()
+                shared.in_use = False
+            return
+
+        async with AsyncSessionLocal() as session:
+            try:
+                yield session
+                await session.commit()
+            except Exception:
+                await session.rollback()
+                raise
+
+    @staticmethod
+    async def execute_with_session(func, *args, **kwargs):
+        """Execute function with database session."""
+        async with DatabaseManager.session_scope() as session:
+            return await func(session, *args, **kwargs)
@@ -1,3 +1,3 @@
-from .translator import Translator, translator
+from .translator import LazyTranslation, Translator, translator
 
-__all__ = ["Translator", "translator"]
+__all__ = ["LazyTranslation", "Translator", "translator"]
@@ -1,16 +1,40 @@
+import hashlib
+import importlib
 import json
+import sys
+from collections.abc import Iterable, Mapping
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # optional speedup; the stdlib parser is used instead
+    orjson = None
+
 
 class Translator:
     """Translation service for handling internationalization."""
 
     def __init__(self):
         self.translations: dict[str, dict[str, Any]] = {}
+        # Flattened catalogs: (language, "dotted.key") -> template. Read-only,
+        # since the lookup caches assume it only changes via reload()
+        self._flat: Mapping[tuple[str, str], str] = MappingProxyType({})
+        # Templates with no replacement fields; get() returns these as-is
+        self._static_templates: frozenset[str] = frozenset()
         self.default_language = "en"
         self.supported_languages = ["en", "uk"]
+        # Hashed membership for the per-call language checks
+        self._language_set = frozenset(self.supported_languages)
         self._load_translations()
+        self._build_flat_index()
+        # Templates are looked up far more often than catalogs change; cache
+        # the resolved (key, language) pairs until the next reload()
+        self._cached_template = lru_cache(maxsize=1024)(self._resolve_template)
+        # Fully rendered text for parameter-free get() calls
+        self._cached_text = lru_cache(maxsize=4096)(self._resolve_text)
 
     def _load_translations(self):
         """Load all translation files."""
@@ -19,9 +43,15 @@ class Translator:
         for lang in self.supported_languages:
             translation_file = translations_dir / f"{lang}.json"
             if translation_file.exists():
+                catalog = self._load_compiled_catalog(lang, translation_file)
+                if catalog is not None:
+                    self.translations[lang] = catalog
+                    continue
                 try:
-                    with open(translation_file, encoding="utf-8") as f:
-                        self.translations[lang] = json.load(f)
+                    data = translation_file.read_bytes()
+                    self.translations[lang] = (
+                        orjson.loads(data) if orjson is not None else json.loads(data)
+                    )
                 except (json.JSONDecodeError, FileNotFoundError) as e:
                     # Fallback to empty dict if translation file is corrupted
                     self.translations[lang] = {}
@@ -29,6 +59,39 @@ class Translator:
             else:
                 self.translations[lang] = {}
 
+    @staticmethod
+    def _load_compiled_catalog(lang: str, source: Path) -> dict[str, Any] | None:
+        """Return the catalog precompiled by tools/gen_catalogs.py, if current."""
+        try:
+            module = importlib.import_module(f"{__package__}._catalog_{lang}")
+        except ImportError:
+            return None
+        # Hashing the bytes is far cheaper than parsing them; a mismatch
+        # means the JSON was edited after the module was generated
+        if module.SOURCE_SHA256 != hashlib.sha256(source.read_bytes()).hexdigest():
+            return None
+        return module.CATALOG
+
+    def _build_flat_index(self):
+        """Flatten the nested catalogs into one (language, key) lookup table."""
+        flat: dict[tuple[str, str], str] = {}
+        for lang, catalog in self.translations.items():
+            lang = sys.intern(lang)
+            stack = [("", catalog)]
+            while stack:
+                prefix, node = stack.pop()
+                for k, value in node.items():
+                    path = f"{prefix}{k}"
+                    if isinstance(value, dict):
+                        stack.append((f"{path}.", value))
+                    elif isinstance(value, str):
+                        # Interning shares strings repeated across catalogs
+                        flat[(lang, sys.intern(path))] = sys.intern(value)
+        self._flat = MappingProxyType(flat)
+        self._static_templates = frozenset(
+            t for t in flat.values() if "{" not in t and "}" not in t
+        )
+
     def get(self, key: str, language: str | None = None, **kwargs) -> str:
         """
         Get translated text by key.
@@ -41,53 +104,104 @@ class Translator:
         Returns:
             Translated and formatted string
         """
-        if language is None:
-            language = self.default_language
-
-        if language not in self.supported_languages:
-            language = self.default_language
+        if not kwargs:
+            return self._cached_text(key, language)
+        return self._format(self.get_template(key, language), kwargs)
 
-        # Get translation from the language dict
-        translation = self._get_nested_value(self.translations.get(language, {}), key)
+    def _resolve_text(self, key: str, language: str | None) -> str:
+        """Render a parameter-free translation (uncached)."""
+        return self._format(self.get_template(key, language), {})
 
-        # Fallback to default language if translation not found
-        if translation is None and language != self.default_language:
-            translation = self._get_nested_value(
-                self.translations.get(self.default_language, {}), key
-            )
-
-        # Fallback to key if no translation found
-        if translation is None:
-            translation = key
+    def _format(self, translation: str, params: dict[str, Any]) -> str:
+        """Substitute parameters into a template."""
+        if translation in self._static_templates:
+            # Nothing to substitute; skip the format parse entirely
+            return translation
 
-        # Format the translation with provided parameters
+        # Format the translation with provided parameters; format_map reads
+        # the dict directly instead of repacking it as keyword arguments
         try:
-            return translation.format(**kwargs)
+            return translation.format_map(params)
         except (KeyError, ValueError):
             # Return unformatted string if formatting fails
             return translation
 
-    def _get_nested_value(self, data: dict[str, Any], key: str) -> str | None:
+    def get_many(self, keys: Iterable[str], language: str | None = None) -> list[str]:
         """
-        Get value from nested dictionary using dot notation.
+        Get translations for several parameter-free keys in one language.
+
+        Equivalent to ``[get(key, language) for key in keys]`` but resolves
+        the language once and reads the flat index directly.
 
         Args:
-            data: Dictionary to search in
-            key: Key in dot notation (e.g., 'commands.start.welcome')
+            keys: Translation keys in dot notation
+            language: Language code ('en', 'uk'). Uses default if None.
 
         Returns:
-            Value if found, None otherwise
+            Translations in the same order as ``keys``
         """
-        keys = key.split(".")
-        current = data
+        language = self._normalize_language(language)
+        default = self.default_language
+        flat = self._flat
+        static = self._static_templates
 
-        for k in keys:
-            if isinstance(current, dict) and k in current:
-                current = current[k]
-            else:
-                return None
+        result = []
+        for key in keys:
+            translation = flat.get((language, key))
+            if translation is None:
+                translation = flat.get((default, key), key)
+            if translation not in static:
+                # Rare: let get() apply its formatting rules
+                translation = self.get(key, language)
+            result.append(translation)
+        return result
+
+    def get_template(self, key: str, language: str | None = None) -> str:
+        """
+        Get the raw, unformatted translation template for a key.
 
-        return current if isinstance(current, str) else None
+        Useful when the same templates are rendered repeatedly: resolve them
+        once and call ``str.format_map`` with a shared mapping.
+
+        Args:
+            key: Translation key in dot notation (e.g., 'commands.start.welcome')
+            language: Language code ('en', 'uk'). Uses default if None.
+
+        Returns:
+            Translation template, or the key itself if no translation exists
+        """
+        return self._cached_template(key, language)
+
+    def _resolve_template(self, key: str, language: str | None) -> str:
+        """Resolve a template with language and key fallbacks (uncached)."""
+        language = self._normalize_language(language)
+
+        translation = self._flat.get((language, key))
+
+        # Fallback to default language if translation not found
+        if translation is None and language != self.default_language:
+            translation = self._flat.get((self.default_language, key))
+
+        # Fallback to key if no translation found
+        if translation is None:
+            translation = key
+
+        return translation
+
+    def _normalize_language(self, language: str | None) -> str:
+        """Map None and unsupported codes to the default language."""
+        # None is never in the set, so this also covers the default case
+        if language in self._language_set:
+            return language
+        return self.default_language
+
+    def reload(self):
+        """Reload translation files and drop cached lookups."""
+        self.translations = {}
+        self._load_translations()
+        self._build_flat_index()
+        self._cached_template.cache_clear()
+        self._cached_text.cache_clear()
 
     def get_language_name(self, language_code: str) -> str:
         """Get display name for language code."""
@@ -96,7 +210,7 @@ class Translator:
 
     def is_supported_language(self, language_code: str) -> bool:
         """Check if language code is supported."""
-        return language_code in self.supported_languages
+        return language_code in self._language_set
 
     def get_supported_languages(self) -> list:
         """Get list of supported language codes."""
@@ -123,5 +237,25 @@ class Translator:
         return translated if translated != key else unit
 
 
+class LazyTranslation:
+    """Translation resolved on first str() and reused afterwards."""
+
+    __slots__ = ("key", "language", "params", "_value")
+
+    def __init__(self, key: str, language: str | None = None, **params):
+        self.key = key
+        self.language = language
+        self.params = params
+        self._value: str | None = None
+
+    def __str__(self) -> str:
+        if self._value is None:
+            self._value = translator.get(self.key, self.language, **self.params)
+        return self._value
+
+    def __repr__(self) -> str:
+        return f"LazyTranslation({self.key!r}, {self.language!r})"
+
+
 # Global translator instance
 translator = Translator()
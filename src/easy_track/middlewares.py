@@ -0,0 +1,20 @@
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from aiogram import BaseMiddleware
+from aiogram.types import TelegramObject
+
+from .database import DatabaseManager
+
+
+class DbSessionMiddleware(BaseMiddleware):
+    """Share one database session across all queries made for an update."""
+
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: dict[str, Any],
+    ) -> Any:
+        async with DatabaseManager.shared_session():
+            return await handler(event, data)
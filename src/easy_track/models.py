@@ -157,8 +157,12 @@ class UserMeasurementType(Base):
 
     # Relationships
     user: Mapped["User"] = relationship("User", back_populates="user_measurement_types")
+    # Always read through an eager load (see get_user_measurement_types);
+    # raise instead of silently issuing one SELECT per row
     measurement_type: Mapped["MeasurementType"] = relationship(
-        "MeasurementType", back_populates="user_measurement_types"
+        "MeasurementType",
+        back_populates="user_measurement_types",
+        lazy="raise_on_sql",
     )
 
 
@@ -192,8 +196,9 @@ class Measurement(Base):
 
     # Relationships
     user: Mapped["User"] = relationship("User", back_populates="measurements")
+    # Measurement queries selectinload this; fail loudly if one forgets to
     measurement_type: Mapped["MeasurementType"] = relationship(
-        "MeasurementType", back_populates="measurements"
+        "MeasurementType", back_populates="measurements", lazy="raise_on_sql"
     )
 
 
@@ -12,6 +12,26 @@ from .repositories import NotificationScheduleRepository
 
 logger = logging.getLogger(__name__)
 
+# Stay below Telegram's ~30 messages/second global bot limit
+MAX_MESSAGES_PER_SECOND = 25
+
+
+class RateLimiter:
+    """Space out calls so at most `rate` of them start per second."""
+
+    def __init__(self, rate: float):
+        self.interval = 1 / rate
+        self._next_slot = 0.0
+
+    async def acquire(self):
+        """Wait for the next free send slot."""
+        now = asyncio.get_running_loop().time()
+        # Claim the slot before sleeping so concurrent callers queue up
+        slot = max(now, self._next_slot)
+        self._next_slot = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
 
 class NotificationScheduler:
     """Handles periodic notification scheduling and sending."""
@@ -20,6 +40,7 @@ class NotificationScheduler:
         self.bot = bot
         self.is_running = False
         self._task: asyncio.Task | None = None
+        self._limiter = RateLimiter(MAX_MESSAGES_PER_SECOND)
 
     async def start(self):
         """Start the notification scheduler."""
@@ -109,20 +130,15 @@ class NotificationScheduler:
                         _get_schedules_for_tz
                     )
 
-                    for schedule in schedules:
-                        try:
-                            await self._send_notification(
-                                schedule.user.telegram_id, schedule.user.language
-                            )
-                            logger.info(
-                                f"Sent notification to user {schedule.user.telegram_id} "
-                                f"at {local_time.strftime('%H:%M')} ({tz_name})"
-                            )
-                        except Exception as e:
-                            logger.error(
-                                f"Failed to send notification to user "
-                                f"{schedule.user.telegram_id}: {e}"
+                    # Sends run concurrently, paced by the rate limiter
+                    await asyncio.gather(
+                        *(
+                            self._send_scheduled_notification(
+                                schedule, local_time, tz_name
                             )
+                            for schedule in schedules
+                        )
+                    )
 
                 except Exception as e:
                     logger.error(f"Error checking timezone {tz_name}: {e}")
@@ -130,6 +146,24 @@ class NotificationScheduler:
         except Exception as e:
             logger.error(f"Error sending scheduled notifications: {e}")
 
+    async def _send_scheduled_notification(
+        self, schedule, local_time: datetime, tz_name: str
+    ):
+        """Send one scheduled reminder, logging instead of raising."""
+        try:
+            await self._send_notification(
+                schedule.user.telegram_id, schedule.user.language
+            )
+            logger.info(
+                f"Sent notification to user {schedule.user.telegram_id} "
+                f"at {local_time.strftime('%H:%M')} ({tz_name})"
+            )
+        except Exception as e:
+            logger.error(
+                f"Failed to send notification to user "
+                f"{schedule.user.telegram_id}: {e}"
+            )
+
     async def _send_coach_notifications(self):
         """Send pending coach notifications."""
         try:
@@ -140,29 +174,28 @@ class NotificationScheduler:
                     await CoachNotificationRepository.get_pending_notifications(session)
                 )
 
+                # Send concurrently (paced by the rate limiter); the session
+                # is not shared between tasks, so marking stays sequential
+                delivered = await asyncio.gather(
+                    *(
+                        self._send_coach_notification(notification)
+                        for notification in notifications
+                    )
+                )
+
                 sent_count = 0
-                for notification in notifications:
+                for notification, sent in zip(notifications, delivered, strict=True):
+                    if not sent:
+                        continue
                     try:
-                        # Send notification to coach
-                        await self.bot.send_message(
-                            chat_id=notification.coach.telegram_id,
-                            text=notification.message,
-                            parse_mode="Markdown",
-                        )
-
-                        # Mark as sent
                         await CoachNotificationRepository.mark_notification_sent(
                             session, notification.id
                         )
                         sent_count += 1
-
-                        logger.debug(
-                            f"Sent coach notification {notification.id} to coach {notification.coach_id}"
-                        )
-
                     except Exception as e:
                         logger.error(
-                            f"Failed to send coach notification {notification.id}: {e}"
+                            f"Failed to mark coach notification {notification.id} "
+                            f"as sent: {e}"
                         )
 
                 return sent_count
@@ -177,10 +210,29 @@ class NotificationScheduler:
         except Exception as e:
             logger.error(f"Error sending coach notifications: {e}")
 
+    async def _send_coach_notification(self, notification) -> bool:
+        """Send one coach notification; return whether it was delivered."""
+        try:
+            await self._limiter.acquire()
+            await self.bot.send_message(
+                chat_id=notification.coach.telegram_id,
+                text=notification.message,
+                parse_mode="Markdown",
+            )
+            logger.debug(
+                f"Sent coach notification {notification.id} to coach {notification.coach_id}"
+            )
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to send coach notification {notification.id}: {e}")
+            return False
+
     async def _send_notification(self, telegram_id: int, language: str):
         """Send a notification message to a user."""
         try:
             message = translator.get("notifications.reminder_message", language)
+            await self._limiter.acquire()
             await self.bot.send_message(chat_id=telegram_id, text=message)
         except Exception as e:
             logger.error(f"Failed to send notification to {telegram_id}: {e}")
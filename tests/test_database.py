@@ -0,0 +1,102 @@
+"""
+Tests for database session scoping.
+"""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from easy_track.database import DatabaseManager, detached_context
+
+
+class _FakeSession:
+    """Stand-in AsyncSession that counts commits and closes."""
+
+    def __init__(self):
+        self.commits = 0
+        self.closes = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def commit(self):
+        self.commits += 1
+
+    async def rollback(self):
+        pass
+
+    async def close(self):
+        self.closes += 1
+
+
+@pytest.fixture
+def session_factory():
+    """Patch the session factory to hand out fake sessions."""
+    with patch(
+        "easy_track.database.AsyncSessionLocal", MagicMock(side_effect=_FakeSession)
+    ) as factory:
+        yield factory
+
+
+async def _current_session():
+    async with DatabaseManager.session_scope() as session:
+        return session
+
+
+class TestSharedSession:
+    """Test reuse of one session within an update."""
+
+    @pytest.mark.asyncio
+    async def test_sequential_scopes_reuse_session(self, session_factory):
+        """Test that scopes inside shared_session share one session."""
+        async with DatabaseManager.shared_session():
+            first = await _current_session()
+            second = await _current_session()
+
+        assert first is second
+        assert first.commits == 2
+        assert first.closes == 1
+
+    @pytest.mark.asyncio
+    async def test_nested_scope_gets_own_session(self, session_factory):
+        """Test that a scope opened while the shared one is busy is separate."""
+        async with DatabaseManager.shared_session():
+            async with DatabaseManager.session_scope() as outer:
+                inner = await _current_session()
+
+        assert inner is not outer
+
+    @pytest.mark.asyncio
+    async def test_concurrent_scopes_get_separate_sessions(self, session_factory):
+        """Test that gathered scopes never run on the same session at once."""
+
+        async def _hold_session():
+            async with DatabaseManager.session_scope() as session:
+                await asyncio.sleep(0)
+                return session
+
+        async with DatabaseManager.shared_session():
+            sessions = await asyncio.gather(*(_hold_session() for _ in range(3)))
+
+        assert len({id(session) for session in sessions}) == 3
+
+    @pytest.mark.asyncio
+    async def test_detached_task_gets_own_session(self, session_factory):
+        """Test that tasks in a detached context do not use the shared session."""
+        async with DatabaseManager.shared_session():
+            shared = await _current_session()
+            detached = await asyncio.create_task(
+                _current_session(), context=detached_context()
+            )
+
+        assert detached is not shared
+
+    @pytest.mark.asyncio
+    async def test_no_shared_session_outside_block(self, session_factory):
+        """Test that scopes outside shared_session each get a new session."""
+        assert await _current_session() is not await _current_session()
+        assert session_factory.call_count == 2
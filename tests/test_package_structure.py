@@ -151,8 +151,10 @@ class TestPackageStructure:
 
         assert hasattr(DatabaseManager, "get_session")
         assert hasattr(DatabaseManager, "execute_with_session")
+        assert hasattr(DatabaseManager, "session_scope")
         assert callable(DatabaseManager.get_session)
         assert callable(DatabaseManager.execute_with_session)
+        assert callable(DatabaseManager.session_scope)
 
     def test_package_metadata(self):
         """Test package metadata is correctly set."""
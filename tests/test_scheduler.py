@@ -0,0 +1,65 @@
+"""
+Tests for the notification scheduler's send pacing.
+"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from easy_track.scheduler import NotificationScheduler, RateLimiter
+
+
+class TestRateLimiter:
+    """Test that sends are spaced out at the configured rate."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_are_spaced(self):
+        """Test that concurrent acquires start one interval apart."""
+        limiter = RateLimiter(50)
+        loop = asyncio.get_running_loop()
+        started = []
+
+        async def _acquire():
+            await limiter.acquire()
+            started.append(loop.time())
+
+        await asyncio.gather(*(_acquire() for _ in range(5)))
+
+        assert started[-1] - started[0] >= 4 * limiter.interval * 0.9
+
+
+class TestNotificationScheduler:
+    """Test delivery of coach notifications."""
+
+    @pytest.mark.asyncio
+    async def test_only_delivered_coach_notifications_are_marked(self):
+        """Test that failed sends are not marked as sent."""
+        bot = AsyncMock()
+        bot.send_message.side_effect = [None, RuntimeError("blocked"), None]
+        scheduler = NotificationScheduler(bot)
+        notifications = [
+            SimpleNamespace(
+                id=i, coach_id=i, coach=SimpleNamespace(telegram_id=i), message="hi"
+            )
+            for i in range(3)
+        ]
+
+        async def _execute(func):
+            return await func(session=None)
+
+        with (
+            patch("easy_track.scheduler.CoachNotificationRepository") as repository,
+            patch(
+                "easy_track.scheduler.DatabaseManager.execute_with_session",
+                side_effect=_execute,
+            ),
+        ):
+            repository.get_pending_notifications = AsyncMock(return_value=notifications)
+            repository.mark_notification_sent = AsyncMock()
+
+            await scheduler._send_coach_notifications()
+
+        marked = repository.mark_notification_sent.call_args_list
+        assert [call.args[1] for call in marked] == [0, 2]
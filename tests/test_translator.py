@@ -0,0 +1,131 @@
+"""
+Tests for the translation service.
+"""
+
+import hashlib
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from easy_track.i18n.translator import LazyTranslation, Translator
+
+EN_JSON = Path(__file__).parent.parent / "src/easy_track/i18n/translations/en.json"
+
+
+@pytest.fixture
+def translator():
+    """Fresh translator instance so cache state does not leak between tests."""
+    return Translator()
+
+
+class TestTranslator:
+    """Test translation lookups, fallbacks and caching."""
+
+    def test_get_formats_parameters(self, translator):
+        """Test that parameters are substituted into the template."""
+        text = translator.get("view_progress.total_count", "en", count=15)
+
+        assert "15" in text
+        assert "{count}" not in text
+
+    def test_get_template_is_unformatted(self, translator):
+        """Test that get_template returns the raw template."""
+        template = translator.get_template("view_progress.total_count", "en")
+
+        assert "{count}" in template
+        assert template.format(count=3) == translator.get(
+            "view_progress.total_count", "en", count=3
+        )
+
+    def test_unknown_language_falls_back_to_default(self, translator):
+        """Test that unsupported languages use the default language."""
+        assert translator.get("common.error", "xx") == translator.get(
+            "common.error", "en"
+        )
+
+    def test_missing_key_returns_key(self, translator):
+        """Test that a missing key is returned unchanged."""
+        assert translator.get("does.not.exist", "uk") == "does.not.exist"
+
+    def test_missing_parameters_return_template(self, translator):
+        """Test that formatting errors fall back to the raw template."""
+        template = translator.get_template("view_progress.total_count", "uk")
+
+        assert translator.get("view_progress.total_count", "uk") == template
+
+    def test_static_template_ignores_parameters(self, translator):
+        """Test that templates without placeholders come back unchanged."""
+        template = translator.get_template("common.error", "en")
+
+        assert "{" not in template
+        assert translator.get("common.error", "en", count=1) is template
+
+    def test_parameter_free_lookups_are_memoized(self, translator):
+        """Test that repeated static lookups are served from the cache."""
+        first = translator.get("buttons.back_to_menu", "uk")
+        hits = translator._cached_text.cache_info().hits
+
+        assert translator.get("buttons.back_to_menu", "uk") is first
+        assert translator._cached_text.cache_info().hits == hits + 1
+
+    def test_get_many_matches_get(self, translator):
+        """Test that get_many resolves keys like repeated get() calls."""
+        keys = ["common.error", "view_progress.total_count", "does.not.exist"]
+
+        for language in ("en", "uk", "xx", None):
+            assert translator.get_many(keys, language) == [
+                translator.get(key, language) for key in keys
+            ]
+
+    def test_lazy_translation_resolves_on_str(self, translator):
+        """Test that LazyTranslation renders like get() once coerced."""
+        lazy = LazyTranslation("view_progress.total_count", "uk", count=4)
+
+        assert lazy._value is None
+        assert str(lazy) == translator.get("view_progress.total_count", "uk", count=4)
+        assert str(lazy) is str(lazy)
+
+    def test_flat_index_matches_nested_catalogs(self, translator):
+        """Test that dotted keys resolve from the index built at load time."""
+        nested = translator.translations["en"]["common"]["error"]
+
+        assert translator._flat[("en", "common.error")] == nested
+        assert translator.get_template("common.error", "en") == nested
+
+    def test_reload_picks_up_new_catalogs(self, translator, monkeypatch):
+        """Test that reload() drops lookups cached before the reload."""
+        assert translator.get("common.error", "en") != "reloaded"
+
+        def load_translations():
+            translator.translations["en"] = {"common": {"error": "reloaded"}}
+            translator.translations["uk"] = {}
+
+        monkeypatch.setattr(translator, "_load_translations", load_translations)
+        translator.reload()
+
+        assert translator.get("common.error", "en") == "reloaded"
+
+    def test_compiled_catalog_is_used_when_current(self, monkeypatch):
+        """Test that a generated catalog module matching its JSON is used."""
+        digest = hashlib.sha256(EN_JSON.read_bytes()).hexdigest()
+        catalog = {"common": {"error": "compiled"}}
+        monkeypatch.setitem(
+            sys.modules,
+            "easy_track.i18n._catalog_en",
+            SimpleNamespace(SOURCE_SHA256=digest, CATALOG=catalog),
+        )
+
+        assert Translator().get("common.error", "en") == "compiled"
+
+    def test_stale_compiled_catalog_is_ignored(self, monkeypatch):
+        """Test that a generated catalog out of date with its JSON is skipped."""
+        catalog = {"common": {"error": "compiled"}}
+        monkeypatch.setitem(
+            sys.modules,
+            "easy_track.i18n._catalog_en",
+            SimpleNamespace(SOURCE_SHA256="stale", CATALOG=catalog),
+        )
+
+        assert Translator().get("common.error", "en") != "compiled"
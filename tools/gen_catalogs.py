@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Precompile translation catalogs into Python modules.
+
+Writes src/easy_track/i18n/_catalog_<lang>.py for every translations/*.json
+file. The translator imports these instead of parsing JSON when they are
+present and match their source; otherwise it falls back to the JSON.
+
+Usage: python tools/gen_catalogs.py  (or `make catalogs`)
+"""
+
+import hashlib
+import json
+import pprint
+from pathlib import Path
+
+I18N_DIR = Path(__file__).resolve().parent.parent / "src" / "easy_track" / "i18n"
+TEMPLATE = '''"""Generated by tools/gen_catalogs.py from {source}; do not edit."""
+
+SOURCE_SHA256 = {digest!r}
+
+CATALOG = {catalog}
+'''
+
+
+def main():
+    """Generate one catalog module per JSON translation file."""
+    for source in sorted((I18N_DIR / "translations").glob("*.json")):
+        data = source.read_bytes()
+        catalog = json.loads(data)
+        target = I18N_DIR / f"_catalog_{source.stem}.py"
+        target.write_text(
+            TEMPLATE.format(
+                source=source.name,
+                digest=hashlib.sha256(data).hexdigest(),
+                catalog=pprint.pformat(catalog, width=88, sort_dicts=False),
+            ),
+            encoding="utf-8",
+        )
+        print(f"✅ {source.name} -> {target.name}")
+
+
+if __name__ == "__main__":
+    main()